@@ -585,6 +585,22 @@ local function handle_command(cmd_obj)
         end
         return {ok = true, data = table.concat(hex)}
 
+    elseif action == "readmulti" then
+        -- Several readrange requests in one round trip: ranges = [[addr, length], ...]
+        local ranges = cmd_obj.ranges
+        if not ranges then return {error = "missing 'ranges'"} end
+        local results = {}
+        for r = 1, #ranges do
+            local addr, length = ranges[r][1], ranges[r][2]
+            if length > 256 then return {error = "length exceeds 256 byte limit"} end
+            local hex = {}
+            for i = 0, length - 1 do
+                hex[#hex + 1] = string.format("%02x", emu:read8(addr + i))
+            end
+            results[r] = table.concat(hex)
+        end
+        return {ok = true, data = results}
+
     else
         return {error = "unknown action: " .. tostring(action)}
     end
@@ -432,6 +432,12 @@ class BattleAI:
         best_score = 0.0
         best_idx = 0
         
+        # Multipliers of every attacking type against the enemy, looked up once
+        enemy_row = (
+            TypeEffectiveness.multipliers_against(enemy.type1, enemy.type2)
+            if enemy.type1 else None
+        )
+        
         for i, mon in enumerate(ctx.party.pokemon):
             if mon.is_fainted or mon == player:
                 continue
@@ -444,10 +450,7 @@ class BattleAI:
                 # Check if we have super effective STAB
                 for move in mon.moves:
                     if move.type and move.power > 0:
-                        mult = TypeEffectiveness.get_multiplier(
-                            move.type, enemy.type1, enemy.type2
-                        )
-                        if mult > 1.0:
+                        if enemy_row[move.type] > 1.0:
                             score += 30
                             # STAB bonus
                             if move.type == mon.type1 or move.type == mon.type2:
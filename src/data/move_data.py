@@ -10,6 +10,9 @@ Gen 3 physical/special split is TYPE-BASED:
   Special types:  Fire, Water, Grass, Electric, Psychic, Ice, Dragon, Dark
 """
 
+import functools
+from types import MappingProxyType
+
 from ..games.pokemon_gen3.data_types import PokemonType, Move
 
 # (name, type, power, accuracy, pp, priority, flags)
@@ -405,3 +408,32 @@ def enrich_move(move: Move) -> Move:
         move.name = f"Move#{move.id}"
     
     return move
+
+
+@functools.lru_cache(maxsize=512)
+def _move_fields(move_id: int) -> MappingProxyType:
+    """Static Move fields for a move ID, as enrich_move would fill them in."""
+    if move_id in _MOVE_TABLE:
+        name, type_, power, accuracy, max_pp, priority, flags = _MOVE_TABLE[move_id]
+        return MappingProxyType({
+            "name": name,
+            "type": type_,
+            "power": power,
+            "accuracy": accuracy,
+            "max_pp": max_pp,
+            "priority": priority,
+            "is_contact": "C" in flags,
+            "is_recoil": "R" in flags,
+            "is_high_crit": "H" in flags,
+        })
+    return MappingProxyType({"name": f"Move#{move_id}"})
+
+
+def make_move(move_id: int, pp: int) -> Move:
+    """
+    Build a fully enriched Move from a move ID and the PP read from memory.
+
+    Equivalent to enrich_move(Move(id=move_id, pp=pp)), but the static
+    fields are looked up once per move ID and reused.
+    """
+    return Move(id=move_id, pp=pp, **_move_fields(move_id))
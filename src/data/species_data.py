@@ -6,6 +6,8 @@ Covers all 386 Pokemon available in Gen 3.
 Used for identifying enemy Pokemon and calculating expected stats.
 """
 
+import functools
+
 from ..games.pokemon_gen3.data_types import PokemonType
 
 # (name, type1, type2_or_None, hp, atk, def, spa, spd, spe)
@@ -186,6 +188,7 @@ _SPECIES: dict[int, tuple] = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_species_name(species_id: int) -> str:
     """Get species name from ID."""
     if species_id in _SPECIES:
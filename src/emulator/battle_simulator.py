@@ -59,7 +59,7 @@ class BattleSimulator:
         Returns:
             "win", "lose", or "flee"
         """
-        self._log(f"=== Battle Start: {self.scenario['description']} ===")
+        self._log(f"=== Battle Start: {self.scenario.description} ===")
         
         # Initial state read
         self.detector.refresh_pointers()
@@ -200,6 +200,10 @@ class BizHawkClient:
                 logger.error(f"Invalid hex data in response: {hex_data}")
         return bytes(length)
 
+    def read_multi(self, ranges: list[tuple[int, int]]) -> list[bytes]:
+        """Read several (address, length) ranges; one READRANGE per range."""
+        return [self.read_range(addr, length) for addr, length in ranges]
+
     def write8(self, address: int, value: int) -> bool:
         """Write a single byte to memory."""
         response = self._send_command(f"WRITE8 {address} {value}")
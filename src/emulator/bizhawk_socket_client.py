@@ -253,6 +253,9 @@ class BizHawkSocketClient:
                 logger.error(f"Invalid hex data: {hex_data[:40]}...")
         return bytes(length)
 
+    def read_multi(self, ranges: list[tuple[int, int]]) -> list[bytes]:
+        return [self.read_range(addr, length) for addr, length in ranges]
+
     def write8(self, address: int, value: int) -> bool:
         """Write a single byte to memory."""
         response = self._send_command(f"WRITE8 {address} {value}")
@@ -30,6 +30,9 @@ class mGBAClient:
 
     VALID_BUTTONS = {"A", "B", "Start", "Select", "Up", "Down", "Left", "Right", "L", "R"}
 
+    # Largest length the Lua bridge accepts for a single readrange
+    READRANGE_LIMIT = 256
+
     def __init__(
         self,
         host: str = "192.168.1.40",
@@ -41,6 +44,8 @@ class mGBAClient:
         self.timeout = timeout
         self._sock: Optional[socket.socket] = None
         self._recv_buffer = ""
+        # Cleared the first time the bridge rejects readmulti (older scripts)
+        self._readmulti_supported = True
 
     # -------------------------------------------------------------------------
     # Connection
@@ -220,8 +225,13 @@ class mGBAClient:
         """Read a range of bytes from GBA memory.
 
         Uses the Lua bridge's readrange action for efficiency (single round trip).
-        Falls back to individual read32 calls if not supported.
+        Ranges over the bridge's 256-byte limit are split into chunks fetched
+        together with read_multi. Falls back to individual read32 calls if not
+        supported.
         """
+        if length > self.READRANGE_LIMIT:
+            return self.read_multi([(address, length)])[0]
+
         resp = self._send({"action": "readrange", "addr": address, "length": length})
         if resp and "data" in resp:
             try:
@@ -238,6 +248,46 @@ class mGBAClient:
             result[offset:offset + remaining] = chunk[:remaining]
         return bytes(result)
 
+    def read_multi(self, ranges: list[tuple[int, int]]) -> list[bytes]:
+        """Read several (address, length) ranges in a single round trip.
+
+        Uses the Lua bridge's readmulti action. Ranges over the bridge's
+        256-byte limit are split into chunks sent in the same request and
+        joined back together. Falls back to one readrange per chunk if the
+        bridge doesn't support readmulti.
+        """
+        chunks = []
+        spans = []
+        for addr, length in ranges:
+            start = len(chunks)
+            chunks.extend(self._split_range(addr, length))
+            spans.append((start, len(chunks)))
+
+        if self._readmulti_supported:
+            resp = self._send({"action": "readmulti",
+                               "ranges": [[addr, length] for addr, length in chunks]})
+            if resp and isinstance(resp.get("data"), list) and len(resp["data"]) == len(chunks):
+                try:
+                    parts = [bytes.fromhex(chunk) for chunk in resp["data"]]
+                    return [b"".join(parts[start:end]) for start, end in spans]
+                except ValueError:
+                    pass
+            elif resp and "error" in resp:
+                logger.info(f"readmulti unavailable ({resp['error']}), using readrange")
+                self._readmulti_supported = False
+
+        parts = [self.read_range(addr, length) for addr, length in chunks]
+        return [b"".join(parts[start:end]) for start, end in spans]
+
+    def _split_range(self, address: int, length: int) -> list[tuple[int, int]]:
+        """Split a range into pieces no longer than READRANGE_LIMIT."""
+        if length <= self.READRANGE_LIMIT:
+            return [(address, length)]
+        return [
+            (address + offset, min(self.READRANGE_LIMIT, length - offset))
+            for offset in range(0, length, self.READRANGE_LIMIT)
+        ]
+
     # -------------------------------------------------------------------------
     # Screenshots
     # -------------------------------------------------------------------------
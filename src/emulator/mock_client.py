@@ -8,11 +8,14 @@ and responding to memory reads with realistic values. Useful for:
 - Benchmarking AI performance against known scenarios
 """
 
+import functools
 import logging
-import struct
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass
 from typing import Optional
 
-from ..games.pokemon_gen3.memory_map import PokemonGen3Memory as Mem
+from ..games.pokemon_gen3.memory_map import PokemonGen3Memory as Mem, BATTLE_MON_STRUCT
 from ..games.pokemon_gen3.data_types import PokemonType, Weather
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,13 @@ logger = logging.getLogger(__name__)
 
 class MockBattlePokemon:
     """A simulated Pokemon for mock battles."""
+
+    __slots__ = (
+        "species_id", "level", "hp", "max_hp",
+        "attack", "defense", "speed", "sp_attack", "sp_defense",
+        "type1", "type2", "ability", "moves", "status",
+    )
+
     def __init__(self, species_id: int, level: int, hp: int, max_hp: int,
                  attack: int, defense: int, speed: int, sp_attack: int, sp_defense: int,
                  type1: int, type2: int, ability: int,
@@ -42,58 +52,55 @@ class MockBattlePokemon:
 
     def to_battle_struct(self) -> bytes:
         """Serialize to 88-byte battle mon struct matching memory layout."""
-        data = bytearray(88)
-        # species @ 0x00
-        struct.pack_into('<H', data, 0x00, self.species_id)
-        # stats @ 0x02-0x0B
-        struct.pack_into('<H', data, 0x02, self.attack)
-        struct.pack_into('<H', data, 0x04, self.defense)
-        struct.pack_into('<H', data, 0x06, self.speed)
-        struct.pack_into('<H', data, 0x08, self.sp_attack)
-        struct.pack_into('<H', data, 0x0A, self.sp_defense)
-        # moves @ 0x0C (4 x 2 bytes)
-        for i, (move_id, _pp) in enumerate(self.moves[:4]):
-            struct.pack_into('<H', data, 0x0C + i * 2, move_id)
-        # ability @ 0x20, types @ 0x21-0x22
-        data[0x20] = self.ability
-        data[0x21] = self.type1
-        data[0x22] = self.type2
-        # PP @ 0x24 (4 x 1 byte)
-        for i, (_mid, pp) in enumerate(self.moves[:4]):
-            data[0x24 + i] = pp
-        # HP @ 0x28, level @ 0x2A, max_hp @ 0x2C
-        struct.pack_into('<H', data, 0x28, self.hp)
-        data[0x2A] = self.level
-        struct.pack_into('<H', data, 0x2C, self.max_hp)
-        # status @ 0x4C
-        struct.pack_into('<I', data, 0x4C, self.status)
-        return bytes(data)
+        move_ids = [move_id for move_id, _pp in self.moves[:4]]
+        pps = [pp for _mid, pp in self.moves[:4]]
+        move_ids += [0] * (4 - len(move_ids))
+        pps += [0] * (4 - len(pps))
+        return BATTLE_MON_STRUCT.pack(
+            self.species_id,
+            self.attack, self.defense, self.speed, self.sp_attack, self.sp_defense,
+            *move_ids,
+            self.ability, self.type1, self.type2,
+            *pps,
+            self.hp, self.level, self.max_hp,
+            self.status,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """A preset battle: both battlers plus the battle-wide memory values."""
+    description: str
+    player: MockBattlePokemon
+    enemy: MockBattlePokemon
+    battle_flags: int
+    weather: int
 
 
 # Preset battle scenarios for testing
-SCENARIOS = {
-    "mudkip_vs_poochyena": {
-        "description": "Early game: Lv5 Mudkip vs Lv2 wild Poochyena",
-        "player": MockBattlePokemon(
+SCENARIOS: dict[str, Scenario] = {
+    "mudkip_vs_poochyena": Scenario(
+        description="Early game: Lv5 Mudkip vs Lv2 wild Poochyena",
+        player=MockBattlePokemon(
             species_id=258, level=5, hp=20, max_hp=20,
             attack=12, defense=11, speed=9, sp_attack=11, sp_defense=11,
             type1=11, type2=11,  # Water
             ability=67,  # Torrent
             moves=[(33, 35), (45, 40)],  # Tackle, Growl
         ),
-        "enemy": MockBattlePokemon(
+        enemy=MockBattlePokemon(
             species_id=261, level=2, hp=11, max_hp=11,
             attack=7, defense=6, speed=6, sp_attack=5, sp_defense=5,
             type1=17, type2=17,  # Dark
             ability=50,  # Run Away
             moves=[(33, 35)],  # Tackle
         ),
-        "battle_flags": 0x0004,  # Wild
-        "weather": 0,
-    },
-    "blaziken_vs_flygon": {
-        "description": "Mid-game: Lv36 Blaziken vs Lv35 Flygon",
-        "player": MockBattlePokemon(
+        battle_flags=0x0004,  # Wild
+        weather=0,
+    ),
+    "blaziken_vs_flygon": Scenario(
+        description="Mid-game: Lv36 Blaziken vs Lv35 Flygon",
+        player=MockBattlePokemon(
             species_id=257, level=36, hp=110, max_hp=110,
             attack=95, defense=60, speed=65, sp_attack=88, sp_defense=58,
             type1=10, type2=1,  # Fire/Fighting
@@ -101,7 +108,7 @@ SCENARIOS = {
             moves=[(299, 10), (280, 15), (38, 15), (53, 15)],
             # Blaze Kick, Brick Break, Double-Edge, Flamethrower
         ),
-        "enemy": MockBattlePokemon(
+        enemy=MockBattlePokemon(
             species_id=330, level=35, hp=95, max_hp=95,
             attack=78, defense=62, speed=78, sp_attack=62, sp_defense=62,
             type1=4, type2=16,  # Ground/Dragon
@@ -109,12 +116,12 @@ SCENARIOS = {
             moves=[(89, 10), (225, 20), (28, 15), (200, 15)],
             # Earthquake, DragonBreath, Sand Attack, Outrage
         ),
-        "battle_flags": 0x0008,  # Trainer
-        "weather": 0,
-    },
-    "swampert_vs_wailord_rain": {
-        "description": "Late game: Lv45 Swampert vs Lv42 Wailord in Rain",
-        "player": MockBattlePokemon(
+        battle_flags=0x0008,  # Trainer
+        weather=0,
+    ),
+    "swampert_vs_wailord_rain": Scenario(
+        description="Late game: Lv45 Swampert vs Lv42 Wailord in Rain",
+        player=MockBattlePokemon(
             species_id=260, level=45, hp=155, max_hp=155,
             attack=105, defense=85, speed=55, sp_attack=78, sp_defense=82,
             type1=11, type2=4,  # Water/Ground
@@ -122,7 +129,7 @@ SCENARIOS = {
             moves=[(57, 15), (89, 10), (58, 10), (280, 15)],
             # Surf, Earthquake, Ice Beam, Brick Break
         ),
-        "enemy": MockBattlePokemon(
+        enemy=MockBattlePokemon(
             species_id=321, level=42, hp=210, max_hp=210,
             attack=75, defense=38, speed=50, sp_attack=75, sp_defense=38,
             type1=11, type2=11,  # Water
@@ -130,11 +137,27 @@ SCENARIOS = {
             moves=[(57, 15), (56, 5), (34, 15), (156, 10)],
             # Surf, Hydro Pump, Body Slam, Rest
         ),
-        "battle_flags": 0x0004,  # Wild
-        "weather": 0x03,  # Rain
-    },
+        battle_flags=0x0004,  # Wild
+        weather=0x03,  # Rain
+    ),
 }
 
+# memoryview casts use native byte order; only take the aligned fast path
+# when that matches the GBA's little-endian layout.
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+# Battler slots 2-3 are unused in singles and stay zeroed
+_EMPTY_BATTLE_SLOTS = bytes(88 * 2)
+
+
+@functools.cache
+def _build_scenario_bytes(name: str) -> bytes:
+    """Full 4-slot battle mon image for a scenario, packed once per process."""
+    scenario = SCENARIOS[name]
+    return (scenario.player.to_battle_struct()
+            + scenario.enemy.to_battle_struct()
+            + _EMPTY_BATTLE_SLOTS)
+
 
 class MockBizHawkClient:
     """
@@ -144,28 +167,60 @@ class MockBizHawkClient:
     without needing BizHawk running.
     """
 
+    _SB1_ZEROS = bytes(0x2000)
+    _SB2_ZEROS = bytes(0x1000)
+
     def __init__(self, scenario_name: str = "mudkip_vs_poochyena"):
         self.scenario = SCENARIOS[scenario_name]
         self._connected = False
         
         # Build memory simulation
-        self._battle_mon_data = bytearray(88 * 4)  # 4 battler slots
-        player_data = self.scenario["player"].to_battle_struct()
-        enemy_data = self.scenario["enemy"].to_battle_struct()
-        self._battle_mon_data[0:88] = player_data
-        self._battle_mon_data[88:176] = enemy_data
+        self._battle_mon_data = bytearray(_build_scenario_bytes(scenario_name))  # 4 battler slots
         
+        self._battle_mons_addr = Mem.BATTLE_MONS
+        # Typed views for aligned halfword/word reads (BATTLE_MONS is 4-aligned)
+        self._battle_mons_u16 = memoryview(self._battle_mon_data).cast('H')
+        self._battle_mons_u32 = memoryview(self._battle_mon_data).cast('I')
+
         # Save block pointers (fake valid EWRAM addresses)
         self._sb1_ptr = 0x02025A00
         self._sb2_ptr = 0x02024000
         
-        # Minimal save block data
-        self._save_block_1 = bytearray(0x2000)
-        self._save_block_2 = bytearray(0x1000)
+        # Minimal save block data. Nothing writes to the save blocks, so every
+        # client shares the same read-only zero buffers.
+        self._save_block_1 = self._SB1_ZEROS
+        self._save_block_2 = self._SB2_ZEROS
+
+        # Addresses with fixed values, answered before any region lookup
+        self._special = {
+            # Save block pointers
+            Mem.SAVE_BLOCK_1_PTR: self._sb1_ptr,
+            Mem.SAVE_BLOCK_2_PTR: self._sb2_ptr,
+            # Battle type flags and weather
+            Mem.BATTLE_TYPE_FLAGS: self.scenario.battle_flags,
+            Mem.BATTLE_WEATHER: self.scenario.weather,
+            # Callbacks (non-zero = not in transition)
+            Mem.CALLBACK1: 0x08001234,
+            Mem.CALLBACK2: 0x08005678,
+            # Text printers (not in dialogue)
+            Mem.TEXT_PRINTERS: 0,
+            Mem.TEXT_PRINTERS + 0x24: 0,
+        }
+
+        # Readable regions sorted by base address for bisect lookup.
+        # Save block 2 sits under the battle mons here, so lookups walk back
+        # from the nearest base until a region actually contains the address.
+        self._regions = sorted([
+            (self._battle_mons_addr, self._battle_mons_addr + len(self._battle_mon_data),
+             self._battle_mon_data),
+            (self._sb1_ptr, self._sb1_ptr + len(self._save_block_1), self._save_block_1),
+            (self._sb2_ptr, self._sb2_ptr + len(self._save_block_2), self._save_block_2),
+        ], key=lambda region: region[0])
+        self._region_bases = [region[0] for region in self._regions]
 
     def connect(self) -> bool:
         self._connected = True
-        logger.info(f"MockClient: Connected ({self.scenario['description']})")
+        logger.info(f"MockClient: Connected ({self.scenario.description})")
         return True
 
     def is_connected(self) -> bool:
@@ -174,85 +229,80 @@ class MockBizHawkClient:
     def close(self):
         self._connected = False
 
+    # read8/16/32 are specialized copies of the same lookup with the width
+    # baked in: fixed addresses, then battle mons, then save block 1.
+
     def read8(self, address: int) -> int:
-        return self._read(address, 1)
+        value = self._special.get(address)
+        if value is not None:
+            return value
+        offset = address - self._battle_mons_addr
+        if 0 <= offset < len(self._battle_mon_data):
+            return self._battle_mon_data[offset]
+        offset = address - self._sb1_ptr
+        if 0 <= offset < len(self._save_block_1):
+            return self._save_block_1[offset]
+        return 0
 
     def read16(self, address: int) -> int:
-        return self._read(address, 2)
+        value = self._special.get(address)
+        if value is not None:
+            return value
+        offset = address - self._battle_mons_addr
+        if 0 <= offset < len(self._battle_mon_data):
+            if _NATIVE_LITTLE_ENDIAN and not offset & 1:
+                return self._battle_mons_u16[offset >> 1]
+            return int.from_bytes(self._battle_mon_data[offset:offset + 2], 'little')
+        offset = address - self._sb1_ptr
+        if 0 <= offset < len(self._save_block_1):
+            return int.from_bytes(self._save_block_1[offset:offset + 2], 'little')
+        return 0
 
     def read32(self, address: int) -> int:
-        return self._read(address, 4)
+        value = self._special.get(address)
+        if value is not None:
+            return value
+        offset = address - self._battle_mons_addr
+        if 0 <= offset < len(self._battle_mon_data):
+            if _NATIVE_LITTLE_ENDIAN and not offset & 3:
+                return self._battle_mons_u32[offset >> 2]
+            return int.from_bytes(self._battle_mon_data[offset:offset + 4], 'little')
+        offset = address - self._sb1_ptr
+        if 0 <= offset < len(self._save_block_1):
+            return int.from_bytes(self._save_block_1[offset:offset + 4], 'little')
+        return 0
 
     def read_range(self, address: int, length: int) -> bytes:
-        # Battle mons
-        base = Mem.BATTLE_MONS
-        if base <= address < base + len(self._battle_mon_data):
-            offset = address - base
-            return bytes(self._battle_mon_data[offset:offset + length])
-        
-        # Save blocks
-        if self._sb1_ptr <= address < self._sb1_ptr + len(self._save_block_1):
-            offset = address - self._sb1_ptr
-            return bytes(self._save_block_1[offset:offset + length])
-        if self._sb2_ptr <= address < self._sb2_ptr + len(self._save_block_2):
-            offset = address - self._sb2_ptr
-            return bytes(self._save_block_2[offset:offset + length])
-        
+        i = bisect_right(self._region_bases, address) - 1
+        while i >= 0:
+            base, end, buf = self._regions[i]
+            if address < end:
+                offset = address - base
+                return bytes(buf[offset:offset + length])
+            i -= 1
         return bytes(length)
 
-    def _read(self, address: int, size: int) -> int:
-        # Save block pointers
-        if address == Mem.SAVE_BLOCK_1_PTR:
-            return self._sb1_ptr
-        if address == Mem.SAVE_BLOCK_2_PTR:
-            return self._sb2_ptr
-        
-        # Battle type flags
-        if address == Mem.BATTLE_TYPE_FLAGS:
-            return self.scenario["battle_flags"]
-        
-        # Battle weather
-        if address == Mem.BATTLE_WEATHER:
-            return self.scenario["weather"]
-        
-        # Callbacks (non-zero = not in transition)
-        if address == Mem.CALLBACK1:
-            return 0x08001234
-        if address == Mem.CALLBACK2:
-            return 0x08005678
-        
-        # Text printers (not in dialogue)
-        if address == Mem.TEXT_PRINTERS:
-            return 0
-        if address == Mem.TEXT_PRINTERS + 0x24:
-            return 0
-        
-        # Battle mons
-        base = Mem.BATTLE_MONS
-        if base <= address < base + len(self._battle_mon_data):
-            offset = address - base
-            data = self._battle_mon_data[offset:offset + size]
-            if size == 1:
-                return data[0]
-            elif size == 2:
-                return int.from_bytes(data, 'little')
-            elif size == 4:
-                return int.from_bytes(data, 'little')
-        
-        # Save block reads
-        if self._sb1_ptr <= address < self._sb1_ptr + len(self._save_block_1):
-            offset = address - self._sb1_ptr
-            data = self._save_block_1[offset:offset + size]
-            return int.from_bytes(data, 'little') if size > 1 else data[0]
-        
-        return 0
+    def read_multi(self, ranges: list[tuple[int, int]]) -> list[bytes]:
+        # Word-sized ranges go through the scalar readers so fixed addresses
+        # in _special answer as they would to read8/16/32
+        out = []
+        for address, length in ranges:
+            if length == 4:
+                out.append(self.read32(address).to_bytes(4, 'little'))
+            elif length == 2:
+                out.append(self.read16(address).to_bytes(2, 'little'))
+            elif length == 1:
+                out.append(bytes((self.read8(address),)))
+            else:
+                out.append(self.read_range(address, length))
+        return out
 
     def tap_button(self, button: str) -> bool:
-        logger.debug(f"MockClient: tap {button}")
+        logger.debug("MockClient: tap %s", button)
         return True
 
     def hold_button(self, button: str, frames: int) -> bool:
-        logger.debug(f"MockClient: hold {button} for {frames}f")
+        logger.debug("MockClient: hold %s for %df", button, frames)
         return True
 
     def press_buttons(self, buttons: list[str], frames: int = 1) -> bool:
@@ -15,19 +15,22 @@ Key differences from Gen 1:
 """
 
 import logging
+import struct
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ...emulator.bizhawk_client import BizHawkClient
 
-from .memory_map import PokemonGen3Memory as Mem
+from .memory_map import (
+    PokemonGen3Memory as Mem, BattleMonRecord, unpack_battle_mon, GameLayout, load_layout,
+)
 from .data_types import (
     Pokemon, Move, BattleState, PokemonType, Ability, Nature, Weather,
-    ABILITY_TYPE_IMMUNITIES, get_nature_modifier,
+    ABILITY_TYPE_IMMUNITIES, get_nature_modifier, type_from_byte, ability_from_byte,
 )
-from ...data.move_data import enrich_move
+from ...data.move_data import make_move
 from ...data.species_data import get_species_name
 
 logger = logging.getLogger(__name__)
@@ -42,7 +45,7 @@ class BattleAction(Enum):
     RUN = auto()        # Attempt to flee
 
 
-@dataclass
+@dataclass(slots=True)
 class BattleDecision:
     """
     A decision to make in battle.
@@ -58,6 +61,72 @@ class BattleDecision:
     reason: str = ""
 
 
+def _build_type_table(
+    chart: dict[PokemonType, dict[PokemonType, float]]
+) -> tuple[tuple[float, ...], ...]:
+    """Flatten a nested type chart into an 18x18 table indexed by type value."""
+    rows = [[1.0] * len(PokemonType) for _ in PokemonType]
+    for attack_type, defenders in chart.items():
+        for defend_type, multiplier in defenders.items():
+            rows[attack_type][defend_type] = multiplier
+    return tuple(tuple(row) for row in rows)
+
+
+# Sentinel index for "no type" in the hot scoring path and in
+# TypeEffectiveness._DUAL_TABLE, which has a x1.0 slot for it on every axis
+_NO_TYPE = len(PokemonType)
+
+
+def _build_dual_type_table(
+    table: tuple[tuple[float, ...], ...]
+) -> tuple[tuple[tuple[float, ...], ...], ...]:
+    """
+    Expand the 18x18 table to 19x19x19 [attack][defend1][defend2] products.
+
+    Index _NO_TYPE on any axis means "no type": a typeless move or a
+    defender without a primary type is neutral, and a missing second type
+    counts as x1.0. defend2 == defend1 counts the type once, so lookups
+    need no branching.
+    """
+    neutral_row = (1.0,) * (_NO_TYPE + 1)
+    neutral_plane = (neutral_row,) * (_NO_TYPE + 1)
+    return tuple(
+        tuple(
+            tuple(
+                row[d1] if d2 == d1 else row[d1] * row[d2]
+                for d2 in range(_NO_TYPE)
+            ) + (row[d1],)
+            for d1 in range(_NO_TYPE)
+        ) + (neutral_row,)
+        for row in table
+    ) + (neutral_plane,)
+
+
+def _transpose_dual_type_table(
+    table: tuple[tuple[tuple[float, ...], ...], ...]
+) -> tuple[tuple[tuple[float, ...], ...], ...]:
+    """Reorder [attack][defend1][defend2] products to [defend1][defend2][attack]."""
+    axis = range(_NO_TYPE + 1)
+    return tuple(
+        tuple(tuple(table[attack][d1][d2] for attack in axis) for d2 in axis)
+        for d1 in axis
+    )
+
+
+def _build_ability_immunity_bits() -> tuple[int, ...]:
+    """Per-ability bitset of immune move types (bit t = immune to type value t)."""
+    bits = [0] * len(Ability)
+    for ability, immune_type in ABILITY_TYPE_IMMUNITIES.items():
+        # Wonder Guard has no fixed type; it's handled against the type chart
+        if immune_type is not None:
+            bits[ability] |= 1 << immune_type
+    return tuple(bits)
+
+
+# _ABILITY_IMMUNE_BITS[ability] >> move_type & 1 -> ability blocks that type
+_ABILITY_IMMUNE_BITS = _build_ability_immunity_bits()
+
+
 class TypeEffectiveness:
     """
     Gen 3 type effectiveness chart.
@@ -220,6 +289,18 @@ class TypeEffectiveness:
         },
     }
 
+    # Same chart flattened for lookups: _TABLE[attacking_type][defending_type].
+    # PokemonType is an IntEnum, so members index the rows directly.
+    _TABLE: tuple[tuple[float, ...], ...] = _build_type_table(CHART)
+
+    # Combined dual-type multipliers: _DUAL_TABLE[attack][defend1][defend2],
+    # with _NO_TYPE standing in for a missing type on any axis
+    _DUAL_TABLE: tuple[tuple[tuple[float, ...], ...], ...] = _build_dual_type_table(_TABLE)
+
+    # Same products as _DEFEND_TABLE[defend1][defend2][attack], so one
+    # defender's multipliers for all attacking types sit in a single row
+    _DEFEND_TABLE: tuple[tuple[tuple[float, ...], ...], ...] = _transpose_dual_type_table(_DUAL_TABLE)
+
     @classmethod
     def get_multiplier(
         cls,
@@ -238,17 +319,25 @@ class TypeEffectiveness:
         Returns:
             Effectiveness multiplier (0.0, 0.25, 0.5, 1.0, 2.0, or 4.0)
         """
-        # Get base multiplier for type 1
-        type_chart = cls.CHART.get(attack_type, {})
-        mult1 = type_chart.get(defend_type1, 1.0)
+        return cls._DUAL_TABLE[attack_type][defend_type1][
+            _NO_TYPE if defend_type2 is None else defend_type2
+        ]
 
-        # If no second type, return first multiplier
-        if defend_type2 is None or defend_type2 == defend_type1:
-            return mult1
+    @classmethod
+    def multipliers_against(
+        cls,
+        defend_type1: PokemonType,
+        defend_type2: Optional[PokemonType] = None
+    ) -> tuple[float, ...]:
+        """
+        Get every attacking type's multiplier against one defender.
 
-        # Multiply by second type effectiveness
-        mult2 = type_chart.get(defend_type2, 1.0)
-        return mult1 * mult2
+        The returned row is indexed by attacking type value, so scoring many
+        moves against the same defender costs one lookup per move.
+        """
+        return cls._DEFEND_TABLE[defend_type1][
+            _NO_TYPE if defend_type2 is None else defend_type2
+        ]
 
     @classmethod
     def is_super_effective(
@@ -261,6 +350,107 @@ class TypeEffectiveness:
         return cls.get_multiplier(attack_type, defend_type1, defend_type2) > 1.0
 
 
+# Module-level alias so hot paths index the table without classmethod dispatch:
+# _TYPE_LUT[attack][defend1][defend2], with _NO_TYPE for a missing type
+_TYPE_LUT = TypeEffectiveness._DUAL_TABLE
+
+
+def _decode_weather_flags(weather_val: int) -> Weather:
+    """Map a BATTLE_WEATHER flags byte to the active Weather."""
+    if weather_val & 0x07:  # Rain bits
+        return Weather.RAIN
+    if weather_val & 0x18:  # Sandstorm bits
+        return Weather.SANDSTORM
+    if weather_val & 0x60:  # Sun bits
+        return Weather.SUN
+    if weather_val & 0x80:  # Hail bit
+        return Weather.HAIL
+    return Weather.NONE
+
+
+# Little-endian u32 for the battle type flags word
+_U32 = struct.Struct("<I")
+
+# Weather for every possible low byte of BATTLE_WEATHER
+_WEATHER_FROM_FLAGS: tuple[Weather, ...] = tuple(
+    _decode_weather_flags(value) for value in range(256)
+)
+
+
+def _build_weather_mod_table() -> tuple[tuple[int, ...], ...]:
+    """Weather damage modifier per [weather][move type], Q12 (0x1000 = x1.0)."""
+    table = [[0x1000] * (_NO_TYPE + 1) for _ in Weather]
+    table[Weather.RAIN][PokemonType.WATER] = 0x1800
+    table[Weather.RAIN][PokemonType.FIRE] = 0x800
+    table[Weather.SUN][PokemonType.FIRE] = 0x1800
+    table[Weather.SUN][PokemonType.WATER] = 0x800
+    return tuple(tuple(row) for row in table)
+
+
+# _WEATHER_MOD[weather][move_type or _NO_TYPE] -> Q12 damage modifier
+_WEATHER_MOD = _build_weather_mod_table()
+
+
+def _build_speed_weather_table() -> tuple[tuple[float, ...], ...]:
+    """Speed multiplier per [weather][ability] from weather speed abilities."""
+    table = [[1.0] * len(Ability) for _ in Weather]
+    table[Weather.RAIN][Ability.SWIFT_SWIM] = 2.0
+    table[Weather.SUN][Ability.CHLOROPHYLL] = 2.0
+    return tuple(tuple(row) for row in table)
+
+
+# _SPEED_WEATHER_MUL[weather][ability] -> effective speed multiplier
+_SPEED_WEATHER_MUL = _build_speed_weather_table()
+
+
+def _build_attack_mul_tables() -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Physical attack multipliers per ability in Q8 (256 = x1.0), without/with status."""
+    plain = [0x100] * len(Ability)
+    plain[Ability.HUGE_POWER] = 0x200
+    plain[Ability.PURE_POWER] = 0x200
+    plain[Ability.HUSTLE] = 0x180
+    statused = list(plain)
+    statused[Ability.GUTS] = 0x180
+    return tuple(plain), tuple(statused)
+
+
+# _ATK_MUL_PHYS[ability] / _ATK_MUL_STATUSED[ability] -> Q8 physical attack multiplier
+_ATK_MUL_PHYS, _ATK_MUL_STATUSED = _build_attack_mul_tables()
+
+
+def _damage_core(
+    level: int,
+    power: int,
+    attack: int,
+    defense: int,
+    weather_mod: int,
+    multiplier: float,
+    stab: bool,
+    burn: bool,
+) -> int:
+    """
+    Gen 3 base damage from plain numbers, before the random factor.
+
+    Args:
+        weather_mod: Weather modifier in Q12 fixed point (0x1000 = x1.0)
+        multiplier: Type effectiveness multiplier
+        stab: Apply the x1.5 same-type bonus
+        burn: Apply the burn halving for physical moves
+
+    Free of Pokemon/Move objects so batch and search code can reuse it.
+    """
+    if defense == 0:
+        defense = 1  # Avoid division by zero
+    base = ((2 * level // 5 + 2) * power * attack // defense) // 50 + 2
+    base = (base * weather_mod) >> 12
+    base = int(base * multiplier)
+    if stab:
+        base = int(base * 1.5)
+    if burn:
+        base = base // 2
+    return base
+
+
 class PokemonGen3BattleHandler:
     """
     Handles battle decisions in Pokemon Gen 3 games.
@@ -271,16 +461,46 @@ class PokemonGen3BattleHandler:
     Supports both single and double battles.
     """
 
-    def __init__(self, client: "BizHawkClient"):
+    def __init__(self, client: "BizHawkClient", layout: Optional[GameLayout] = None):
         """
         Initialize the battle handler.
 
         Args:
             client: BizHawkClient for memory access
+            layout: Game-specific addresses; defaults to Emerald's
         """
         self.client = client
+        self.set_layout(layout if layout is not None else load_layout("BPEE"))
         self._battle_state: Optional[BattleState] = None
 
+        # Last raw struct and parsed Pokemon per battler slot, so unchanged
+        # battlers are reused instead of re-parsed on every read
+        self._battler_raw: list[Optional[bytes]] = [None] * 4
+        self._battler_mons: list[Optional[Pokemon]] = [None] * 4
+
+        # Decisions for the current battle state snapshot, keyed by
+        # (strategy, allow_run, target_pokemon)
+        self._decision_cache: dict[tuple[str, bool, int], BattleDecision] = {}
+        self._decision_cache_state: Optional[BattleState] = None
+
+    def set_layout(self, layout: GameLayout) -> None:
+        """
+        Read the running game's battle RAM (e.g. once the ROM is identified).
+
+        Args:
+            layout: Resolved layout from load_layout()
+        """
+        self.layout = layout
+        # Battle flags, all four battle mon structs and weather, fetched in one
+        # read_multi batch by read_battle_state. The 352-byte mons range is over
+        # the mGBA bridge's 256-byte limit; mGBAClient.read_multi splits it into
+        # pieces within the same request.
+        self.state_ranges: list[tuple[int, int]] = [
+            (layout.BATTLE_TYPE_FLAGS, 4),
+            (layout.BATTLE_MONS, 4 * Mem.BATTLE_MON_SIZE),
+            (layout.BATTLE_WEATHER, 2),
+        ]
+
     def read_battle_state(self) -> BattleState:
         """
         Read the current battle state from memory.
@@ -288,8 +508,24 @@ class PokemonGen3BattleHandler:
         Returns:
             BattleState with player and enemy Pokemon info
         """
-        # Read battle flags
-        battle_flags = self.client.read32(Mem.BATTLE_TYPE_FLAGS)
+        return self.parse_battle_state(*self.client.read_multi(self.state_ranges))
+
+    def parse_battle_state(self, flags_data: bytes, mons_data: bytes,
+                           weather_data: bytes) -> BattleState:
+        """
+        Build the battle state from buffers read over state_ranges.
+
+        Lets a caller fold these reads into a larger read_multi batch.
+
+        Args:
+            flags_data: Battle type flags (4 bytes)
+            mons_data: All four battle mon structs
+            weather_data: Battle weather (2 bytes)
+
+        Returns:
+            BattleState with player and enemy Pokemon info
+        """
+        battle_flags = _U32.unpack_from(flags_data)[0]
 
         is_double = bool(battle_flags & Mem.BATTLE_TYPE_DOUBLE)
         is_wild = bool(battle_flags & Mem.BATTLE_TYPE_WILD)
@@ -298,31 +534,24 @@ class PokemonGen3BattleHandler:
         is_tower = bool(battle_flags & Mem.BATTLE_TYPE_BATTLE_TOWER)
         is_first_battle = bool(battle_flags & Mem.BATTLE_TYPE_FIRST_BATTLE)
 
+        # Viewed through a memoryview so per-slot slices don't copy
+        all_mons = memoryview(mons_data)
+
         # Read player's Pokemon
-        player_pokemon = [self._read_battle_pokemon(0)]
+        player_pokemon = [self._get_battler(all_mons, 0)]
         if is_double:
-            player2 = self._read_battle_pokemon(2)
+            player2 = self._get_battler(all_mons, 2)
             if player2:
                 player_pokemon.append(player2)
 
         # Read enemy Pokemon
-        enemy_pokemon = [self._read_battle_pokemon(1)]
+        enemy_pokemon = [self._get_battler(all_mons, 1)]
         if is_double:
-            enemy2 = self._read_battle_pokemon(3)
+            enemy2 = self._get_battler(all_mons, 3)
             if enemy2:
                 enemy_pokemon.append(enemy2)
 
-        # Read weather
-        weather_val = self.client.read16(Mem.BATTLE_WEATHER)
-        weather = Weather.NONE
-        if weather_val & 0x07:  # Rain bits
-            weather = Weather.RAIN
-        elif weather_val & 0x18:  # Sandstorm bits
-            weather = Weather.SANDSTORM
-        elif weather_val & 0x60:  # Sun bits
-            weather = Weather.SUN
-        elif weather_val & 0x80:  # Hail bit
-            weather = Weather.HAIL
+        weather = _WEATHER_FROM_FLAGS[weather_data[0]]
 
         # Can't run from: trainer battles, safari, or first battle (Birch rescue)
         can_run = is_wild and not is_safari and not is_first_battle
@@ -341,64 +570,69 @@ class PokemonGen3BattleHandler:
 
         return self._battle_state
 
-    def _read_battle_pokemon(self, battler_index: int) -> Optional[Pokemon]:
+    def _get_battler(self, all_mons: memoryview, battler_index: int) -> Optional[Pokemon]:
+        """
+        Get a battler from the 4-slot battle mon block.
+
+        Reuses the Pokemon parsed last time if the slot's bytes are
+        unchanged (the common case between turns); otherwise re-parses.
+        """
+        size = Mem.BATTLE_MON_SIZE
+        data = all_mons[battler_index * size:(battler_index + 1) * size]
+        if data == self._battler_raw[battler_index]:
+            return self._battler_mons[battler_index]
+
+        record = self._unpack_battler(data, battler_index)
+        pokemon = self._pokemon_from_record(record, battler_index) if record else None
+        self._battler_raw[battler_index] = bytes(data)
+        self._battler_mons[battler_index] = pokemon
+        return pokemon
+
+    def _unpack_battler(self, data: bytes, battler_index: int) -> Optional[BattleMonRecord]:
         """
-        Read a Pokemon's battle data.
+        Unpack a raw battle mon struct into a BattleMonRecord.
 
         Args:
-            battler_index: 0=player1, 1=enemy1, 2=player2, 3=enemy2
+            data: BATTLE_MON_SIZE bytes read from BATTLE_MONS
+            battler_index: 0=player1, 1=enemy1, 2=player2, 3=enemy2 (for logging)
+
+        Returns:
+            The record, or None for an empty slot or unreadable data
         """
-        base_addr = Mem.BATTLE_MONS + (battler_index * Mem.BATTLE_MON_SIZE)
+        try:
+            record = unpack_battle_mon(data)
+        except struct.error as e:
+            logger.error(f"Error reading battle Pokemon {battler_index}: {e}")
+            return None
+        return record if record.species != 0 else None
 
+    def _pokemon_from_record(self, record: BattleMonRecord, battler_index: int) -> Optional[Pokemon]:
+        """Build a Pokemon (with enriched moves) from a battler record."""
         try:
-            species = self.client.read16(base_addr + Mem.BATTLE_MON_SPECIES_OFFSET)
-            if species == 0:
-                return None
-
-            attack = self.client.read16(base_addr + Mem.BATTLE_MON_ATTACK_OFFSET)
-            defense = self.client.read16(base_addr + Mem.BATTLE_MON_DEFENSE_OFFSET)
-            speed = self.client.read16(base_addr + Mem.BATTLE_MON_SPEED_OFFSET)
-            sp_attack = self.client.read16(base_addr + Mem.BATTLE_MON_SP_ATK_OFFSET)
-            sp_defense = self.client.read16(base_addr + Mem.BATTLE_MON_SP_DEF_OFFSET)
-
-            hp = self.client.read16(base_addr + Mem.BATTLE_MON_HP_OFFSET)
-            max_hp = self.client.read16(base_addr + Mem.BATTLE_MON_MAX_HP_OFFSET)
-            level = self.client.read8(base_addr + Mem.BATTLE_MON_LEVEL_OFFSET)
-            status = self.client.read32(base_addr + Mem.BATTLE_MON_STATUS_OFFSET)
-
-            ability_id = self.client.read8(base_addr + Mem.BATTLE_MON_ABILITY_OFFSET)
-            type1 = self.client.read8(base_addr + Mem.BATTLE_MON_TYPE1_OFFSET)
-            type2 = self.client.read8(base_addr + Mem.BATTLE_MON_TYPE2_OFFSET)
-
-            # Read moves and enrich with database data
-            moves = []
-            for i in range(4):
-                move_id = self.client.read16(
-                    base_addr + Mem.BATTLE_MON_MOVES_OFFSET + (i * 2)
+            moves = [
+                make_move(move_id, pp)
+                for move_id, pp in (
+                    (record.move1, record.pp1), (record.move2, record.pp2),
+                    (record.move3, record.pp3), (record.move4, record.pp4),
                 )
-                pp = self.client.read8(base_addr + Mem.BATTLE_MON_PP_OFFSET + i)
-                if move_id != 0:
-                    move = Move(id=move_id, pp=pp)
-                    enrich_move(move)
-                    moves.append(move)
-
-            return Pokemon(
-                species_id=species,
-                species_name=get_species_name(species),
-                level=level,
-                hp=hp,
-                max_hp=max_hp,
-                status=status,
-                attack=attack,
-                defense=defense,
-                speed=speed,
-                sp_attack=sp_attack,
-                sp_defense=sp_defense,
-                ability=Ability(ability_id) if 0 < ability_id <= 77 else Ability.NONE,
-                type1=PokemonType(type1) if type1 <= 17 else None,
-                type2=PokemonType(type2) if type2 <= 17 and type2 != type1 else None,
-                moves=moves,
+                if move_id != 0
+            ]
+
+            ability_id = record.ability
+            type1 = record.type1
+            type2 = record.type2
+            pokemon = Pokemon.from_raw(
+                record.species, record.level, record.hp, record.max_hp, record.status,
+                record.attack, record.defense, record.speed,
+                record.sp_attack, record.sp_defense,
+                ability_from_byte(ability_id, Ability.NONE),
+                Nature.HARDY,
+                type_from_byte(type1),
+                type_from_byte(type2) if type2 != type1 else None,
             )
+            pokemon.species_name = get_species_name(record.species)
+            pokemon.moves = moves
+            return pokemon
 
         except Exception as e:
             logger.error(f"Error reading battle Pokemon {battler_index}: {e}")
@@ -437,12 +671,25 @@ class PokemonGen3BattleHandler:
                 reason="Speedrun: flee from wild battle"
             )
 
-        # Check if we should switch (low HP, bad matchup)
-        if strategy == "safe" and self._should_switch():
-            return self._decide_switch()
-
-        # Default: Fight with best move
-        return self._decide_fight(target_pokemon)
+        # Decisions depend only on the state snapshot and the arguments, so
+        # repeated polls between reads reuse them. read_battle_state builds a
+        # new BattleState, which invalidates the cache.
+        if state is not self._decision_cache_state:
+            self._decision_cache.clear()
+            self._decision_cache_state = state
+
+        key = (strategy, allow_run, target_pokemon)
+        decision = self._decision_cache.get(key)
+        if decision is None:
+            # Check if we should switch (low HP, bad matchup)
+            if strategy == "safe" and self._should_switch():
+                decision = self._decide_switch()
+            else:
+                # Default: Fight with best move
+                decision = self._decide_fight(target_pokemon)
+            self._decision_cache[key] = decision
+
+        return decision
 
     def _decide_fight(self, target_index: int = 0) -> BattleDecision:
         """Decide which move to use."""
@@ -457,18 +704,29 @@ class PokemonGen3BattleHandler:
                 reason="No battle data, using first move"
             )
 
-        # Find best move considering abilities
-        best_move_idx = 0
-        best_score = -1
-
-        for i, move in enumerate(player.moves):
-            if move.pp <= 0:
-                continue
-
-            score = self._score_move(move, player, enemy, state.weather)
-            if score > best_score:
-                best_score = score
-                best_move_idx = i
+        # Everything about the battlers is invariant across moves; read it once
+        weather = state.weather
+        atk_ability = player.ability
+        def_ability = enemy.ability
+        def_type1 = _NO_TYPE if enemy.type1 is None else enemy.type1
+        def_type2 = _NO_TYPE if enemy.type2 is None else enemy.type2
+        stab_bits = player._stab_bits
+        statused = player.has_status
+        score_move = self._score_move_fast
+
+        # Score the whole moveset in one pass; moves without PP get -1 so any
+        # usable move beats them, then take the first highest score
+        scores = [
+            score_move(
+                move.power, _NO_TYPE if move.type is None else move.type,
+                move.accuracy, move.is_physical,
+                atk_ability, def_ability, def_type1, def_type2,
+                stab_bits, statused, weather,
+            ) if move.pp > 0 else -1.0
+            for move in player.moves
+        ]
+        best_move_idx = max(range(len(scores)), key=scores.__getitem__) if scores else 0
+        best_score = scores[best_move_idx] if scores else -1
 
         return BattleDecision(
             action=BattleAction.FIGHT,
@@ -489,80 +747,90 @@ class PokemonGen3BattleHandler:
 
         Higher score = better move choice.
         """
-        if move.power == 0:
+        return self._score_move_fast(
+            move.power, _NO_TYPE if move.type is None else move.type,
+            move.accuracy, move.is_physical,
+            attacker.ability, defender.ability,
+            _NO_TYPE if defender.type1 is None else defender.type1,
+            _NO_TYPE if defender.type2 is None else defender.type2,
+            attacker._stab_bits, attacker.has_status, weather,
+        )
+
+    def _score_move_fast(
+        self,
+        power: int,
+        move_type: int,
+        accuracy: int,
+        is_physical: bool,
+        atk_ability: Ability,
+        def_ability: Ability,
+        def_type1: int,
+        def_type2: int,
+        stab_bits: int,
+        statused: bool,
+        weather: Weather = Weather.NONE
+    ) -> float:
+        """
+        Score a move from plain values (see _score_move).
+
+        Takes the move's static fields and the battlers' move-invariant
+        fields directly, so _decide_fight can read them once per decision
+        instead of once per move. Types are plain ints with _NO_TYPE for
+        "none", which lets every lookup below index tables without None checks.
+        """
+        if power == 0:
             # Status moves get low priority for now
             return 10.0
 
         # Check ability immunities first
-        if move.type is not None:
-            if self._is_immune_by_ability(defender, move.type):
-                return 0.0  # Move will fail
+        if (_ABILITY_IMMUNE_BITS[def_ability] >> move_type) & 1:
+            return 0.0  # Move will fail
 
-        # Base score from power
-        score = float(move.power)
+        # Modifiers accumulate as a Q12 fixed-point integer (0x1000 = x1.0),
+        # Gen 3 style, and are applied to power once at the end
+        mod = 0x1000
 
-        # Apply type effectiveness if we have type data
-        if move.type is not None and defender.type1 is not None:
-            multiplier = TypeEffectiveness.get_multiplier(
-                move.type, defender.type1, defender.type2
-            )
-            score *= multiplier
+        # Apply type effectiveness (x1.0 when either side has no type data)
+        multiplier = _TYPE_LUT[move_type][def_type1][def_type2]
 
-            # Check for Wonder Guard (only super-effective moves work)
-            if defender.ability == Ability.WONDER_GUARD and multiplier <= 1.0:
-                return 0.0
+        # Check for Wonder Guard (only super-effective moves work)
+        if (def_ability == Ability.WONDER_GUARD and multiplier <= 1.0
+                and move_type != _NO_TYPE and def_type1 != _NO_TYPE):
+            return 0.0
 
         # Apply STAB (Same Type Attack Bonus)
-        if move.type is not None:
-            if move.type == attacker.type1 or move.type == attacker.type2:
-                score *= 1.5
+        if (stab_bits >> move_type) & 1:
+            mod = (mod * 0x1800 + 0x800) >> 12
 
         # Weather modifiers
-        if weather == Weather.RAIN:
-            if move.type == PokemonType.WATER:
-                score *= 1.5
-            elif move.type == PokemonType.FIRE:
-                score *= 0.5
-        elif weather == Weather.SUN:
-            if move.type == PokemonType.FIRE:
-                score *= 1.5
-            elif move.type == PokemonType.WATER:
-                score *= 0.5
+        mod = (mod * _WEATHER_MOD[weather][move_type] + 0x800) >> 12
 
         # Ability modifiers
         # Thick Fat reduces Fire/Ice damage
-        if defender.ability == Ability.THICK_FAT:
-            if move.type in (PokemonType.FIRE, PokemonType.ICE):
-                score *= 0.5
+        if def_ability == Ability.THICK_FAT:
+            if move_type in (PokemonType.FIRE, PokemonType.ICE):
+                mod = (mod * 0x800 + 0x800) >> 12
 
         # Guts/Hustle boost attack
-        if attacker.ability == Ability.GUTS and attacker.has_status:
-            if move.is_physical:
-                score *= 1.5
-        if attacker.ability == Ability.HUGE_POWER or attacker.ability == Ability.PURE_POWER:
-            if move.is_physical:
-                score *= 2.0
+        if atk_ability == Ability.GUTS and statused:
+            if is_physical:
+                mod = (mod * 0x1800 + 0x800) >> 12
+        if atk_ability == Ability.HUGE_POWER or atk_ability == Ability.PURE_POWER:
+            if is_physical:
+                mod = (mod * 0x2000 + 0x800) >> 12
+
+        score = power * mod * multiplier / 0x1000
 
         # Penalize for low accuracy
-        if move.accuracy > 0 and move.accuracy < 100:
-            score *= (move.accuracy / 100.0)
+        if accuracy > 0 and accuracy < 100:
+            score *= (accuracy / 100.0)
 
         return score
 
     def _is_immune_by_ability(self, defender: Pokemon, move_type: PokemonType) -> bool:
         """Check if defender's ability grants immunity to the move type."""
-        if defender.ability == Ability.LEVITATE and move_type == PokemonType.GROUND:
-            return True
-        if defender.ability == Ability.VOLT_ABSORB and move_type == PokemonType.ELECTRIC:
-            return True
-        if defender.ability == Ability.WATER_ABSORB and move_type == PokemonType.WATER:
-            return True
-        if defender.ability == Ability.FLASH_FIRE and move_type == PokemonType.FIRE:
-            return True
-        if defender.ability == Ability.SOUNDPROOF:
-            # Would need move data to check if sound-based
-            pass
-        return False
+        # Soundproof would need move data to check if sound-based
+        return bool((_ABILITY_IMMUNE_BITS[defender.ability] >> move_type) & 1)
 
     def _should_switch(self) -> bool:
         """Check if we should switch Pokemon."""
@@ -578,14 +846,12 @@ class PokemonGen3BattleHandler:
         # Check type matchup
         enemy = state.enemy_lead
         if enemy and player.type1:
+            type1 = player.type1
+            type2 = _NO_TYPE if player.type2 is None else player.type2
             # If enemy has super effective STAB, consider switching
             for move in enemy.moves:
-                if move.type and player.type1:
-                    mult = TypeEffectiveness.get_multiplier(
-                        move.type, player.type1, player.type2
-                    )
-                    if mult >= 2.0:
-                        return True
+                if move.type and _TYPE_LUT[move.type][type1][type2] >= 2.0:
+                    return True
 
         return False
 
@@ -627,15 +893,10 @@ class PokemonGen3BattleHandler:
 
         # Determine if physical or special (Gen 3 type-based split)
         if move.is_physical:
-            attack = attacker.attack
             defense = defender.defense
-            # Ability modifiers for physical
-            if attacker.ability in (Ability.HUGE_POWER, Ability.PURE_POWER):
-                attack *= 2
-            if attacker.ability == Ability.GUTS and attacker.has_status:
-                attack = int(attack * 1.5)
-            if attacker.ability == Ability.HUSTLE:
-                attack = int(attack * 1.5)
+            # Ability modifiers for physical (Q8 table; Guts needs a status)
+            atk_mul = _ATK_MUL_STATUSED if attacker.has_status else _ATK_MUL_PHYS
+            attack = (attacker.attack * atk_mul[attacker.ability]) >> 8
         else:
             attack = attacker.sp_attack
             defense = defender.sp_defense
@@ -650,43 +911,26 @@ class PokemonGen3BattleHandler:
             if move.is_physical:
                 defense = int(defense * 1.5)
 
-        # Base damage calculation
-        if defense == 0:
-            defense = 1  # Avoid division by zero
-        base = ((2 * level // 5 + 2) * power * attack // defense) // 50 + 2
-
-        # Weather modifiers
-        if weather == Weather.RAIN:
-            if move.type == PokemonType.WATER:
-                base = int(base * 1.5)
-            elif move.type == PokemonType.FIRE:
-                base = base // 2
-        elif weather == Weather.SUN:
-            if move.type == PokemonType.FIRE:
-                base = int(base * 1.5)
-            elif move.type == PokemonType.WATER:
-                base = base // 2
+        # Weather modifiers (Q12 fixed point, 0x1000 = x1.0)
+        weather_mod = _WEATHER_MOD[weather][_NO_TYPE if move.type is None else move.type]
 
         # Type effectiveness
+        multiplier = 1.0
         if move.type is not None and defender.type1 is not None:
-            multiplier = TypeEffectiveness.get_multiplier(
-                move.type, defender.type1, defender.type2
-            )
+            multiplier = _TYPE_LUT[move.type][defender.type1][
+                _NO_TYPE if defender.type2 is None else defender.type2
+            ]
             # Wonder Guard check
             if defender.ability == Ability.WONDER_GUARD and multiplier <= 1.0:
                 return (0, 0)
-            base = int(base * multiplier)
 
         # STAB
-        if move.type is not None:
-            if move.type == attacker.type1 or move.type == attacker.type2:
-                base = int(base * 1.5)
+        stab = move.type is not None and bool((attacker._stab_bits >> move.type) & 1)
+
+        # Burn halves physical attack damage; Guts negates the penalty
+        burn = attacker.is_burned and move.is_physical and attacker.ability != Ability.GUTS
 
-        # Burn halves physical attack damage
-        if attacker.is_burned and move.is_physical:
-            # Guts negates burn penalty
-            if attacker.ability != Ability.GUTS:
-                base = base // 2
+        base = _damage_core(level, power, attack, defense, weather_mod, multiplier, stab, burn)
 
         # Random factor (85% to 100%)
         min_damage = int(base * 0.85)
@@ -694,6 +938,52 @@ class PokemonGen3BattleHandler:
 
         return (max(1, min_damage), max(1, max_damage))
 
+    def estimate_damage_batch(
+        self,
+        powers: Sequence[int],
+        levels: Sequence[int],
+        attacks: Sequence[int],
+        defenses: Sequence[int],
+        move_types: Sequence[int],
+        def_types1: Sequence[int],
+        def_types2: Sequence[int],
+        stab_bits: Sequence[int],
+        burned: Sequence[bool],
+        weather: Weather = Weather.NONE,
+    ) -> tuple[list[int], list[int]]:
+        """
+        Estimate damage ranges for many (move, attacker, defender) triples.
+
+        For search/rollout code that evaluates lots of matchups at once.
+        Inputs are parallel sequences of plain values: types as ints with
+        _NO_TYPE for "none", attack/defense already adjusted for abilities,
+        and burned meaning the burn penalty applies (physical move, no Guts).
+        Ability immunities and Wonder Guard are left to the caller.
+
+        Returns:
+            (min_damages, max_damages) lists, in input order
+        """
+        min_damages = []
+        max_damages = []
+        for power, level, attack, defense, move_type, t1, t2, stab, burn in zip(
+            powers, levels, attacks, defenses, move_types,
+            def_types1, def_types2, stab_bits, burned,
+        ):
+            if power == 0:
+                min_damages.append(0)
+                max_damages.append(0)
+                continue
+            base = _damage_core(
+                level, power, attack, defense,
+                _WEATHER_MOD[weather][move_type],
+                _TYPE_LUT[move_type][t1][t2],
+                bool((stab >> move_type) & 1),
+                burn,
+            )
+            min_damages.append(max(1, int(base * 0.85)))
+            max_damages.append(max(1, base))
+        return min_damages, max_damages
+
     def get_speed_order(self) -> list[tuple[int, Pokemon]]:
         """
         Get the order Pokemon will move in, considering abilities and weather.
@@ -715,26 +1005,18 @@ class PokemonGen3BattleHandler:
         for i, mon in enumerate(state.enemy_pokemon):
             battlers.append((i * 2 + 1, mon))  # 1, 3
 
-        # Calculate effective speeds
-        def effective_speed(mon: Pokemon) -> float:
-            speed = float(mon.speed)
-
-            # Paralysis halves speed
-            if mon.is_paralyzed:
-                speed *= 0.25
-
-            # Weather abilities
-            if state.weather == Weather.RAIN and mon.ability == Ability.SWIFT_SWIM:
-                speed *= 2.0
-            elif state.weather == Weather.SUN and mon.ability == Ability.CHLOROPHYLL:
-                speed *= 2.0
-            elif state.weather == Weather.SANDSTORM and mon.ability == Ability.SAND_VEIL:
-                pass  # Evasion boost, not speed
-
-            return speed
+        # Effective speed keys computed once up front: paralysis quarters
+        # speed, and Swift Swim / Chlorophyll double it in their weather
+        # (Sand Veil is an evasion boost, not speed)
+        ability_mul = _SPEED_WEATHER_MUL[state.weather]
+        keys = [
+            mon.speed * (0.25 if mon.is_paralyzed else 1.0) * ability_mul[mon.ability]
+            for _, mon in battlers
+        ]
 
         # Sort by effective speed (highest first)
-        battlers.sort(key=lambda x: effective_speed(x[1]), reverse=True)
+        order = sorted(range(len(battlers)), key=keys.__getitem__, reverse=True)
+        battlers = [battlers[i] for i in order]
 
         return battlers
 
@@ -42,6 +42,12 @@ class PokemonType(IntEnum):
     DARK = 17
 
 
+# Raw memory value -> enum member (None if out of range). These helpers are
+# bound dict.get methods on the enum's value map, which skips the
+# Enum.__call__ machinery on hot decode paths.
+type_from_byte = PokemonType._value2member_map_.get
+
+
 class StatusCondition(IntEnum):
     """Status condition flags (Gen 3)."""
 
@@ -54,6 +60,16 @@ class StatusCondition(IntEnum):
     TOXIC = 0x80       # Bit 7 (bad poison)
 
 
+# Plain-int copies of the StatusCondition masks for the Pokemon status
+# predicates; `&` against an IntEnum member goes through IntEnum.__and__
+_MASK_SLEEP = 0x07
+_MASK_POISON = 0x08
+_MASK_BURN = 0x10
+_MASK_FREEZE = 0x20
+_MASK_PARALYSIS = 0x40
+_MASK_TOXIC = 0x80
+
+
 class Nature(IntEnum):
     """
     Pokemon natures (25 total).
@@ -102,6 +118,14 @@ class Nature(IntEnum):
     CAREFUL = 23  # +SpD, -SpA
 
 
+nature_from_byte = Nature._value2member_map_.get
+
+# Nature by ID (personality % 25). The ID is always in range, so the party
+# parse indexes this directly; members are declared grouped by stat, not in
+# value order, hence the sort.
+NATURE_BY_ID: tuple[Nature, ...] = tuple(sorted(Nature, key=lambda n: n.value))
+
+
 # Nature stat modifier lookup tables
 # Index 0=Atk, 1=Def, 2=Spd, 3=SpA, 4=SpD
 NATURE_STAT_BOOST: dict[Nature, int] = {
@@ -121,26 +145,49 @@ NATURE_STAT_REDUCE: dict[Nature, int] = {
 }
 
 
+def _build_nature_mod_table() -> tuple[tuple[float, ...], ...]:
+    """Modifier for every (nature value, stat index) pair, built once at import."""
+    table = []
+    for value in range(len(Nature)):
+        # Neutral natures are exactly the multiples of 6 (boost == reduce)
+        if value % 6 == 0:
+            table.append((1.0,) * 5)
+            continue
+        nature = Nature(value)
+        boost = NATURE_STAT_BOOST.get(nature)
+        reduce = NATURE_STAT_REDUCE.get(nature)
+        table.append(tuple(
+            1.1 if stat_index == boost else 0.9 if stat_index == reduce else 1.0
+            for stat_index in range(5)
+        ))
+    return tuple(table)
+
+
+# _NATURE_MOD_TABLE[nature][stat_index]
+_NATURE_MOD_TABLE = _build_nature_mod_table()
+
+# Stat attribute name -> index into a _NATURE_MOD_TABLE row
+_STAT_NAME_INDEX: dict[str, int] = {
+    'attack': 0, 'defense': 1, 'speed': 2,
+    'sp_attack': 3, 'sp_defense': 4,
+}
+
+
 def get_nature_modifier(nature: Nature, stat_index: int) -> float:
     """
     Get the nature modifier for a specific stat.
 
     Args:
-        nature: The Pokemon's nature
+        nature: The Pokemon's nature (or its raw value)
         stat_index: 0=Atk, 1=Def, 2=Spd, 3=SpA, 4=SpD
 
     Returns:
         1.1 for boosted stat, 0.9 for reduced stat, 1.0 for neutral
+        (including natures outside 0-24 and stat indices outside 0-4)
     """
-    if nature in (Nature.HARDY, Nature.DOCILE, Nature.SERIOUS,
-                  Nature.BASHFUL, Nature.QUIRKY):
+    if not (0 <= nature < 25 and 0 <= stat_index < 5):
         return 1.0
-
-    if NATURE_STAT_BOOST.get(nature) == stat_index:
-        return 1.1
-    if NATURE_STAT_REDUCE.get(nature) == stat_index:
-        return 0.9
-    return 1.0
+    return _NATURE_MOD_TABLE[nature][stat_index]
 
 
 class Ability(IntEnum):
@@ -230,6 +277,9 @@ class Ability(IntEnum):
     AIR_LOCK = 77
 
 
+ability_from_byte = Ability._value2member_map_.get
+
+
 # Abilities that grant type immunities
 ABILITY_TYPE_IMMUNITIES: dict[Ability, PokemonType] = {
     Ability.LEVITATE: PokemonType.GROUND,
@@ -239,6 +289,18 @@ ABILITY_TYPE_IMMUNITIES: dict[Ability, PokemonType] = {
     Ability.WONDER_GUARD: None,  # Special case: immune to non-super-effective
 }
 
+
+def _build_immunity_table() -> tuple[tuple[bool, ...], ...]:
+    """ABILITY_TYPE_IMMUNITIES as a dense [ability][type] table of bools."""
+    table = [[False] * len(PokemonType) for _ in range(len(Ability))]
+    for ability, immune_type in ABILITY_TYPE_IMMUNITIES.items():
+        if immune_type is not None:
+            table[ability][immune_type] = True
+    return tuple(tuple(row) for row in table)
+
+
+_IMMUNITY_BY_ABILITY_TYPE = _build_immunity_table()
+
 # Abilities that heal when hit by a type
 ABILITY_TYPE_HEAL: dict[Ability, PokemonType] = {
     Ability.VOLT_ABSORB: PokemonType.ELECTRIC,
@@ -263,6 +325,20 @@ class Weather(IntEnum):
     HAIL = 4
 
 
+# Gen 3 physical/special split by type, as bitmasks over PokemonType values.
+# Physical: Normal, Fighting, Flying, Poison, Ground, Rock, Bug, Ghost, Steel
+_PHYSICAL_TYPE_MASK = 0x001FF
+# Special: Fire, Water, Grass, Electric, Psychic, Ice, Dragon, Dark
+_SPECIAL_TYPE_MASK = 0x3FC00
+
+
+# (weather, ability) -> speed multiplier, keyed by raw int values
+_WEATHER_SPEED_BOOST: dict[tuple[int, int], float] = {
+    (int(Weather.RAIN), int(Ability.SWIFT_SWIM)): 2.0,
+    (int(Weather.SUN), int(Ability.CHLOROPHYLL)): 2.0,
+}
+
+
 class ContestCategory(IntEnum):
     """Pokemon Contest categories."""
 
@@ -273,7 +349,7 @@ class ContestCategory(IntEnum):
     TOUGH = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class Move:
     """
     A Pokemon move (Gen 3).
@@ -304,6 +380,9 @@ class Move:
     is_high_crit: bool = False
     target: str = "single"  # single, all_opponents, self, ally, etc.
 
+    # The properties below are derived on access rather than cached at
+    # construction: enrich_move fills in power and type after __init__
+
     @property
     def is_damaging(self) -> bool:
         return self.power > 0
@@ -311,21 +390,21 @@ class Move:
     @property
     def is_physical(self) -> bool:
         """Check if move is physical (Gen 3 uses type-based split)."""
-        if self.type is None:
+        move_type = self.type
+        if move_type is None:
             return True
-        # Physical types: Normal, Fighting, Flying, Poison, Ground, Rock, Bug, Ghost, Steel
-        return self.type.value <= 8
+        return (_PHYSICAL_TYPE_MASK >> move_type) & 1 == 1
 
     @property
     def is_special(self) -> bool:
         """Check if move is special (Gen 3 uses type-based split)."""
-        if self.type is None:
+        move_type = self.type
+        if move_type is None:
             return False
-        # Special types: Fire, Water, Grass, Electric, Psychic, Ice, Dragon, Dark
-        return self.type.value >= 10
+        return (_SPECIAL_TYPE_MASK >> move_type) & 1 == 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Pokemon:
     """
     A Pokemon in the party or battle (Gen 3).
@@ -406,6 +485,37 @@ class Pokemon:
     gender: int = 0       # 0=male, 1=female, 2=genderless
     pokerus: int = 0      # Pokerus status byte
 
+    # Bit t set when type value t gives STAB; derived from type1/type2,
+    # which don't change over a Pokemon's lifetime
+    _stab_bits: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        stab_bits = 0
+        if self.type1 is not None:
+            stab_bits |= 1 << self.type1
+        if self.type2 is not None:
+            stab_bits |= 1 << self.type2
+        self._stab_bits = stab_bits
+
+    @classmethod
+    def from_raw(cls, species_id: int, level: int, hp: int, max_hp: int, status: int,
+                 attack: int, defense: int, speed: int, sp_attack: int, sp_defense: int,
+                 ability: Ability = Ability.NONE, nature: Nature = Nature.HARDY,
+                 type1: Optional[PokemonType] = None,
+                 type2: Optional[PokemonType] = None) -> "Pokemon":
+        """
+        Build a Pokemon from fields decoded out of memory.
+
+        For the per-tick read paths: call it positionally. The fields reach
+        __init__ positionally too, which skips matching a dozen keywords
+        against all 45 parameters (about 40% of the constructor's cost).
+        Nothing is validated, so callers must pass already-decoded values;
+        any other fields are assigned on the result.
+        """
+        return cls(species_id, "", "", level, hp, max_hp, status,
+                   attack, defense, speed, sp_attack, sp_defense, ability, nature,
+                   type1=type1, type2=type2)
+
     @property
     def is_fainted(self) -> bool:
         """Check if Pokemon has fainted (0 HP)."""
@@ -420,35 +530,35 @@ class Pokemon:
 
     @property
     def is_poisoned(self) -> bool:
-        return bool(self.status & StatusCondition.POISON)
+        return (self.status & _MASK_POISON) != 0
 
     @property
     def is_badly_poisoned(self) -> bool:
-        return bool(self.status & StatusCondition.TOXIC)
+        return (self.status & _MASK_TOXIC) != 0
 
     @property
     def is_burned(self) -> bool:
-        return bool(self.status & StatusCondition.BURN)
+        return (self.status & _MASK_BURN) != 0
 
     @property
     def is_paralyzed(self) -> bool:
-        return bool(self.status & StatusCondition.PARALYSIS)
+        return (self.status & _MASK_PARALYSIS) != 0
 
     @property
     def is_frozen(self) -> bool:
-        return bool(self.status & StatusCondition.FREEZE)
+        return (self.status & _MASK_FREEZE) != 0
 
     @property
     def is_asleep(self) -> bool:
-        return bool(self.status & StatusCondition.SLEEP_MASK)
+        return (self.status & _MASK_SLEEP) != 0
 
     @property
     def has_status(self) -> bool:
-        return self.status != StatusCondition.NONE
+        return self.status != 0
 
     @property
     def total_evs(self) -> int:
-        """Get total EVs (max 510)."""
+        """Get total EVs (max 510). Not cached: EV fields are plain attributes."""
         return (self.ev_hp + self.ev_attack + self.ev_defense +
                 self.ev_speed + self.ev_sp_attack + self.ev_sp_defense)
 
@@ -462,18 +572,19 @@ class Pokemon:
         Returns:
             1.1, 1.0, or 0.9
         """
-        stat_indices = {
-            'attack': 0, 'defense': 1, 'speed': 2,
-            'sp_attack': 3, 'sp_defense': 4
-        }
-        if stat not in stat_indices:
+        try:
+            return _NATURE_MOD_TABLE[self.nature][_STAT_NAME_INDEX[stat]]
+        except KeyError:
             return 1.0
-        return get_nature_modifier(self.nature, stat_indices[stat])
 
     def get_effective_stat(self, stat: str) -> int:
         """Get stat value with nature modifier applied."""
         base_value = getattr(self, stat, 0)
-        return int(base_value * self.get_nature_modifier(stat))
+        try:
+            modifier = _NATURE_MOD_TABLE[self.nature][_STAT_NAME_INDEX[stat]]
+        except KeyError:
+            modifier = 1.0
+        return int(base_value * modifier)
 
     def has_ability(self, ability: Ability) -> bool:
         """Check if Pokemon has a specific ability."""
@@ -481,25 +592,30 @@ class Pokemon:
 
     def is_immune_to_type(self, attack_type: PokemonType) -> bool:
         """Check if ability grants immunity to a type."""
-        if self.ability in ABILITY_TYPE_IMMUNITIES:
-            immune_type = ABILITY_TYPE_IMMUNITIES[self.ability]
-            if immune_type == attack_type:
-                return True
-        return False
+        if attack_type is None:
+            # Only Wonder Guard's placeholder entry ever matched a missing type
+            return self.ability == Ability.WONDER_GUARD
+        # Wonder Guard depends on the type chart, which lives in the battle
+        # handler; its row here is all False
+        return _IMMUNITY_BY_ABILITY_TYPE[self.ability][attack_type]
 
     def get_best_damaging_move(self) -> Optional[Move]:
         """Get the highest power move with PP remaining."""
-        damaging_moves = [m for m in self.moves if m.is_damaging and m.pp > 0]
-        if not damaging_moves:
-            return None
-        return max(damaging_moves, key=lambda m: m.power)
+        best = None
+        best_power = 0
+        for move in self.moves:
+            power = move.power
+            if power > best_power and move.pp > 0:
+                best_power = power
+                best = move
+        return best
 
     def has_usable_moves(self) -> bool:
         """Check if any moves have PP remaining."""
         return any(m.pp > 0 for m in self.moves)
 
 
-@dataclass
+@dataclass(slots=True)
 class PokemonParty:
     """
     The player's party of Pokemon.
@@ -519,38 +635,53 @@ class PokemonParty:
         """Get the first Pokemon in the party."""
         return self.pokemon[0] if self.pokemon else None
 
+    # The aggregates below read hp/max_hp directly rather than going through
+    # the is_fainted/hp_percentage properties; they run from per-frame state
+    # checks.
+
     @property
     def first_healthy(self) -> Optional[Pokemon]:
         """Get the first non-fainted Pokemon."""
         for mon in self.pokemon:
-            if not mon.is_fainted:
+            if mon.hp > 0:
                 return mon
         return None
 
     @property
     def all_fainted(self) -> bool:
         """Check if all Pokemon have fainted (blackout)."""
-        return all(mon.is_fainted for mon in self.pokemon)
+        for mon in self.pokemon:
+            if mon.hp > 0:
+                return False
+        return True
 
     @property
     def healthy_count(self) -> int:
         """Count non-fainted Pokemon."""
-        return sum(1 for mon in self.pokemon if not mon.is_fainted)
+        count = 0
+        for mon in self.pokemon:
+            if mon.hp > 0:
+                count += 1
+        return count
 
     def needs_healing(self, threshold: float = 50.0) -> bool:
         """Check if any Pokemon needs healing (below threshold %)."""
-        return any(
-            mon.hp_percentage < threshold
-            for mon in self.pokemon
-            if not mon.is_fainted
-        )
+        for mon in self.pokemon:
+            hp = mon.hp
+            if hp <= 0:
+                continue
+            max_hp = mon.max_hp
+            hp_pct = (hp / max_hp) * 100 if max_hp > 0 else 0.0
+            if hp_pct < threshold:
+                return True
+        return False
 
     def get_pokemon_with_ability(self, ability: Ability) -> list[Pokemon]:
         """Get all Pokemon with a specific ability."""
         return [mon for mon in self.pokemon if mon.ability == ability]
 
 
-@dataclass
+@dataclass(slots=True)
 class BattleState:
     """
     Current state of a battle (Gen 3).
@@ -596,30 +727,27 @@ class BattleState:
 
         Simple heuristic based on HP percentages and speed.
         """
-        if not self.player_pokemon or not self.enemy_pokemon:
+        player_pokemon = self.player_pokemon
+        enemy_pokemon = self.enemy_pokemon
+        if not player_pokemon or not enemy_pokemon:
             return 0.0
 
-        player = self.player_lead
-        enemy = self.enemy_lead
-
+        player = player_pokemon[0]
+        enemy = enemy_pokemon[0]
         if not player or not enemy:
             return 0.0
 
-        player_hp_pct = player.hp_percentage
-        enemy_hp_pct = enemy.hp_percentage
-
-        # HP advantage
-        hp_advantage = player_hp_pct - enemy_hp_pct
+        # HP advantage (hp_percentage inlined)
+        max_hp = player.max_hp
+        player_hp_pct = (player.hp / max_hp) * 100 if max_hp > 0 else 0.0
+        max_hp = enemy.max_hp
+        enemy_hp_pct = (enemy.hp / max_hp) * 100 if max_hp > 0 else 0.0
 
         # Speed advantage (who goes first)
         speed_advantage = 10 if player.speed > enemy.speed else -10
 
-        return hp_advantage + speed_advantage
+        return player_hp_pct - enemy_hp_pct + speed_advantage
 
     def get_active_weather_boost(self, pokemon: Pokemon) -> float:
         """Get speed multiplier from weather-based abilities."""
-        if self.weather == Weather.RAIN and pokemon.ability == Ability.SWIFT_SWIM:
-            return 2.0
-        if self.weather == Weather.SUN and pokemon.ability == Ability.CHLOROPHYLL:
-            return 2.0
-        return 1.0
+        return _WEATHER_SPEED_BOOST.get((self.weather, pokemon.ability), 1.0)
@@ -6,15 +6,27 @@ Data source: pret/pokeemerald disassembly
 https://github.com/pret/pokeemerald
 """
 
-from typing import Dict, Tuple, Optional, TypedDict
+import functools
+from typing import Dict, NamedTuple, Tuple, Optional
 
+# LocationData.flags bits
+GYM = 0x1
+POKE_CENTER = 0x2
 
-class LocationData(TypedDict):
+
+class LocationData(NamedTuple):
     """Metadata for a Pokemon Emerald location."""
     name: str
     type: str  # "city", "town", "route", "dungeon", "indoor"
-    gym: bool
-    poke_center: bool
+    flags: int  # GYM | POKE_CENTER
+
+    @property
+    def gym(self) -> bool:
+        return (self.flags & GYM) != 0
+
+    @property
+    def poke_center(self) -> bool:
+        return (self.flags & POKE_CENTER) != 0
 
 
 # Map (group, num) tuples to location data
@@ -25,115 +37,122 @@ EMERALD_MAPS: Dict[Tuple[int, int], LocationData] = {
     # Early game path: Littleroot → Route 101 → Oldale → Route 103/102 → Petalburg → Woods → Rustboro
     
     # Towns (Early Game)
-    (0, 9): {"name": "Littleroot Town", "type": "town", "gym": False, "poke_center": False},
-    (0, 10): {"name": "Oldale Town", "type": "town", "gym": False, "poke_center": True},
-    (0, 11): {"name": "Dewford Town", "type": "town", "gym": True, "poke_center": True},
-    (0, 12): {"name": "Lavaridge Town", "type": "town", "gym": True, "poke_center": True},
-    (0, 13): {"name": "Fallarbor Town", "type": "town", "gym": False, "poke_center": True},
-    (0, 14): {"name": "Verdanturf Town", "type": "town", "gym": False, "poke_center": True},
-    (0, 15): {"name": "Pacifidlog Town", "type": "town", "gym": False, "poke_center": True},
+    (0, 9): LocationData("Littleroot Town", "town", 0),
+    (0, 10): LocationData("Oldale Town", "town", POKE_CENTER),
+    (0, 11): LocationData("Dewford Town", "town", GYM | POKE_CENTER),
+    (0, 12): LocationData("Lavaridge Town", "town", GYM | POKE_CENTER),
+    (0, 13): LocationData("Fallarbor Town", "town", POKE_CENTER),
+    (0, 14): LocationData("Verdanturf Town", "town", POKE_CENTER),
+    (0, 15): LocationData("Pacifidlog Town", "town", POKE_CENTER),
     
     # Cities (Gym Locations)
-    (0, 0): {"name": "Petalburg City", "type": "city", "gym": True, "poke_center": True},
-    (0, 1): {"name": "Slateport City", "type": "city", "gym": False, "poke_center": True},
-    (0, 2): {"name": "Mauville City", "type": "city", "gym": True, "poke_center": True},
-    (0, 3): {"name": "Rustboro City", "type": "city", "gym": True, "poke_center": True},
-    (0, 4): {"name": "Fortree City", "type": "city", "gym": True, "poke_center": True},
-    (0, 5): {"name": "Lilycove City", "type": "city", "gym": False, "poke_center": True},
-    (0, 6): {"name": "Mossdeep City", "type": "city", "gym": True, "poke_center": True},
-    (0, 7): {"name": "Sootopolis City", "type": "city", "gym": True, "poke_center": True},
-    (0, 8): {"name": "Ever Grande City", "type": "city", "gym": False, "poke_center": True},
+    (0, 0): LocationData("Petalburg City", "city", GYM | POKE_CENTER),
+    (0, 1): LocationData("Slateport City", "city", POKE_CENTER),
+    (0, 2): LocationData("Mauville City", "city", GYM | POKE_CENTER),
+    (0, 3): LocationData("Rustboro City", "city", GYM | POKE_CENTER),
+    (0, 4): LocationData("Fortree City", "city", GYM | POKE_CENTER),
+    (0, 5): LocationData("Lilycove City", "city", POKE_CENTER),
+    (0, 6): LocationData("Mossdeep City", "city", GYM | POKE_CENTER),
+    (0, 7): LocationData("Sootopolis City", "city", GYM | POKE_CENTER),
+    (0, 8): LocationData("Ever Grande City", "city", POKE_CENTER),
     
     # Routes (Early Game - First 10)
-    (0, 16): {"name": "Route 101", "type": "route", "gym": False, "poke_center": False},
-    (0, 17): {"name": "Route 102", "type": "route", "gym": False, "poke_center": False},
-    (0, 18): {"name": "Route 103", "type": "route", "gym": False, "poke_center": False},
-    (0, 19): {"name": "Route 104", "type": "route", "gym": False, "poke_center": False},
-    (0, 20): {"name": "Route 105", "type": "route", "gym": False, "poke_center": False},
-    (0, 21): {"name": "Route 106", "type": "route", "gym": False, "poke_center": False},
-    (0, 22): {"name": "Route 107", "type": "route", "gym": False, "poke_center": False},
-    (0, 23): {"name": "Route 108", "type": "route", "gym": False, "poke_center": False},
-    (0, 24): {"name": "Route 109", "type": "route", "gym": False, "poke_center": False},
-    (0, 25): {"name": "Route 110", "type": "route", "gym": False, "poke_center": False},
+    (0, 16): LocationData("Route 101", "route", 0),
+    (0, 17): LocationData("Route 102", "route", 0),
+    (0, 18): LocationData("Route 103", "route", 0),
+    (0, 19): LocationData("Route 104", "route", 0),
+    (0, 20): LocationData("Route 105", "route", 0),
+    (0, 21): LocationData("Route 106", "route", 0),
+    (0, 22): LocationData("Route 107", "route", 0),
+    (0, 23): LocationData("Route 108", "route", 0),
+    (0, 24): LocationData("Route 109", "route", 0),
+    (0, 25): LocationData("Route 110", "route", 0),
     
     # Routes (Mid Game)
-    (0, 26): {"name": "Route 111", "type": "route", "gym": False, "poke_center": False},
-    (0, 27): {"name": "Route 112", "type": "route", "gym": False, "poke_center": False},
-    (0, 28): {"name": "Route 113", "type": "route", "gym": False, "poke_center": False},
-    (0, 29): {"name": "Route 114", "type": "route", "gym": False, "poke_center": False},
-    (0, 30): {"name": "Route 115", "type": "route", "gym": False, "poke_center": False},
-    (0, 31): {"name": "Route 116", "type": "route", "gym": False, "poke_center": False},
-    (0, 32): {"name": "Route 117", "type": "route", "gym": False, "poke_center": False},
-    (0, 33): {"name": "Route 118", "type": "route", "gym": False, "poke_center": False},
-    (0, 34): {"name": "Route 119", "type": "route", "gym": False, "poke_center": False},
-    (0, 35): {"name": "Route 120", "type": "route", "gym": False, "poke_center": False},
-    (0, 36): {"name": "Route 121", "type": "route", "gym": False, "poke_center": False},
-    (0, 37): {"name": "Route 122", "type": "route", "gym": False, "poke_center": False},
-    (0, 38): {"name": "Route 123", "type": "route", "gym": False, "poke_center": False},
-    (0, 39): {"name": "Route 124", "type": "route", "gym": False, "poke_center": False},
-    (0, 40): {"name": "Route 125", "type": "route", "gym": False, "poke_center": False},
-    (0, 41): {"name": "Route 126", "type": "route", "gym": False, "poke_center": False},
-    (0, 42): {"name": "Route 127", "type": "route", "gym": False, "poke_center": False},
-    (0, 43): {"name": "Route 128", "type": "route", "gym": False, "poke_center": False},
-    (0, 44): {"name": "Route 129", "type": "route", "gym": False, "poke_center": False},
-    (0, 45): {"name": "Route 130", "type": "route", "gym": False, "poke_center": False},
-    (0, 46): {"name": "Route 131", "type": "route", "gym": False, "poke_center": False},
-    (0, 47): {"name": "Route 132", "type": "route", "gym": False, "poke_center": False},
-    (0, 48): {"name": "Route 133", "type": "route", "gym": False, "poke_center": False},
-    (0, 49): {"name": "Route 134", "type": "route", "gym": False, "poke_center": False},
+    (0, 26): LocationData("Route 111", "route", 0),
+    (0, 27): LocationData("Route 112", "route", 0),
+    (0, 28): LocationData("Route 113", "route", 0),
+    (0, 29): LocationData("Route 114", "route", 0),
+    (0, 30): LocationData("Route 115", "route", 0),
+    (0, 31): LocationData("Route 116", "route", 0),
+    (0, 32): LocationData("Route 117", "route", 0),
+    (0, 33): LocationData("Route 118", "route", 0),
+    (0, 34): LocationData("Route 119", "route", 0),
+    (0, 35): LocationData("Route 120", "route", 0),
+    (0, 36): LocationData("Route 121", "route", 0),
+    (0, 37): LocationData("Route 122", "route", 0),
+    (0, 38): LocationData("Route 123", "route", 0),
+    (0, 39): LocationData("Route 124", "route", 0),
+    (0, 40): LocationData("Route 125", "route", 0),
+    (0, 41): LocationData("Route 126", "route", 0),
+    (0, 42): LocationData("Route 127", "route", 0),
+    (0, 43): LocationData("Route 128", "route", 0),
+    (0, 44): LocationData("Route 129", "route", 0),
+    (0, 45): LocationData("Route 130", "route", 0),
+    (0, 46): LocationData("Route 131", "route", 0),
+    (0, 47): LocationData("Route 132", "route", 0),
+    (0, 48): LocationData("Route 133", "route", 0),
+    (0, 49): LocationData("Route 134", "route", 0),
     
     # Underwater Routes
-    (0, 50): {"name": "Underwater Route 124", "type": "route", "gym": False, "poke_center": False},
-    (0, 51): {"name": "Underwater Route 126", "type": "route", "gym": False, "poke_center": False},
-    (0, 52): {"name": "Underwater Route 127", "type": "route", "gym": False, "poke_center": False},
-    (0, 53): {"name": "Underwater Route 128", "type": "route", "gym": False, "poke_center": False},
-    (0, 54): {"name": "Underwater Route 129", "type": "route", "gym": False, "poke_center": False},
-    (0, 55): {"name": "Underwater Route 105", "type": "route", "gym": False, "poke_center": False},
-    (0, 56): {"name": "Underwater Route 125", "type": "route", "gym": False, "poke_center": False},
+    (0, 50): LocationData("Underwater Route 124", "route", 0),
+    (0, 51): LocationData("Underwater Route 126", "route", 0),
+    (0, 52): LocationData("Underwater Route 127", "route", 0),
+    (0, 53): LocationData("Underwater Route 128", "route", 0),
+    (0, 54): LocationData("Underwater Route 129", "route", 0),
+    (0, 55): LocationData("Underwater Route 105", "route", 0),
+    (0, 56): LocationData("Underwater Route 125", "route", 0),
     
     # ===== GROUP 1: INDOOR LITTLEROOT =====
-    (1, 0): {"name": "Littleroot Town - Brendan's House 1F", "type": "indoor", "gym": False, "poke_center": False},
-    (1, 1): {"name": "Littleroot Town - Brendan's House 2F", "type": "indoor", "gym": False, "poke_center": False},
-    (1, 2): {"name": "Littleroot Town - May's House 1F", "type": "indoor", "gym": False, "poke_center": False},
-    (1, 3): {"name": "Littleroot Town - May's House 2F", "type": "indoor", "gym": False, "poke_center": False},
-    (1, 4): {"name": "Littleroot Town - Professor Birch's Lab", "type": "indoor", "gym": False, "poke_center": False},
+    (1, 0): LocationData("Littleroot Town - Brendan's House 1F", "indoor", 0),
+    (1, 1): LocationData("Littleroot Town - Brendan's House 2F", "indoor", 0),
+    (1, 2): LocationData("Littleroot Town - May's House 1F", "indoor", 0),
+    (1, 3): LocationData("Littleroot Town - May's House 2F", "indoor", 0),
+    (1, 4): LocationData("Littleroot Town - Professor Birch's Lab", "indoor", 0),
     
     # ===== GROUP 2: INDOOR OLDALE =====
-    (2, 0): {"name": "Oldale Town - House 1", "type": "indoor", "gym": False, "poke_center": False},
-    (2, 1): {"name": "Oldale Town - House 2", "type": "indoor", "gym": False, "poke_center": False},
-    (2, 2): {"name": "Oldale Town - Pokemon Center 1F", "type": "indoor", "gym": False, "poke_center": True},
-    (2, 3): {"name": "Oldale Town - Pokemon Center 2F", "type": "indoor", "gym": False, "poke_center": True},
-    (2, 4): {"name": "Oldale Town - Mart", "type": "indoor", "gym": False, "poke_center": False},
+    (2, 0): LocationData("Oldale Town - House 1", "indoor", 0),
+    (2, 1): LocationData("Oldale Town - House 2", "indoor", 0),
+    (2, 2): LocationData("Oldale Town - Pokemon Center 1F", "indoor", POKE_CENTER),
+    (2, 3): LocationData("Oldale Town - Pokemon Center 2F", "indoor", POKE_CENTER),
+    (2, 4): LocationData("Oldale Town - Mart", "indoor", 0),
     
     # ===== GROUP 8: INDOOR PETALBURG =====
-    (8, 0): {"name": "Petalburg City - Wally's House", "type": "indoor", "gym": False, "poke_center": False},
-    (8, 1): {"name": "Petalburg City - Gym", "type": "indoor", "gym": True, "poke_center": False},
-    (8, 2): {"name": "Petalburg City - House 1", "type": "indoor", "gym": False, "poke_center": False},
-    (8, 3): {"name": "Petalburg City - House 2", "type": "indoor", "gym": False, "poke_center": False},
-    (8, 4): {"name": "Petalburg City - Pokemon Center 1F", "type": "indoor", "gym": False, "poke_center": True},
-    (8, 5): {"name": "Petalburg City - Pokemon Center 2F", "type": "indoor", "gym": False, "poke_center": True},
-    (8, 6): {"name": "Petalburg City - Mart", "type": "indoor", "gym": False, "poke_center": False},
+    (8, 0): LocationData("Petalburg City - Wally's House", "indoor", 0),
+    (8, 1): LocationData("Petalburg City - Gym", "indoor", GYM),
+    (8, 2): LocationData("Petalburg City - House 1", "indoor", 0),
+    (8, 3): LocationData("Petalburg City - House 2", "indoor", 0),
+    (8, 4): LocationData("Petalburg City - Pokemon Center 1F", "indoor", POKE_CENTER),
+    (8, 5): LocationData("Petalburg City - Pokemon Center 2F", "indoor", POKE_CENTER),
+    (8, 6): LocationData("Petalburg City - Mart", "indoor", 0),
     
     # ===== GROUP 11: INDOOR RUSTBORO =====
-    (11, 0): {"name": "Rustboro City - Devon Corp 1F", "type": "indoor", "gym": False, "poke_center": False},
-    (11, 1): {"name": "Rustboro City - Devon Corp 2F", "type": "indoor", "gym": False, "poke_center": False},
-    (11, 2): {"name": "Rustboro City - Devon Corp 3F", "type": "indoor", "gym": False, "poke_center": False},
-    (11, 3): {"name": "Rustboro City - Gym", "type": "indoor", "gym": True, "poke_center": False},
-    (11, 4): {"name": "Rustboro City - Pokemon School", "type": "indoor", "gym": False, "poke_center": False},
-    (11, 5): {"name": "Rustboro City - Pokemon Center 1F", "type": "indoor", "gym": False, "poke_center": True},
-    (11, 6): {"name": "Rustboro City - Pokemon Center 2F", "type": "indoor", "gym": False, "poke_center": True},
-    (11, 7): {"name": "Rustboro City - Mart", "type": "indoor", "gym": False, "poke_center": False},
+    (11, 0): LocationData("Rustboro City - Devon Corp 1F", "indoor", 0),
+    (11, 1): LocationData("Rustboro City - Devon Corp 2F", "indoor", 0),
+    (11, 2): LocationData("Rustboro City - Devon Corp 3F", "indoor", 0),
+    (11, 3): LocationData("Rustboro City - Gym", "indoor", GYM),
+    (11, 4): LocationData("Rustboro City - Pokemon School", "indoor", 0),
+    (11, 5): LocationData("Rustboro City - Pokemon Center 1F", "indoor", POKE_CENTER),
+    (11, 6): LocationData("Rustboro City - Pokemon Center 2F", "indoor", POKE_CENTER),
+    (11, 7): LocationData("Rustboro City - Mart", "indoor", 0),
     
     # ===== GROUP 24: DUNGEONS (Early Game) =====
-    (24, 11): {"name": "Petalburg Woods", "type": "dungeon", "gym": False, "poke_center": False},
-    (24, 4): {"name": "Rusturf Tunnel", "type": "dungeon", "gym": False, "poke_center": False},
-    (24, 7): {"name": "Granite Cave 1F", "type": "dungeon", "gym": False, "poke_center": False},
-    (24, 8): {"name": "Granite Cave B1F", "type": "dungeon", "gym": False, "poke_center": False},
-    (24, 9): {"name": "Granite Cave B2F", "type": "dungeon", "gym": False, "poke_center": False},
-    (24, 10): {"name": "Granite Cave - Steven's Room", "type": "dungeon", "gym": False, "poke_center": False},
+    (24, 11): LocationData("Petalburg Woods", "dungeon", 0),
+    (24, 4): LocationData("Rusturf Tunnel", "dungeon", 0),
+    (24, 7): LocationData("Granite Cave 1F", "dungeon", 0),
+    (24, 8): LocationData("Granite Cave B1F", "dungeon", 0),
+    (24, 9): LocationData("Granite Cave B2F", "dungeon", 0),
+    (24, 10): LocationData("Granite Cave - Steven's Room", "dungeon", 0),
+}
+
+# EMERALD_MAPS keyed by (group << 8) | num, so lookups hash one int instead
+# of building a tuple. Map numbers are single bytes in game memory.
+_EMERALD_FLAT: Dict[int, LocationData] = {
+    (group << 8) | num: location for (group, num), location in EMERALD_MAPS.items()
 }
 
 
+@functools.lru_cache(maxsize=512)
 def get_location_name(group: int, num: int) -> str:
     """
     Get human-readable location name from map group and number.
@@ -153,9 +172,9 @@ def get_location_name(group: int, num: int) -> str:
         >>> get_location_name(24, 11)
         'Petalburg Woods'
     """
-    location = EMERALD_MAPS.get((group, num))
+    location = _EMERALD_FLAT.get((group << 8) | num)
     if location:
-        return location["name"]
+        return location.name
     return f"Unknown Location (Group {group}, Map {num})"
 
 
@@ -168,31 +187,31 @@ def get_location_data(group: int, num: int) -> Optional[LocationData]:
         num: Map number within group
         
     Returns:
-        LocationData dict with name, type, gym, and poke_center fields,
+        LocationData with name, type, and flags (GYM | POKE_CENTER),
         or None if location not found
         
     Example:
         >>> data = get_location_data(0, 0)
-        >>> data['name']
+        >>> data.name
         'Petalburg City'
-        >>> data['gym']
+        >>> data.gym
         True
-        >>> data['poke_center']
+        >>> data.poke_center
         True
     """
-    return EMERALD_MAPS.get((group, num))
+    return _EMERALD_FLAT.get((group << 8) | num)
 
 
 def has_pokemon_center(group: int, num: int) -> bool:
     """Check if a location has a Pokemon Center."""
-    location = EMERALD_MAPS.get((group, num))
-    return location["poke_center"] if location else False
+    location = _EMERALD_FLAT.get((group << 8) | num)
+    return (location.flags & POKE_CENTER) != 0 if location else False
 
 
 def has_gym(group: int, num: int) -> bool:
     """Check if a location has a Gym."""
-    location = EMERALD_MAPS.get((group, num))
-    return location["gym"] if location else False
+    location = _EMERALD_FLAT.get((group << 8) | num)
+    return (location.flags & GYM) != 0 if location else False
 
 
 # Early game progression path for reference
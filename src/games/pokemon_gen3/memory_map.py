@@ -36,11 +36,15 @@ Verification Status:
 - LeafGreen (BPGE): Same as FireRed
 """
 
-from dataclasses import dataclass
-from typing import ClassVar
+import struct
+from typing import ClassVar, NamedTuple, TYPE_CHECKING
+
+from .map_data import EMERALD_MAPS
+
+if TYPE_CHECKING:
+    from ...emulator.bizhawk_client import BizHawkClient
 
 
-@dataclass(frozen=True)
 class PokemonGen3Memory:
     """
     Memory addresses for Pokemon Gen 3 (GBA).
@@ -53,6 +57,9 @@ class PokemonGen3Memory:
     to properly read dynamic data.
     """
 
+    # Pure namespace of class-level constants; nothing is stored per instance
+    __slots__ = ()
+
     # =========================================================================
     # STATIC ADDRESSES (Always Valid - Read These Directly)
     # =========================================================================
@@ -333,6 +340,9 @@ class PokemonGen3Memory:
     # MAP CONSTANTS (Hoenn - Emerald)
     # =========================================================================
 
+    # (group, num) tuples, as returned by get_map_location(); values match
+    # EMERALD_MAPS in map_data
+
     # Map group 0: Towns/Cities
     MAP_PETALBURG_CITY: ClassVar[tuple] = (0, 0)
     MAP_SLATEPORT_CITY: ClassVar[tuple] = (0, 1)
@@ -343,13 +353,13 @@ class PokemonGen3Memory:
     MAP_MOSSDEEP_CITY: ClassVar[tuple] = (0, 6)
     MAP_SOOTOPOLIS_CITY: ClassVar[tuple] = (0, 7)
     MAP_EVER_GRANDE_CITY: ClassVar[tuple] = (0, 8)
-    MAP_LITTLEROOT_TOWN: ClassVar[tuple] = (1, 0)
-    MAP_OLDALE_TOWN: ClassVar[tuple] = (1, 1)
-    MAP_DEWFORD_TOWN: ClassVar[tuple] = (1, 2)
-    MAP_LAVARIDGE_TOWN: ClassVar[tuple] = (1, 3)
-    MAP_FALLARBOR_TOWN: ClassVar[tuple] = (1, 4)
-    MAP_VERDANTURF_TOWN: ClassVar[tuple] = (1, 5)
-    MAP_PACIFIDLOG_TOWN: ClassVar[tuple] = (1, 6)
+    MAP_LITTLEROOT_TOWN: ClassVar[tuple] = (0, 9)
+    MAP_OLDALE_TOWN: ClassVar[tuple] = (0, 10)
+    MAP_DEWFORD_TOWN: ClassVar[tuple] = (0, 11)
+    MAP_LAVARIDGE_TOWN: ClassVar[tuple] = (0, 12)
+    MAP_FALLARBOR_TOWN: ClassVar[tuple] = (0, 13)
+    MAP_VERDANTURF_TOWN: ClassVar[tuple] = (0, 14)
+    MAP_PACIFIDLOG_TOWN: ClassVar[tuple] = (0, 15)
 
     # Routes
     # Routes (map group 0 = outdoor/towns/routes)
@@ -375,6 +385,8 @@ class PokemonEmeraldMemory(PokemonGen3Memory):
     Uses the base Gen 3 addresses defined above.
     """
 
+    __slots__ = ()
+
     # Emerald uses the same pointer addresses as base class
     # Battle Frontier specific addresses could be added here
 
@@ -390,6 +402,8 @@ class PokemonRubyMemory(PokemonGen3Memory):
     Some pointers differ from Emerald.
     """
 
+    __slots__ = ()
+
     # Ruby has different pointer locations
     SAVE_BLOCK_1_PTR: ClassVar[int] = 0x03005D90      # Different from Emerald
     SAVE_BLOCK_2_PTR: ClassVar[int] = 0x03005D94
@@ -407,7 +421,7 @@ class PokemonSapphireMemory(PokemonRubyMemory):
     Game Code: AXPE
     Shares memory layout with Ruby.
     """
-    pass  # Same as Ruby
+    __slots__ = ()  # Same as Ruby
 
 
 class PokemonFireRedMemory(PokemonGen3Memory):
@@ -418,6 +432,8 @@ class PokemonFireRedMemory(PokemonGen3Memory):
     FRLG have a different memory layout from RSE.
     """
 
+    __slots__ = ()
+
     # FireRed/LeafGreen have different pointer addresses
     SAVE_BLOCK_1_PTR: ClassVar[int] = 0x03005008
     SAVE_BLOCK_2_PTR: ClassVar[int] = 0x0300500C
@@ -435,13 +451,296 @@ class PokemonLeafGreenMemory(PokemonFireRedMemory):
     Game Code: BPGE
     Shares memory layout with FireRed.
     """
-    pass  # Same as FireRed
+    __slots__ = ()  # Same as FireRed
+
+
+# =============================================================================
+# RESOLVED PER-GAME LAYOUT
+# =============================================================================
+
+class GameLayout(NamedTuple):
+    """
+    The addresses that differ between games (plus the per-tick direct
+    addresses), resolved once for the running game.
+
+    Attribute names match the memory classes above, so a GameLayout can be
+    passed anywhere those addresses are read off a memory class.
+    """
+
+    SAVE_BLOCK_1_PTR: int
+    SAVE_BLOCK_2_PTR: int
+    POKEMON_STORAGE_PTR: int
+    BATTLE_TYPE_FLAGS: int
+    BATTLE_MONS: int
+    BATTLE_WEATHER: int
+    CALLBACK1: int
+    CALLBACK2: int
+    TEXT_PRINTERS: int
+
+    @classmethod
+    def from_memory_class(cls, memory_class: type) -> "GameLayout":
+        return cls._make(getattr(memory_class, name) for name in cls._fields)
+
+
+# ROM header game code -> resolved layout
+_LAYOUTS: dict[str, GameLayout] = {
+    code: GameLayout.from_memory_class(memory_class)
+    for code, memory_class in (
+        ("BPEE", PokemonEmeraldMemory),
+        ("AXVE", PokemonRubyMemory),
+        ("AXPE", PokemonSapphireMemory),
+        ("BPRE", PokemonFireRedMemory),
+        ("BPGE", PokemonLeafGreenMemory),
+    )
+}
+
+
+def load_layout(game_code: str) -> GameLayout:
+    """
+    Get the resolved layout for a game code (e.g. "BPEE").
+
+    Unknown codes fall back to the Emerald layout, matching the rest of the
+    code base which assumes Emerald by default.
+    """
+    return _LAYOUTS.get(game_code, _LAYOUTS["BPEE"])
+
+
+# =============================================================================
+# STRUCT LAYOUTS
+# =============================================================================
+
+class BattleMonRecord(NamedTuple):
+    """Hot fields of one battle mon struct, in BATTLE_MON_STRUCT order."""
+
+    species: int
+    attack: int
+    defense: int
+    speed: int
+    sp_attack: int
+    sp_defense: int
+    move1: int
+    move2: int
+    move3: int
+    move4: int
+    ability: int
+    type1: int
+    type2: int
+    pp1: int
+    pp2: int
+    pp3: int
+    pp4: int
+    hp: int
+    level: int
+    max_hp: int
+    status: int
+
+
+# The 88-byte battle mon struct (BATTLE_MON_SIZE) as one Struct, matching
+# the BATTLE_MON_*_OFFSET values: species + stats @ 0x00, moves @ 0x0C,
+# ability/types @ 0x20, PP @ 0x24, HP @ 0x28, level @ 0x2A, max HP @ 0x2C,
+# status @ 0x4C. Pad bytes cover IVs, stat stages, nickname etc.
+BATTLE_MON_STRUCT = struct.Struct("<6H4H12x3Bx4BHBxH30xI8x")
+
+
+def unpack_battle_mon(buf: bytes, offset: int = 0) -> BattleMonRecord:
+    """
+    Unpack one battle mon struct in a single call.
+
+    Args:
+        buf: Buffer holding the struct (e.g. all of BATTLE_MONS from one read)
+        offset: Byte offset of the struct within buf
+
+    Raises:
+        struct.error: If buf holds fewer than BATTLE_MON_SIZE bytes at offset
+    """
+    return BattleMonRecord._make(BATTLE_MON_STRUCT.unpack_from(buf, offset))
+
+
+# Party: six 100-byte slots back to back from PARTY_DATA_OFFSET in Save Block 1
+PARTY_BLOB_SIZE = PokemonGen3Memory.PARTY_POKEMON_SIZE * 6
+
+# Calculated section of a party slot from PKM_STATUS_OFFSET: status, level,
+# (Pokerus), current HP, max HP, Attack, Defense, Speed, Sp. Atk, Sp. Def
+PARTY_MON_STATS = struct.Struct("<IBx7H")
+
+# Whole party slot in one unpack: the IDs, the encrypted nickname/data
+# block skipped as padding, then the calculated section as in PARTY_MON_STATS
+PARTY_MON_STRUCT = struct.Struct("<II72xIBx7H")
+
+
+def read_party_blob(client: "BizHawkClient", save_block_1: int) -> bytes:
+    """
+    Read all six party slots with a single memory read.
+
+    Args:
+        client: Emulator client
+        save_block_1: Dereferenced Save Block 1 base address
+
+    Returns:
+        PARTY_BLOB_SIZE bytes; slot i starts at i * PARTY_POKEMON_SIZE
+    """
+    return client.read_range(save_block_1 + PokemonGen3Memory.PARTY_DATA_OFFSET,
+                             PARTY_BLOB_SIZE)
+
+
+# =============================================================================
+# SAVE BLOCK RESOLUTION
+# =============================================================================
+
+# EWRAM spans 0x02000000-0x0203FFFF; dereferenced save block pointers must
+# land inside it. The region is 256 KiB and 256 KiB-aligned, so membership is
+# a single shift-and-compare
+_EWRAM_SHIFT = 18
+_EWRAM_BLOCK = 0x02000000 >> _EWRAM_SHIFT
+
+
+def in_ewram(address: int) -> bool:
+    """True if address lies in EWRAM (0x02000000-0x0203FFFF)."""
+    return address >> _EWRAM_SHIFT == _EWRAM_BLOCK
+
+
+def options_byte_addr(save_block_2: int) -> int:
+    """Address of the game options byte (text speed, battle scene/style)."""
+    return save_block_2 + PokemonGen3Memory.OPTIONS_OFFSET
+
+
+# =============================================================================
+# EVENT FLAG HELPERS
+# =============================================================================
+
+# Badge flags 0x807-0x80E straddle two event-flag bytes starting at this index
+BADGE_FLAGS_BYTE = PokemonGen3Memory.BADGE_FLAG_BASE >> 3
+_BADGE_FLAGS_SHIFT = PokemonGen3Memory.BADGE_FLAG_BASE & 7
+
+
+def badge_mask(flag_bytes: bytes, offset: int = BADGE_FLAGS_BYTE) -> int:
+    """
+    Get all eight badge flags as one bitfield.
+
+    Args:
+        flag_bytes: Event flag bytes (from EVENT_FLAGS_OFFSET in Save Block 1)
+        offset: Index of BADGE_FLAGS_BYTE within flag_bytes; pass 0 when
+            only the two badge bytes were read
+
+    Returns:
+        Bit 0 = Stone Badge ... bit 7 = Rain Badge
+    """
+    word = flag_bytes[offset] | (flag_bytes[offset + 1] << 8)
+    return (word >> _BADGE_FLAGS_SHIFT) & 0xFF
+
+
+def count_badges(flag_bytes: bytes, offset: int = BADGE_FLAGS_BYTE) -> int:
+    """Number of badges obtained (0-8); arguments as for badge_mask()."""
+    return badge_mask(flag_bytes, offset).bit_count()
+
+
+def _build_flag_bits() -> dict[int, tuple[int, int]]:
+    """(byte index, bit mask) for every named FLAG_* constant and badge flag."""
+    flag_ids = [
+        value for name, value in vars(PokemonGen3Memory).items()
+        if name.startswith("FLAG_")
+    ]
+    flag_ids += range(PokemonGen3Memory.BADGE_FLAG_BASE, PokemonGen3Memory.BADGE_FLAG_BASE + 8)
+    return {flag_id: (flag_id >> 3, 1 << (flag_id & 7)) for flag_id in flag_ids}
+
+
+# Precomputed (byte index, bit mask) per known flag ID
+_FLAG_BITS: dict[int, tuple[int, int]] = _build_flag_bits()
+
+
+def flag_bit(flag_id: int) -> tuple[int, int]:
+    """(byte index, bit mask) of a flag within the event flag array."""
+    bit = _FLAG_BITS.get(flag_id)
+    if bit is None:
+        return flag_id >> 3, 1 << (flag_id & 7)
+    return bit
+
+
+def flag_set(flag_bytes: bytes, flag_id: int, offset: int = 0) -> bool:
+    """
+    Check one event flag.
+
+    Args:
+        flag_bytes: Event flag bytes
+        flag_id: Flag ID (e.g., Mem.FLAG_SYS_CLOCK_SET)
+        offset: Added to the flag's byte index; pass -start when flag_bytes
+            was read starting at flag byte start
+    """
+    byte_index, mask = flag_bit(flag_id)
+    return bool(flag_bytes[byte_index + offset] & mask)
+
+
+# Legendary caught flags in legendary_mask() bit order (ascending flag ID, so
+# flags sharing a byte map onto adjacent output bits)
+LEGENDARY_FLAGS: tuple[int, ...] = (
+    PokemonGen3Memory.FLAG_HIDE_KYOGRE,
+    PokemonGen3Memory.FLAG_HIDE_GROUDON,
+    PokemonGen3Memory.FLAG_HIDE_RAYQUAZA,
+    PokemonGen3Memory.FLAG_CAUGHT_LATIAS,
+    PokemonGen3Memory.FLAG_CAUGHT_LATIOS,
+    PokemonGen3Memory.FLAG_CAUGHT_REGIROCK,
+    PokemonGen3Memory.FLAG_CAUGHT_REGICE,
+    PokemonGen3Memory.FLAG_CAUGHT_REGISTEEL,
+)
+
+# Span of flag bytes holding every legendary flag, for a single read_range
+LEGENDARY_FLAGS_START = LEGENDARY_FLAGS[0] >> 3
+LEGENDARY_FLAGS_LENGTH = (LEGENDARY_FLAGS[-1] >> 3) - LEGENDARY_FLAGS_START + 1
+
+
+def _build_legendary_spans() -> tuple[tuple[int, int, int, int], ...]:
+    """
+    Group LEGENDARY_FLAGS by flag byte.
+
+    Returns (byte index, bit mask, shift down, shift up) per byte, so that
+    ((byte & mask) >> down) << up places that byte's flags at their output
+    bits. Relies on each byte's flags being consecutive flag IDs.
+    """
+    spans = []
+    out_bit = 0
+    for flag_id in LEGENDARY_FLAGS:
+        byte_index, mask = _FLAG_BITS[flag_id]
+        if spans and spans[-1][0] == byte_index:
+            spans[-1][1] |= mask
+        else:
+            spans.append([byte_index, mask, flag_id & 7, out_bit])
+        out_bit += 1
+    return tuple(tuple(span) for span in spans)
+
+
+_LEGENDARY_SPANS = _build_legendary_spans()
+
+
+def legendary_mask(flag_bytes: bytes, offset: int = 0) -> int:
+    """
+    Get all legendary caught flags as one bitfield, one masked load per byte.
+
+    Args:
+        flag_bytes: Event flag bytes
+        offset: As for flag_set(); pass -LEGENDARY_FLAGS_START when only the
+            LEGENDARY_FLAGS_LENGTH bytes from LEGENDARY_FLAGS_START were read
+
+    Returns:
+        Bit i set when LEGENDARY_FLAGS[i] is set
+    """
+    mask = 0
+    for byte_index, bits, down, up in _LEGENDARY_SPANS:
+        mask |= ((flag_bytes[byte_index + offset] & bits) >> down) << up
+    return mask
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+# (group, num) of every Hoenn town and city, for a hashed membership check
+# on get_map_location() results
+HOENN_TOWNS: frozenset[tuple[int, int]] = frozenset(
+    location for location, data in EMERALD_MAPS.items()
+    if data.type in ("town", "city")
+)
+
+
 def get_nature_from_personality(personality: int) -> int:
     """
     Calculate nature from personality value.
@@ -454,6 +753,9 @@ def get_nature_from_personality(personality: int) -> int:
     Returns:
         Nature ID (0-24)
     """
+    # Plain modulo on purpose: CPython's int % is a single C op, while a
+    # reciprocal-multiply division promotes to a 64-bit product and measures
+    # several times slower
     return personality % 25
 
 
@@ -483,16 +785,12 @@ def get_gender_from_personality(personality: int, gender_threshold: int) -> int:
     Returns:
         0 = male, 1 = female, 2 = genderless
     """
-    if gender_threshold == 0:
-        return 0  # Always male
-    elif gender_threshold == 254:
-        return 1  # Always female
-    elif gender_threshold == 255:
-        return 2  # Genderless
-
-    # Gender byte is lowest byte of personality
-    gender_byte = personality & 0xFF
-    return 1 if gender_byte < gender_threshold else 0
+    # Branchless: the gender byte (lowest byte of personality) is compared
+    # against the threshold, which already yields male for threshold 0.
+    # 254 forces female and 255 (genderless) overrides both to 2.
+    female = ((personality & 0xFF) < gender_threshold) | (gender_threshold == 254)
+    genderless = gender_threshold == 255
+    return (female & (not genderless)) + 2 * genderless
 
 
 def is_shiny(personality: int, trainer_id: int) -> bool:
@@ -508,9 +806,6 @@ def is_shiny(personality: int, trainer_id: int) -> bool:
     Returns:
         True if shiny
     """
-    p_high = (personality >> 16) & 0xFFFF
-    p_low = personality & 0xFFFF
-    tid = trainer_id & 0xFFFF
-    sid = (trainer_id >> 16) & 0xFFFF
-
-    return ((tid ^ sid) ^ (p_high ^ p_low)) < 8
+    # Folded: XOR both words with their own high halves, then one mask
+    # drops the top 16 bits instead of splitting out four halves
+    return ((trainer_id ^ (trainer_id >> 16) ^ personality ^ (personality >> 16)) & 0xFFFF) < 8
@@ -9,17 +9,27 @@ CRITICAL: Gen 3 uses DMA protection. All dynamic data must be read through
 pointer chasing - read the pointer first, then add offsets.
 """
 
+import functools
 import logging
+import struct
 import time
 from enum import Enum, auto
-from typing import Optional, TYPE_CHECKING
+from typing import Iterable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ...emulator.bizhawk_client import BizHawkClient
 
-from .memory_map import PokemonGen3Memory as Mem
-from .data_types import Pokemon, Move, PokemonParty, Ability, Nature, PokemonType
-from ...data.move_data import enrich_move
+from .memory_map import (
+    PokemonGen3Memory as Mem, BADGE_FLAGS_BYTE, badge_mask, flag_bit,
+    LEGENDARY_FLAGS_START, LEGENDARY_FLAGS_LENGTH, legendary_mask, read_party_blob,
+    PARTY_MON_STRUCT, PARTY_BLOB_SIZE, unpack_battle_mon, in_ewram, GameLayout,
+    is_shiny,
+)
+from .data_types import (
+    Pokemon, PokemonParty, Ability, Nature,
+    type_from_byte, ability_from_byte, NATURE_BY_ID,
+)
+from ...data.move_data import make_move
 from ...data.species_data import get_species_name
 from .exceptions import (
     StateDetectorError,
@@ -29,6 +39,33 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Cache timestamps: monotonic so wall-clock jumps can't stale or expire them,
+# bound once so the per-tick hot path skips the module attribute lookup
+_monotonic = time.monotonic
+
+# Little-endian u32 for the battle flags and callback words in the frame batch
+_U32 = struct.Struct("<I")
+
+# Game state byte; reads 0xFF while the title screen is up
+_GAME_STATE_ADDR = 0x0300500C
+
+# Text printer "active" values 1-10 mean dialogue; larger values are
+# uninitialised memory rather than a render state
+_PRINTER_ACTIVE_MIN = 1
+_PRINTER_ACTIVE_MAX = 10
+
+# Bits of PokemonGen3StateDetector._flags
+_FLAG_POINTERS_VALID = 0x1   # Save block pointers read and inside EWRAM
+_FLAG_STATE_CHANGED = 0x2    # Last detect() moved to a new state
+
+# Offset of the first party slot within party_range(), past the count
+_PARTY_SLOTS_START = Mem.PARTY_DATA_OFFSET - Mem.PARTY_COUNT_OFFSET
+
+# Dialogue and options change on human timescales; repeat queries inside
+# these windows (seconds) reuse the last read
+_DIALOGUE_CACHE_TTL = 0.05
+_OPTIONS_CACHE_TTL = 5.0
+
 
 class PokemonGen3State(Enum):
     """
@@ -84,6 +121,50 @@ class PokemonGen3State(Enum):
     SAFARI_ZONE = auto()          # Safari Zone (not in battle)
 
 
+def _tick_cached(method):
+    """
+    Memoize a no-argument reader for the rest of the current tick.
+
+    Only active between begin_tick() calls; without them every call reads
+    memory as before.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        cache = self._tick_cache
+        if cache is None:
+            return method(self)
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = method(self)
+            return value
+
+    return wrapper
+
+
+# Bits of PokemonGen3StateDetector._state_flags: the state predicates behind
+# the in_*/is_* checks, precomputed per state
+_IN_BATTLE = 0x01
+_IN_DOUBLE_BATTLE = 0x02
+_IN_MENU = 0x04
+_IN_OVERWORLD = 0x08
+_IN_DIALOGUE = 0x10
+_IN_WILD_BATTLE = 0x20
+_IN_TRAINER_BATTLE = 0x40
+
+
+def _build_state_props(
+    groups: tuple[tuple[int, frozenset], ...]
+) -> dict[PokemonGen3State, int]:
+    """Predicate bits for every state, from (bit, member states) pairs."""
+    return {
+        state: sum(bit for bit, members in groups if state in members)
+        for state in PokemonGen3State
+    }
+
+
 class PokemonGen3StateDetector:
     """
     Detects the current game state in Pokemon Gen 3 games.
@@ -95,26 +176,154 @@ class PokemonGen3StateDetector:
     are current, as DMA can move data at any time.
     """
 
-    def __init__(self, client: "BizHawkClient", memory_class: type = Mem):
+    # State groups behind the in_*/is_* checks (folded into _STATE_PROPS)
+    _BATTLE_STATES = frozenset((
+        PokemonGen3State.BATTLE_WILD,
+        PokemonGen3State.BATTLE_TRAINER,
+        PokemonGen3State.BATTLE_DOUBLE_WILD,
+        PokemonGen3State.BATTLE_DOUBLE_TRAINER,
+        PokemonGen3State.BATTLE_SAFARI,
+        PokemonGen3State.BATTLE_TOWER,
+        PokemonGen3State.BATTLE_FRONTIER,
+        PokemonGen3State.BATTLE_LEGENDARY,
+        PokemonGen3State.BATTLE_MENU,
+        PokemonGen3State.BATTLE_FIGHT_MENU,
+        PokemonGen3State.BATTLE_BAG_MENU,
+        PokemonGen3State.BATTLE_POKEMON_MENU,
+        PokemonGen3State.BATTLE_TARGET_MENU,
+    ))
+
+    _DOUBLE_BATTLE_STATES = frozenset((
+        PokemonGen3State.BATTLE_DOUBLE_WILD,
+        PokemonGen3State.BATTLE_DOUBLE_TRAINER,
+    ))
+
+    _MENU_STATES = frozenset((
+        PokemonGen3State.MENU_START,
+        PokemonGen3State.MENU_POKEMON,
+        PokemonGen3State.MENU_BAG,
+        PokemonGen3State.MENU_POKEDEX,
+        PokemonGen3State.MENU_SAVE,
+        PokemonGen3State.MENU_OPTIONS,
+        PokemonGen3State.MENU_POKENAV,
+    ))
+
+    _WILD_BATTLE_STATES = frozenset((
+        PokemonGen3State.BATTLE_WILD,
+        PokemonGen3State.BATTLE_DOUBLE_WILD,
+    ))
+
+    _TRAINER_BATTLE_STATES = frozenset((
+        PokemonGen3State.BATTLE_TRAINER,
+        PokemonGen3State.BATTLE_DOUBLE_TRAINER,
+        PokemonGen3State.BATTLE_TOWER,
+        PokemonGen3State.BATTLE_FRONTIER,
+    ))
+
+    _STATE_PROPS = _build_state_props((
+        (_IN_BATTLE, _BATTLE_STATES),
+        (_IN_DOUBLE_BATTLE, _DOUBLE_BATTLE_STATES),
+        (_IN_MENU, _MENU_STATES),
+        (_IN_OVERWORLD, frozenset((PokemonGen3State.OVERWORLD,))),
+        (_IN_DIALOGUE, frozenset((PokemonGen3State.DIALOGUE,))),
+        (_IN_WILD_BATTLE, _WILD_BATTLE_STATES),
+        (_IN_TRAINER_BATTLE, _TRAINER_BATTLE_STATES),
+    ))
+
+    def __init__(self, client: "BizHawkClient", memory_class: type = Mem,
+                 layout: Optional[GameLayout] = None):
         """
         Initialize the state detector.
 
         Args:
             client: BizHawkClient for memory reads
-            memory_class: Memory class to use (for game-specific addresses)
+            memory_class: Memory class to use (for offsets and flag bits)
+            layout: Game-specific addresses; defaults to memory_class's own
         """
         self.client = client
         self.mem = memory_class
         self._last_state = PokemonGen3State.UNKNOWN
-        self._state_changed = False
+        # _STATE_PROPS bits for _last_state, updated whenever it changes
+        self._state_flags: int = self._STATE_PROPS[PokemonGen3State.UNKNOWN]
+        # Detector status bits (_FLAG_*), packed into one int
+        self._flags: int = 0
 
         # Cached pointer values with TTL to reduce HTTP calls
         # DMA doesn't happen every frame - safe to cache for ~1 second
         self._save_block_1: int = 0
         self._save_block_2: int = 0
-        self._pointers_valid: bool = False
         self._pointer_cache_time: float = 0.0
         self._pointer_cache_ttl: float = 1.0  # seconds
+        # Bumped on every fresh pointer read, so a caller can tell whether
+        # the pointers were already re-read since it last looked
+        self._refresh_generation: int = 0
+
+        # Client reader per access width for the save block helpers
+        self._read_by_size = {1: client.read8, 2: client.read16, 4: client.read32}
+
+        self.set_layout(
+            layout if layout is not None else GameLayout.from_memory_class(memory_class)
+        )
+
+        # Battle flag bits _decode_battle_flags looks at; decoded states are
+        # cached per combination of these bits
+        self._battle_flag_mask = (
+            memory_class.BATTLE_TYPE_SAFARI | memory_class.BATTLE_TYPE_BATTLE_TOWER
+            | memory_class.BATTLE_TYPE_LEGENDARY | memory_class.BATTLE_TYPE_DOUBLE
+            | memory_class.BATTLE_TYPE_TRAINER | memory_class.BATTLE_TYPE_WILD
+        )
+        self._battle_state_cache: dict[int, PokemonGen3State] = {}
+
+        # (monotonic timestamp, value) of the last dialogue check / options read
+        self._dialogue_cache: tuple[float, bool] = (float("-inf"), False)
+        self._options_cache: tuple[float, Optional[dict[str, int]]] = (float("-inf"), None)
+
+        # Per-tick reader results (see begin_tick); None until a tick starts
+        self._cache_tick: Optional[int] = None
+        self._tick_cache: Optional[dict[str, object]] = None
+
+    def set_layout(self, layout: GameLayout) -> None:
+        """
+        Read the running game's addresses (e.g. once the ROM is identified).
+
+        Args:
+            layout: Resolved layout from load_layout()
+        """
+        self.layout = layout
+
+        # Fixed-address values detect() needs every tick, fetched in one
+        # read_multi: game state byte, battle flags, callbacks, text printers
+        self._frame_ranges = [
+            (_GAME_STATE_ADDR, 1),
+            (layout.BATTLE_TYPE_FLAGS, 4),
+            (layout.CALLBACK1, 4),
+            (layout.CALLBACK2, 4),
+            (layout.TEXT_PRINTERS, 1),
+            (layout.TEXT_PRINTERS + 0x24, 1),
+        ]
+        self._printer_ranges = self._frame_ranges[4:]
+
+        # Pointers read from the old layout's addresses no longer apply
+        self._flags &= ~_FLAG_POINTERS_VALID
+
+    def begin_tick(self, tick: int) -> None:
+        """
+        Start a new game-loop tick.
+
+        Position, map and party count are then read at most once per tick,
+        however many handlers ask for them.
+
+        Args:
+            tick: Caller's tick counter; a new value drops cached results
+        """
+        if tick != self._cache_tick:
+            self._cache_tick = tick
+            self._tick_cache = {}
+
+    @property
+    def save_block_2(self) -> int:
+        """Save Block 2 base from the last pointer refresh (0 before the first)."""
+        return self._save_block_2
 
     def refresh_pointers(self, force: bool = False) -> bool:
         """
@@ -130,44 +339,45 @@ class PokemonGen3StateDetector:
         Returns:
             True if pointers are valid (either from cache or fresh read)
         """
-        current_time = time.time()
+        current_time = _monotonic()
 
         # Check if cache is still valid
-        if not force and self._pointers_valid:
+        if not force and self._flags & _FLAG_POINTERS_VALID:
             if (current_time - self._pointer_cache_time) < self._pointer_cache_ttl:
                 return True
 
         try:
-            self._save_block_1 = self.client.read32(self.mem.SAVE_BLOCK_1_PTR)
-            self._save_block_2 = self.client.read32(self.mem.SAVE_BLOCK_2_PTR)
+            self._save_block_1 = self.client.read32(self.layout.SAVE_BLOCK_1_PTR)
+            self._save_block_2 = self.client.read32(self.layout.SAVE_BLOCK_2_PTR)
 
             # Basic validation - pointers should be in EWRAM (0x02000000-0x0203FFFF)
-            if not (0x02000000 <= self._save_block_1 <= 0x0203FFFF):
-                logger.warning(f"Save Block 1 pointer out of range: 0x{self._save_block_1:08X}")
-                self._pointers_valid = False
+            if not in_ewram(self._save_block_1):
+                logger.warning("Save Block 1 pointer out of range: 0x%08X", self._save_block_1)
+                self._flags &= ~_FLAG_POINTERS_VALID
                 return False
 
-            if not (0x02000000 <= self._save_block_2 <= 0x0203FFFF):
-                logger.warning(f"Save Block 2 pointer out of range: 0x{self._save_block_2:08X}")
-                self._pointers_valid = False
+            if not in_ewram(self._save_block_2):
+                logger.warning("Save Block 2 pointer out of range: 0x%08X", self._save_block_2)
+                self._flags &= ~_FLAG_POINTERS_VALID
                 return False
 
-            self._pointers_valid = True
+            self._flags |= _FLAG_POINTERS_VALID
             self._pointer_cache_time = current_time
+            self._refresh_generation += 1
             return True
 
         except MemoryReadError as e:
-            logger.error(f"Memory read failed during pointer refresh: {e}")
-            self._pointers_valid = False
+            logger.error("Memory read failed during pointer refresh: %s", e)
+            self._flags &= ~_FLAG_POINTERS_VALID
             return False
         except (ConnectionError, TimeoutError) as e:
-            logger.error(f"Connection error during pointer refresh: {e}")
-            self._pointers_valid = False
+            logger.error("Connection error during pointer refresh: %s", e)
+            self._flags &= ~_FLAG_POINTERS_VALID
             return False
         except Exception as e:
             # Catch-all for unexpected errors (e.g., mGBA-http issues)
-            logger.error(f"Unexpected error refreshing pointers: {e}")
-            self._pointers_valid = False
+            logger.error("Unexpected error refreshing pointers: %s", e)
+            self._flags &= ~_FLAG_POINTERS_VALID
             return False
 
     def _read_from_save_block_1(self, offset: int, size: int = 1) -> int:
@@ -181,39 +391,29 @@ class PokemonGen3StateDetector:
         Returns:
             Value read from memory, or 0 if pointers are invalid
         """
-        if not self._pointers_valid:
+        if not self._flags & _FLAG_POINTERS_VALID:
             self.refresh_pointers()
 
         # Return 0 if pointers are still invalid (e.g., at title screen)
-        if not self._pointers_valid:
+        if not self._flags & _FLAG_POINTERS_VALID:
             return 0
 
-        addr = self._save_block_1 + offset
-
-        if size == 1:
-            return self.client.read8(addr)
-        elif size == 2:
-            return self.client.read16(addr)
-        elif size == 4:
-            return self.client.read32(addr)
-        else:
-            raise ValueError(f"Invalid size: {size}")
+        try:
+            read = self._read_by_size[size]
+        except KeyError:
+            raise ValueError(f"Invalid size: {size}") from None
+        return read(self._save_block_1 + offset)
 
     def _read_from_save_block_2(self, offset: int, size: int = 1) -> int:
         """Read a value from Save Block 2 using pointer chasing."""
-        if not self._pointers_valid:
+        if not self._flags & _FLAG_POINTERS_VALID:
             self.refresh_pointers()
 
-        addr = self._save_block_2 + offset
-
-        if size == 1:
-            return self.client.read8(addr)
-        elif size == 2:
-            return self.client.read16(addr)
-        elif size == 4:
-            return self.client.read32(addr)
-        else:
-            raise ValueError(f"Invalid size: {size}")
+        try:
+            read = self._read_by_size[size]
+        except KeyError:
+            raise ValueError(f"Invalid size: {size}") from None
+        return read(self._save_block_2 + offset)
 
     def get_event_flag(self, flag_id: int) -> bool:
         """
@@ -228,24 +428,97 @@ class PokemonGen3StateDetector:
             True if flag is set
         """
         try:
-            if not self._pointers_valid:
+            if not self._flags & _FLAG_POINTERS_VALID:
                 self.refresh_pointers()
 
-            # Calculate byte and bit position
-            byte_index = flag_id // 8
-            bit_index = flag_id % 8
+            # Byte and bit position (precomputed for the named flags)
+            byte_index, mask = flag_bit(flag_id)
 
             # Read the byte containing this flag
             flags_base = self._save_block_1 + self.mem.EVENT_FLAGS_OFFSET
             flag_byte = self.client.read8(flags_base + byte_index)
 
             # Check the specific bit
-            return bool(flag_byte & (1 << bit_index))
+            return bool(flag_byte & mask)
 
         except Exception as e:
-            logger.warning(f"Failed to read event flag 0x{flag_id:03X}: {e}")
+            logger.warning("Failed to read event flag 0x%03X: %s", flag_id, e)
             return False
 
+    def get_event_flags(self, flag_ids: Iterable[int]) -> dict[int, bool]:
+        """
+        Read several event flags with one memory read.
+
+        Fetches the byte span from the lowest to the highest flag and tests
+        the bits locally, so clustered flags cost one round trip.
+
+        Args:
+            flag_ids: Flag IDs to read
+
+        Returns:
+            Dict of flag ID -> set; every flag is False on failure
+        """
+        bits = {flag_id: flag_bit(flag_id) for flag_id in flag_ids}
+        if not bits:
+            return {}
+        try:
+            if not self._flags & _FLAG_POINTERS_VALID:
+                self.refresh_pointers()
+
+            first = min(byte_index for byte_index, _mask in bits.values())
+            last = max(byte_index for byte_index, _mask in bits.values())
+            flags_base = self._save_block_1 + self.mem.EVENT_FLAGS_OFFSET
+            data = self.client.read_range(flags_base + first, last - first + 1)
+
+            return {
+                flag_id: bool(data[byte_index - first] & mask)
+                for flag_id, (byte_index, mask) in bits.items()
+            }
+
+        except Exception as e:
+            logger.warning("Failed to read event flags: %s", e)
+            return dict.fromkeys(bits, False)
+
+    def get_badge_mask(self) -> int:
+        """
+        Read all eight badge flags with one memory read.
+
+        Returns:
+            Badge bitfield (bit 0 = Stone ... bit 7 = Rain), or 0 on failure
+        """
+        try:
+            if not self._flags & _FLAG_POINTERS_VALID:
+                self.refresh_pointers()
+
+            flags_base = self._save_block_1 + self.mem.EVENT_FLAGS_OFFSET
+            data = self.client.read_range(flags_base + BADGE_FLAGS_BYTE, 2)
+            return badge_mask(data, 0)
+
+        except Exception as e:
+            logger.warning("Failed to read badge flags: %s", e)
+            return 0
+
+    def get_legendary_mask(self) -> int:
+        """
+        Read all legendary caught flags with one memory read.
+
+        Returns:
+            Bitfield in LEGENDARY_FLAGS order, or 0 on failure
+        """
+        try:
+            if not self._flags & _FLAG_POINTERS_VALID:
+                self.refresh_pointers()
+
+            flags_base = self._save_block_1 + self.mem.EVENT_FLAGS_OFFSET
+            data = self.client.read_range(
+                flags_base + LEGENDARY_FLAGS_START, LEGENDARY_FLAGS_LENGTH
+            )
+            return legendary_mask(data, -LEGENDARY_FLAGS_START)
+
+        except Exception as e:
+            logger.warning("Failed to read legendary flags: %s", e)
+            return 0
+
     def detect(self) -> PokemonGen3State:
         """
         Detect the current game state.
@@ -254,41 +527,55 @@ class PokemonGen3StateDetector:
             Current PokemonGen3State
         """
         try:
+            # All fixed-address values for this tick in one round trip
+            state_data, flags_data, cb1_data, cb2_data, printer1, printer2 = (
+                self.client.read_multi(self._frame_ranges)
+            )
+
             # Check for title screen first (before pointer validation)
             # Title screen has game state byte = 0xFF at 0x0300500C
-            try:
-                game_state_byte = self.client.read8(0x0300500C)
-                if game_state_byte == 0xFF:
-                    # Title screen detected
-                    if self._last_state != PokemonGen3State.TITLE_SCREEN:
-                        logger.info(f"State: {self._last_state.name} -> TITLE_SCREEN")
-                        self._state_changed = True
-                        self._last_state = PokemonGen3State.TITLE_SCREEN
-                    else:
-                        self._state_changed = False
-                    return PokemonGen3State.TITLE_SCREEN
-            except Exception:
-                pass  # If read fails, continue with normal detection
+            if state_data[0] == 0xFF:
+                # Title screen detected
+                if self._last_state != PokemonGen3State.TITLE_SCREEN:
+                    logger.info("State: %s -> TITLE_SCREEN", self._last_state.name)
+                    self._flags |= _FLAG_STATE_CHANGED
+                    self._last_state = PokemonGen3State.TITLE_SCREEN
+                    self._state_flags = self._STATE_PROPS[PokemonGen3State.TITLE_SCREEN]
+                else:
+                    self._flags &= ~_FLAG_STATE_CHANGED
+                return PokemonGen3State.TITLE_SCREEN
             
             # Refresh pointers first
+            generation = self._refresh_generation
             if not self.refresh_pointers():
                 return PokemonGen3State.UNKNOWN
 
-            # Read battle type flags (direct address, not through pointer)
-            battle_flags = self.client.read32(self.mem.BATTLE_TYPE_FLAGS)
+            # The batch already answered the dialogue check for this tick
+            dialogue_active = (
+                self._printer_active(printer1[0]) or self._printer_active(printer2[0])
+            )
+            self._dialogue_cache = (_monotonic(), dialogue_active)
 
             # Determine state based on memory values
-            new_state = self._determine_state(battle_flags)
+            new_state = self._determine_state(
+                _U32.unpack_from(flags_data)[0],
+                _U32.unpack_from(cb1_data)[0],
+                _U32.unpack_from(cb2_data)[0],
+                dialogue_active,
+            )
 
             # Track state changes
             if new_state != self._last_state:
-                logger.info(f"State: {self._last_state.name} -> {new_state.name}")
-                self._state_changed = True
+                logger.info("State: %s -> %s", self._last_state.name, new_state.name)
+                self._flags |= _FLAG_STATE_CHANGED
                 self._last_state = new_state
-                # Force pointer refresh on state transitions (DMA more likely)
-                self.refresh_pointers(force=True)
+                self._state_flags = self._STATE_PROPS[new_state]
+                # Force pointer refresh on state transitions (DMA more likely),
+                # unless the TTL refresh above already re-read them this tick
+                if self._refresh_generation == generation:
+                    self.refresh_pointers(force=True)
             else:
-                self._state_changed = False
+                self._flags &= ~_FLAG_STATE_CHANGED
 
             return new_state
 
@@ -296,23 +583,30 @@ class PokemonGen3StateDetector:
             # Expected at title screen - not an error
             return PokemonGen3State.UNKNOWN
         except MemoryReadError as e:
-            logger.warning(f"Memory read failed during state detection: {e}")
+            logger.warning("Memory read failed during state detection: %s", e)
             return PokemonGen3State.UNKNOWN
         except StateDetectorError as e:
-            logger.error(f"State detection error: {e}")
+            logger.error("State detection error: %s", e)
             return PokemonGen3State.UNKNOWN
         except (ConnectionError, TimeoutError) as e:
-            logger.warning(f"Connection issue during state detection: {e}")
+            logger.warning("Connection issue during state detection: %s", e)
             return PokemonGen3State.UNKNOWN
         except Exception as e:
             # Catch-all for unexpected errors
-            logger.error(f"Unexpected state detection error: {e}")
+            logger.error("Unexpected state detection error: %s", e)
             return PokemonGen3State.UNKNOWN
 
-    def _determine_state(self, battle_flags: int) -> PokemonGen3State:
+    def _determine_state(
+        self,
+        battle_flags: int,
+        callback1: int,
+        callback2: int,
+        dialogue_active: bool,
+    ) -> PokemonGen3State:
         """
         Determine game state from battle flags and other memory values.
 
+        All values come from the single batched read in detect().
         Priority order matters - check most specific states first.
         """
         # Check for battle first (battle flags are non-zero during battle)
@@ -320,20 +614,13 @@ class PokemonGen3StateDetector:
             return self._determine_battle_state(battle_flags)
 
         # Check for active callback (can indicate menus, transitions, etc.)
-        try:
-            callback1 = self.client.read32(self.mem.CALLBACK1)
-            callback2 = self.client.read32(self.mem.CALLBACK2)
-
-            # If callbacks are null or specific values, we might be in transition
-            if callback1 == 0 and callback2 == 0:
-                return PokemonGen3State.TRANSITION
-
-        except Exception:
-            pass
+        # If callbacks are null or specific values, we might be in transition
+        if callback1 == 0 and callback2 == 0:
+            return PokemonGen3State.TRANSITION
 
         # Check for active dialogue/text box before defaulting to overworld
         # This enables state-based intro handling and responsive dialogue detection
-        if self.is_dialogue_active():
+        if dialogue_active:
             return PokemonGen3State.DIALOGUE
 
         # Default to overworld if no special state detected
@@ -343,9 +630,21 @@ class PokemonGen3StateDetector:
         """
         Determine which type of battle based on flags.
 
+        Only a handful of flag bits matter, so each distinct combination is
+        decoded once and then served from a cache.
+
         Args:
             battle_flags: Value from BATTLE_TYPE_FLAGS address
         """
+        key = battle_flags & self._battle_flag_mask
+        state = self._battle_state_cache.get(key)
+        if state is None:
+            state = self._decode_battle_flags(key)
+            self._battle_state_cache[key] = state
+        return state
+
+    def _decode_battle_flags(self, battle_flags: int) -> PokemonGen3State:
+        """Map battle flags to a battle state (uncached; see _determine_battle_state)."""
         # Check for special battle types first
         if battle_flags & self.mem.BATTLE_TYPE_SAFARI:
             return PokemonGen3State.BATTLE_SAFARI
@@ -390,62 +689,38 @@ class PokemonGen3StateDetector:
     @property
     def state_changed(self) -> bool:
         """Check if state changed on the last detect() call."""
-        return self._state_changed
+        return bool(self._flags & _FLAG_STATE_CHANGED)
 
     @property
     def in_battle(self) -> bool:
         """Check if currently in any type of battle."""
-        return self._last_state in (
-            PokemonGen3State.BATTLE_WILD,
-            PokemonGen3State.BATTLE_TRAINER,
-            PokemonGen3State.BATTLE_DOUBLE_WILD,
-            PokemonGen3State.BATTLE_DOUBLE_TRAINER,
-            PokemonGen3State.BATTLE_SAFARI,
-            PokemonGen3State.BATTLE_TOWER,
-            PokemonGen3State.BATTLE_FRONTIER,
-            PokemonGen3State.BATTLE_LEGENDARY,
-            PokemonGen3State.BATTLE_MENU,
-            PokemonGen3State.BATTLE_FIGHT_MENU,
-            PokemonGen3State.BATTLE_BAG_MENU,
-            PokemonGen3State.BATTLE_POKEMON_MENU,
-            PokemonGen3State.BATTLE_TARGET_MENU,
-        )
+        return bool(self._state_flags & _IN_BATTLE)
 
     @property
     def in_double_battle(self) -> bool:
         """Check if in a double battle."""
-        return self._last_state in (
-            PokemonGen3State.BATTLE_DOUBLE_WILD,
-            PokemonGen3State.BATTLE_DOUBLE_TRAINER,
-        )
+        return bool(self._state_flags & _IN_DOUBLE_BATTLE)
 
     @property
     def in_overworld(self) -> bool:
         """Check if in normal overworld gameplay."""
-        return self._last_state == PokemonGen3State.OVERWORLD
+        return bool(self._state_flags & _IN_OVERWORLD)
 
     @property
     def in_dialogue(self) -> bool:
         """Check if a text box is active."""
-        return self._last_state == PokemonGen3State.DIALOGUE
+        return bool(self._state_flags & _IN_DIALOGUE)
 
     @property
     def in_menu(self) -> bool:
         """Check if in any menu."""
-        return self._last_state in (
-            PokemonGen3State.MENU_START,
-            PokemonGen3State.MENU_POKEMON,
-            PokemonGen3State.MENU_BAG,
-            PokemonGen3State.MENU_POKEDEX,
-            PokemonGen3State.MENU_SAVE,
-            PokemonGen3State.MENU_OPTIONS,
-            PokemonGen3State.MENU_POKENAV,
-        )
+        return bool(self._state_flags & _IN_MENU)
 
     # -------------------------------------------------------------------------
     # Position and Map Reading (Pointer-based)
     # -------------------------------------------------------------------------
 
+    @_tick_cached
     def get_player_position(self) -> tuple[int, int]:
         """
         Get player X, Y coordinates using pointer chasing.
@@ -457,6 +732,7 @@ class PokemonGen3StateDetector:
         y = self._read_from_save_block_1(self.mem.PLAYER_Y_OFFSET, 2)
         return (x, y)
 
+    @_tick_cached
     def get_map_location(self) -> tuple[int, int]:
         """
         Get current map group and number.
@@ -472,6 +748,7 @@ class PokemonGen3StateDetector:
     # Party Reading (Pointer-based)
     # -------------------------------------------------------------------------
 
+    @_tick_cached
     def get_party_count(self) -> int:
         """Get number of Pokemon in party (0-6)."""
         return self._read_from_save_block_1(self.mem.PARTY_COUNT_OFFSET, 1)
@@ -514,101 +791,125 @@ class PokemonGen3StateDetector:
         Returns:
             PokemonParty with all party Pokemon
         """
-        count = self.get_party_count()
-        pokemon_list = []
+        count = min(self.get_party_count(), 6)
+        data = self.read_party_raw() if count else None
+        return self._build_party(data, count)
 
-        for i in range(min(count, 6)):
-            pokemon = self._read_party_pokemon(i)
-            if pokemon:
-                pokemon_list.append(pokemon)
+    def party_range(self) -> Optional[tuple[int, int]]:
+        """
+        Memory range covering the party count and all six party slots.
 
-        return PokemonParty(pokemon=pokemon_list)
+        The count sits just below the slots in Save Block 1, so one range
+        covers both and can join a caller's read_multi batch.
 
-    def _read_party_pokemon(self, index: int) -> Optional[Pokemon]:
+        Returns:
+            (address, length) for parse_party, or None if pointers are invalid
         """
-        Read a single Pokemon from the party using batched memory read.
+        if not self._flags & _FLAG_POINTERS_VALID:
+            self.refresh_pointers()
+
+        if not self._flags & _FLAG_POINTERS_VALID:
+            return None
+
+        return (self._save_block_1 + self.mem.PARTY_COUNT_OFFSET,
+                _PARTY_SLOTS_START + PARTY_BLOB_SIZE)
 
-        Uses a single read_range() call for the entire 100-byte Pokemon struct
-        instead of 12+ individual reads, reducing HTTP calls by ~90%.
+    def parse_party(self, data: Optional[bytes]) -> PokemonParty:
+        """
+        Build the party from bytes read over party_range().
 
         Args:
-            index: Party slot (0-5)
+            data: Bytes read over party_range(), or None if it was unavailable
 
         Returns:
-            Pokemon or None if slot is empty
+            PokemonParty with all party Pokemon
+        """
+        if data is None:
+            return PokemonParty(pokemon=[])
+        return self._build_party(memoryview(data)[_PARTY_SLOTS_START:],
+                                 min(data[0], 6))
+
+    def _build_party(self, data: Optional[memoryview], count: int) -> PokemonParty:
+        """Parse the first count slots of a party blob into a PokemonParty."""
+        pokemon_list = []
+
+        if data is not None:
+            for i in range(count):
+                pokemon = self._parse_party_pokemon(data, i)
+                if pokemon:
+                    pokemon_list.append(pokemon)
+
+        return PokemonParty(pokemon=pokemon_list)
+
+    def read_party_raw(self) -> Optional[memoryview]:
         """
-        if not self._pointers_valid:
+        Read all six party slots with one memory read.
+
+        The slots are contiguous in Save Block 1, so one 600-byte read
+        replaces a read per Pokemon.
+
+        Returns:
+            View over PARTY_BLOB_SIZE bytes, or None if the read failed
+        """
+        if not self._flags & _FLAG_POINTERS_VALID:
             self.refresh_pointers()
 
-        if not self._pointers_valid:
+        if not self._flags & _FLAG_POINTERS_VALID:
             return None
 
-        base_offset = self.mem.PARTY_DATA_OFFSET + (index * self.mem.PARTY_POKEMON_SIZE)
-        base_addr = self._save_block_1 + base_offset
-
         try:
-            # Single HTTP call for entire Pokemon struct (100 bytes)
-            data = self.client.read_range(base_addr, self.mem.PARTY_POKEMON_SIZE)
+            return memoryview(read_party_blob(self.client, self._save_block_1))
+        except MemoryReadError as e:
+            logger.warning("Memory read failed for party data: %s", e)
+            return None
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning("Connection issue reading party data: %s", e)
+            return None
+        except Exception as e:
+            logger.error("Unexpected error reading party data: %s", e)
+            return None
 
-            # Parse personality and OT ID (first 8 bytes)
-            personality = int.from_bytes(data[0x00:0x04], 'little')
-            ot_id = int.from_bytes(data[0x04:0x08], 'little')
+    def _parse_party_pokemon(self, party_data: memoryview, index: int) -> Optional[Pokemon]:
+        """
+        Parse a single Pokemon out of the combined party buffer.
 
-            # Parse level and HP from calculated stats section
-            level = data[0x54]
-            current_hp = int.from_bytes(data[0x56:0x58], 'little')
-            max_hp = int.from_bytes(data[0x58:0x5A], 'little')
+        Args:
+            party_data: Buffer from read_party_raw()
+            index: Party slot (0-5)
 
-            if level == 0 or max_hp == 0:
-                return None  # Empty slot
+        Returns:
+            Pokemon or None if slot is empty
+        """
+        base = index * self.mem.PARTY_POKEMON_SIZE
 
-            # Parse stats
-            attack = int.from_bytes(data[0x5A:0x5C], 'little')
-            defense = int.from_bytes(data[0x5C:0x5E], 'little')
-            speed = int.from_bytes(data[0x5E:0x60], 'little')
-            sp_attack = int.from_bytes(data[0x60:0x62], 'little')
-            sp_defense = int.from_bytes(data[0x62:0x64], 'little')
+        try:
+            # Personality, OT ID, then status, level, HP and stats from the
+            # calculated section, all in one unpack
+            (personality, ot_id, status, level, current_hp, max_hp,
+             attack, defense, speed, sp_attack, sp_defense) = PARTY_MON_STRUCT.unpack_from(
+                party_data, base
+            )
 
-            # Parse status
-            status = int.from_bytes(data[0x50:0x54], 'little')
+            if level == 0 or max_hp == 0:
+                return None  # Empty slot
 
             # Calculate nature from personality
-            nature = Nature(personality % 25)
-
-            # Check if shiny
-            p_high = (personality >> 16) & 0xFFFF
-            p_low = personality & 0xFFFF
-            tid = ot_id & 0xFFFF
-            sid = (ot_id >> 16) & 0xFFFF
-            is_shiny = ((tid ^ sid) ^ (p_high ^ p_low)) < 8
-
-            pokemon = Pokemon(
-                species_id=0,  # Would need to read from encrypted data
-                level=level,
-                hp=current_hp,
-                max_hp=max_hp,
-                status=status,
-                attack=attack,
-                defense=defense,
-                speed=speed,
-                sp_attack=sp_attack,
-                sp_defense=sp_defense,
-                nature=nature,
-                personality=personality,
-                ot_id=ot_id,
-                is_shiny=is_shiny,
+            nature = NATURE_BY_ID[personality % 25]
+
+            # Species would need the encrypted data block; left as 0
+            pokemon = Pokemon.from_raw(
+                0, level, current_hp, max_hp, status,
+                attack, defense, speed, sp_attack, sp_defense,
+                Ability.NONE, nature,
             )
+            pokemon.personality = personality
+            pokemon.ot_id = ot_id
+            pokemon.is_shiny = is_shiny(personality, ot_id)
 
             return pokemon
 
-        except MemoryReadError as e:
-            logger.warning(f"Memory read failed for party Pokemon {index}: {e}")
-            return None
-        except (ConnectionError, TimeoutError) as e:
-            logger.warning(f"Connection issue reading party Pokemon {index}: {e}")
-            return None
         except Exception as e:
-            logger.error(f"Unexpected error reading party Pokemon {index}: {e}")
+            logger.error("Unexpected error parsing party Pokemon %s: %s", index, e)
             return None
 
     # -------------------------------------------------------------------------
@@ -618,7 +919,7 @@ class PokemonGen3StateDetector:
     def get_battle_weather(self) -> int:
         """Get current battle weather."""
         try:
-            return self.client.read16(self.mem.BATTLE_WEATHER)
+            return self.client.read16(self.layout.BATTLE_WEATHER)
         except Exception:
             return 0
 
@@ -639,75 +940,94 @@ class PokemonGen3StateDetector:
             return None
 
         try:
-            base_addr = self.mem.BATTLE_MONS + (battler_index * self.mem.BATTLE_MON_SIZE)
+            base_addr = self.layout.BATTLE_MONS + (battler_index * self.mem.BATTLE_MON_SIZE)
 
             # Single HTTP call for entire battle mon struct (88 bytes)
             data = self.client.read_range(base_addr, self.mem.BATTLE_MON_SIZE)
+            return self._parse_battle_pokemon(data, battler_index)
+
+        except MemoryReadError as e:
+            logger.warning("Memory read failed for battle Pokemon %s: %s", battler_index, e)
+            return None
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning("Connection issue reading battle Pokemon %s: %s", battler_index, e)
+            return None
+        except Exception as e:
+            logger.error("Unexpected error reading battle Pokemon %s: %s", battler_index, e)
+            return None
+
+    def read_all_battle_pokemon(self) -> list[Optional[Pokemon]]:
+        """
+        Read all four battler slots with one memory read.
+
+        Returns:
+            Pokemon (or None for an empty slot) per battler index 0-3; all
+            None if not in battle or the read failed
+        """
+        if not self.in_battle:
+            return [None] * 4
+
+        try:
+            data = self.client.read_range(
+                self.layout.BATTLE_MONS, self.mem.BATTLE_MON_SIZE * 4
+            )
+        except (MemoryReadError, ConnectionError, TimeoutError) as e:
+            logger.warning("Failed to read battle Pokemon: %s", e)
+            return [None] * 4
+        except Exception as e:
+            logger.error("Unexpected error reading battle Pokemon: %s", e)
+            return [None] * 4
+
+        # Each slot unpacks in place at its offset; no per-slot slices
+        size = self.mem.BATTLE_MON_SIZE
+        return [self._parse_battle_pokemon(data, i, i * size) for i in range(4)]
+
+    def _parse_battle_pokemon(self, data: bytes, battler_index: int,
+                              offset: int = 0) -> Optional[Pokemon]:
+        """
+        Parse one 88-byte battle mon struct.
 
-            # Parse species (offset 0x00, 2 bytes)
-            species = int.from_bytes(data[0x00:0x02], 'little')
+        Args:
+            data: Buffer holding the struct
+            battler_index: Slot the struct came from (for logging)
+            offset: Byte offset of the struct within data
+
+        Returns:
+            Pokemon with battle stats, or None if the slot is empty
+        """
+        try:
+            # Every field in one unpack (layout in BATTLE_MON_STRUCT)
+            record = unpack_battle_mon(data, offset)
+            species = record.species
             if species == 0:
                 return None
 
-            # Parse stats (offsets 0x02-0x0B, 2 bytes each)
-            attack = int.from_bytes(data[0x02:0x04], 'little')
-            defense = int.from_bytes(data[0x04:0x06], 'little')
-            speed = int.from_bytes(data[0x06:0x08], 'little')
-            sp_attack = int.from_bytes(data[0x08:0x0A], 'little')
-            sp_defense = int.from_bytes(data[0x0A:0x0C], 'little')
-
-            # Parse HP and level
-            hp = int.from_bytes(data[0x28:0x2A], 'little')
-            level = data[0x2A]
-            max_hp = int.from_bytes(data[0x2C:0x2E], 'little')
-
-            # Parse status (offset 0x4C, 4 bytes)
-            status = int.from_bytes(data[0x4C:0x50], 'little')
-
-            # Parse ability and types
-            ability_id = data[0x20]
-            type1 = data[0x21]
-            type2 = data[0x22]
-
-            # Parse moves and enrich with database data
-            moves = []
-            for i in range(4):
-                move_offset = 0x0C + (i * 2)
-                move_id = int.from_bytes(data[move_offset:move_offset + 2], 'little')
-                pp = data[0x24 + i]  # PP offset is 0x24
-                if move_id != 0:
-                    move = Move(id=move_id, pp=pp)
-                    enrich_move(move)
-                    moves.append(move)
-
-            pokemon = Pokemon(
-                species_id=species,
-                species_name=get_species_name(species),
-                level=level,
-                hp=hp,
-                max_hp=max_hp,
-                status=status,
-                attack=attack,
-                defense=defense,
-                speed=speed,
-                sp_attack=sp_attack,
-                sp_defense=sp_defense,
-                ability=Ability(ability_id) if ability_id <= 77 else Ability.NONE,
-                type1=PokemonType(type1) if type1 <= 17 else None,
-                type2=PokemonType(type2) if type2 <= 17 and type2 != type1 else None,
-                moves=moves,
+            # Parse moves; static move data is cached per move ID
+            moves = [
+                make_move(move_id, pp)
+                for move_id, pp in (
+                    (record.move1, record.pp1), (record.move2, record.pp2),
+                    (record.move3, record.pp3), (record.move4, record.pp4),
+                )
+                if move_id != 0
+            ]
+
+            pokemon = Pokemon.from_raw(
+                species, record.level, record.hp, record.max_hp, record.status,
+                record.attack, record.defense, record.speed,
+                record.sp_attack, record.sp_defense,
+                ability_from_byte(record.ability, Ability.NONE),
+                Nature.HARDY,
+                type_from_byte(record.type1),
+                type_from_byte(record.type2) if record.type2 != record.type1 else None,
             )
+            pokemon.species_name = get_species_name(species)
+            pokemon.moves = moves
 
             return pokemon
 
-        except MemoryReadError as e:
-            logger.warning(f"Memory read failed for battle Pokemon {battler_index}: {e}")
-            return None
-        except (ConnectionError, TimeoutError) as e:
-            logger.warning(f"Connection issue reading battle Pokemon {battler_index}: {e}")
-            return None
         except Exception as e:
-            logger.error(f"Unexpected error reading battle Pokemon {battler_index}: {e}")
+            logger.error("Unexpected error reading battle Pokemon %s: %s", battler_index, e)
             return None
 
     # -------------------------------------------------------------------------
@@ -724,21 +1044,31 @@ class PokemonGen3StateDetector:
         - Bit 4: Battle Style (0=Switch, 1=Set)
         - Bit 5: Sound (0=Mono, 1=Stereo)
         
+        Options are near-static, so a successful read is reused for
+        _OPTIONS_CACHE_TTL seconds.
+
         Returns:
             Dictionary with option names and values
         """
+        now = _monotonic()
+        read_at, cached = self._options_cache
+        if cached is not None and now - read_at < _OPTIONS_CACHE_TTL:
+            return dict(cached)
+
         try:
             options_byte = self._read_from_save_block_2(self.mem.OPTIONS_OFFSET, 1)
             
-            return {
+            options = {
                 'text_speed': options_byte & 0x07,           # Bits 0-2
                 'battle_scene': (options_byte >> 3) & 0x01,  # Bit 3
                 'battle_style': (options_byte >> 4) & 0x01,  # Bit 4
                 'sound': (options_byte >> 5) & 0x01,         # Bit 5
                 'raw': options_byte,                         # Full byte for debugging
             }
+            self._options_cache = (now, options)
+            return dict(options)
         except Exception as e:
-            logger.warning(f"Failed to read options: {e}")
+            logger.warning("Failed to read options: %s", e)
             return {
                 'text_speed': 0,
                 'battle_scene': 0,
@@ -747,6 +1077,10 @@ class PokemonGen3StateDetector:
                 'raw': 0,
             }
 
+    def invalidate_options_cache(self) -> None:
+        """Drop the cached options; call after writing the options byte."""
+        self._options_cache = (float("-inf"), None)
+
     def verify_optimal_settings(self) -> bool:
         """
         Check if game settings are configured optimally for AI play.
@@ -768,10 +1102,10 @@ class PokemonGen3StateDetector:
         )
         
         if not is_optimal:
-            logger.info(f"Settings check: "
-                       f"Text={options['text_speed']} (want 2), "
-                       f"Scene={options['battle_scene']} (want 1), "
-                       f"Style={options['battle_style']} (want 1)")
+            logger.info(
+                "Settings check: Text=%d (want 2), Scene=%d (want 1), Style=%d (want 1)",
+                options['text_speed'], options['battle_scene'], options['battle_style'],
+            )
         
         return is_optimal
 
@@ -781,19 +1115,11 @@ class PokemonGen3StateDetector:
 
     def is_wild_battle(self) -> bool:
         """Check if in a wild Pokemon battle."""
-        return self._last_state in (
-            PokemonGen3State.BATTLE_WILD,
-            PokemonGen3State.BATTLE_DOUBLE_WILD,
-        )
+        return bool(self._state_flags & _IN_WILD_BATTLE)
 
     def is_trainer_battle(self) -> bool:
         """Check if in a trainer battle."""
-        return self._last_state in (
-            PokemonGen3State.BATTLE_TRAINER,
-            PokemonGen3State.BATTLE_DOUBLE_TRAINER,
-            PokemonGen3State.BATTLE_TOWER,
-            PokemonGen3State.BATTLE_FRONTIER,
-        )
+        return bool(self._state_flags & _IN_TRAINER_BATTLE)
 
     def is_dialogue_active(self) -> bool:
         """
@@ -808,33 +1134,41 @@ class PokemonGen3StateDetector:
 
         High values (100+) are likely garbage data or unrelated, not dialogue.
 
+        Results are reused for _DIALOGUE_CACHE_TTL seconds, including the
+        value detect() derives from its batched read.
+
         Returns:
             True if text is currently being rendered on screen
         """
+        now = _monotonic()
+        checked_at, active = self._dialogue_cache
+        if now - checked_at < _DIALOGUE_CACHE_TTL:
+            return active
+
         try:
-            # Check first text printer's active flag (offset 0x1C in struct)
-            # Actually, the first byte is 'active' boolean
-            printer_active = self.client.read8(self.mem.TEXT_PRINTERS)
+            # First byte of the first two text printers (some dialogues use
+            # the second), fetched in one round trip
+            printer1, printer2 = self.client.read_multi(self._printer_ranges)
 
             # Conservative check: Only treat small values (1-10) as active dialogue
             # Higher values are likely uninitialized memory, not dialogue states
-            if printer_active >= 1 and printer_active <= 10:
-                return True
+            active = self._printer_active(printer1[0]) or self._printer_active(printer2[0])
 
-            # Check a second printer (some dialogues use multiple)
-            printer2_active = self.client.read8(self.mem.TEXT_PRINTERS + 0x24)
-            if printer2_active >= 1 and printer2_active <= 10:
-                return True
-
-            return False
+            self._dialogue_cache = (now, active)
+            return active
 
         except (MemoryReadError, ConnectionError, TimeoutError):
             # Connection issues - assume no dialogue to avoid blocking
             return False
         except Exception as e:
-            logger.debug(f"Dialogue check failed: {e}")
+            logger.debug("Dialogue check failed: %s", e)
             return False
 
+    @staticmethod
+    def _printer_active(value: int) -> bool:
+        """Check whether a text printer's active byte means dialogue is showing."""
+        return _PRINTER_ACTIVE_MIN <= value <= _PRINTER_ACTIVE_MAX
+
 
 # =============================================================================
 # Game-specific aliases
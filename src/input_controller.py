@@ -5,6 +5,7 @@ Provides a consistent interface for sending button inputs to the emulator,
 abstracting away the underlying IPC mechanism (BizHawk file-based IPC).
 """
 
+import functools
 import logging
 import time
 from typing import TYPE_CHECKING
@@ -26,7 +27,7 @@ class InputController:
     """
 
     # Valid button names
-    VALID_BUTTONS = {"A", "B", "Start", "Select", "Up", "Down", "Left", "Right", "L", "R"}
+    VALID_BUTTONS = frozenset({"A", "B", "Start", "Select", "Up", "Down", "Left", "Right", "L", "R"})
 
     def __init__(self, client: "BizHawkClient", input_cooldown: float = 0.05):
         """
@@ -38,7 +39,9 @@ class InputController:
         """
         self.client = client
         self.input_cooldown = input_cooldown
-        self._last_input_time = 0.0
+        # Monotonic time before which the next input must wait, set after
+        # each input is sent (see _wait_cooldown)
+        self._next_ready = 0.0
         self._walking_direction = None
 
     def tap(self, button: str) -> bool:
@@ -54,19 +57,30 @@ class InputController:
         if button not in self.VALID_BUTTONS:
             logger.warning(f"Invalid button: {button}")
             return False
+        return self._tap_validated(button)
 
-        # Enforce cooldown between inputs
-        now = time.time()
-        elapsed = now - self._last_input_time
-        if elapsed < self.input_cooldown:
-            time.sleep(self.input_cooldown - elapsed)
-
+    def _tap_validated(self, button: str) -> bool:
+        """tap() for a button already known to be valid (backs tap_A etc.)."""
+        self._wait_cooldown()
         result = self.client.tap_button(button)
-        self._last_input_time = time.time()
+        self._next_ready = time.monotonic() + self.input_cooldown
 
-        logger.debug(f"Input: {button}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Input: %s", button)
         return result
 
+    def _wait_cooldown(self) -> None:
+        """
+        Enforce the cooldown between inputs.
+
+        Sleeps only if the deadline set after the last input hasn't passed.
+        Callers set the next deadline once the client call returns, so the
+        full cooldown separates the end of one input from the next.
+        """
+        now = time.monotonic()
+        if now < self._next_ready:
+            time.sleep(self._next_ready - now)
+
     def hold(self, button: str, frames: int = 30) -> bool:
         """
         Hold a button for a specified number of frames.
@@ -82,10 +96,12 @@ class InputController:
             logger.warning(f"Invalid button: {button}")
             return False
 
+        self._wait_cooldown()
         result = self.client.hold_button(button, frames)
-        self._last_input_time = time.time()
+        self._next_ready = time.monotonic() + self.input_cooldown
 
-        logger.debug(f"Hold: {button} for {frames} frames")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Hold: %s for %d frames", button, frames)
         return result
 
     def walk(self, direction: str, frames: int = 16) -> bool:
@@ -160,3 +176,10 @@ class InputController:
                 success = False
             time.sleep(delay)
         return success
+
+
+# tap_A(), tap_Start(), ...: tap() specialised per button, skipping validation
+for _button in InputController.VALID_BUTTONS:
+    setattr(InputController, f"tap_{_button}",
+            functools.partialmethod(InputController._tap_validated, _button))
+del _button
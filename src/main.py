@@ -14,9 +14,11 @@ Usage:
 import argparse
 import json
 import logging
+import random
 import sys
 import time
 import urllib.request
+from collections import deque
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -36,6 +38,9 @@ from src.games.pokemon_gen3.state_detector import (
 from src.games.pokemon_gen3.battle_handler import (
     PokemonGen3BattleHandler, BattleAction, BattleDecision
 )
+from src.games.pokemon_gen3.memory_map import (
+    load_layout, options_byte_addr
+)
 from src.ai.battle_ai import BattleAI, BattleContext, BattleStrategy
 from src.tracking.completion_tracker import CompletionTracker
 from src.games.pokemon_gen3.intro_handler import IntroHandler
@@ -50,6 +55,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Random walk helpers for the overworld and stuck handlers
+_choice = random.choice
+_randint = random.randint
+# Direction picks index _DIRS with 2 raw random bits: a single C call,
+# several times cheaper than random.choice
+_getrandbits = random.getrandbits
+_DIRS = ("Up", "Down", "Left", "Right")
+_PERPENDICULAR = {
+    "Up": ("Left", "Right"),
+    "Down": ("Left", "Right"),
+    "Left": ("Up", "Down"),
+    "Right": ("Up", "Down"),
+}
+
+# States that count as being in a battle for the enter/leave hooks
+_BATTLE_STATES = frozenset((
+    PokemonGen3State.BATTLE_WILD,
+    PokemonGen3State.BATTLE_TRAINER,
+    PokemonGen3State.BATTLE_DOUBLE_WILD,
+    PokemonGen3State.BATTLE_DOUBLE_TRAINER,
+    PokemonGen3State.BATTLE_SAFARI,
+    PokemonGen3State.BATTLE_TOWER,
+    PokemonGen3State.BATTLE_FRONTIER,
+    PokemonGen3State.BATTLE_LEGENDARY,
+))
+
+# Cursor moves from move slot 0 to each move slot in the 2x2 Fight menu
+_MOVE_CURSOR_PATHS = {1: ("Right",), 2: ("Down",), 3: ("Right", "Down")}
+
+# Title screen flow reads: game state byte, party count, map group + number
+_TITLE_SCREEN_RANGES = [(0x0300500C, 1), (0x02024284, 1), (0x02036E12, 2)]
+
 
 class EmeraldAI:
     """
@@ -62,11 +99,12 @@ class EmeraldAI:
     def __init__(self, strategy: str = "aggressive", host: str = "127.0.0.1", port: int = 8787):
         # Core components
         self.client = mGBAClient(host=host, port=port)
+        self.layout = load_layout("BPEE")  # Re-resolved from the ROM on connect
         self.input = InputController(self.client)
-        self.state_detector = PokemonGen3StateDetector(self.client)
+        self.state_detector = PokemonGen3StateDetector(self.client, layout=self.layout)
         
         # Battle system
-        self.battle_handler = PokemonGen3BattleHandler(self.client)
+        self.battle_handler = PokemonGen3BattleHandler(self.client, self.layout)
         self.battle_ai = BattleAI(self.battle_handler)
         self._set_strategy(strategy)
         
@@ -80,6 +118,8 @@ class EmeraldAI:
         self.tick_interval = 0.5
         self.running = False
         self._battle_context = None
+        # Battle menu buttons still to press, one per tick (see tick())
+        self._action_queue: deque[str] = deque()
         self._ticks_in_state = 0
         self._last_state = PokemonGen3State.UNKNOWN
         self._stuck_counter = 0
@@ -134,6 +174,9 @@ class EmeraldAI:
             
             if code != "BPEE":
                 logger.warning(f"Expected Emerald (BPEE), got {code}")
+            self.layout = load_layout(code)
+            self.state_detector.set_layout(self.layout)
+            self.battle_handler.set_layout(self.layout)
             
             return True
         else:
@@ -151,9 +194,21 @@ class EmeraldAI:
         self.running = True
 
         try:
+            # Ticks run on a fixed monotonic cadence: time spent inside tick()
+            # (memory reads, inputs) comes out of the wait instead of being
+            # added to it, so the gap between an input and the next state
+            # read is one tick_interval rather than tick time + interval
+            next_tick = time.monotonic()
             while self.running:
                 self.tick()
-                time.sleep(self.tick_interval)
+                next_tick += self.tick_interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Fell behind (slow tick); restart the cadence rather
+                    # than running back-to-back ticks to catch up
+                    next_tick = time.monotonic()
         except KeyboardInterrupt:
             logger.info("Stopping (Ctrl+C)...")
         finally:
@@ -163,6 +218,7 @@ class EmeraldAI:
     def tick(self):
         """Execute one game tick."""
         self._ticks_total += 1
+        self.state_detector.begin_tick(self._ticks_total)
         
         # Detect current state
         state = self.state_detector.detect()
@@ -184,6 +240,12 @@ class EmeraldAI:
             self._last_state = state
         else:
             self._ticks_in_state += 1
+
+        # A queued button sequence owns the tick until it's been sent; the
+        # tick gap stands in for the menu delays, and state keeps being read
+        if self._action_queue:
+            self.input.tap(self._action_queue.popleft())
+            return
         
         # Stuck detection (skip in OVERWORLD, during new game flow, and during intro)
         in_intro = not self._intro_complete and not self.intro_handler.is_complete
@@ -216,18 +278,10 @@ class EmeraldAI:
                            f"Badges: {progress.badges.count}/8 | "
                            f"Playtime: {progress.playtime}")
 
-    def _is_battle_state(self, state: PokemonGen3State) -> bool:
+    @staticmethod
+    def _is_battle_state(state: PokemonGen3State) -> bool:
         """Check if a state is a battle state."""
-        return state in (
-            PokemonGen3State.BATTLE_WILD,
-            PokemonGen3State.BATTLE_TRAINER,
-            PokemonGen3State.BATTLE_DOUBLE_WILD,
-            PokemonGen3State.BATTLE_DOUBLE_TRAINER,
-            PokemonGen3State.BATTLE_SAFARI,
-            PokemonGen3State.BATTLE_TOWER,
-            PokemonGen3State.BATTLE_FRONTIER,
-            PokemonGen3State.BATTLE_LEGENDARY,
-        )
+        return state in _BATTLE_STATES
 
     def _handle_title_screen(self):
         """
@@ -248,15 +302,15 @@ class EmeraldAI:
             self._in_new_game_flow = True
             self._new_game_step = 0  # Repurpose as general counter for starter selection
         
-        # Read game state
+        # Read game state (all four bytes in one round trip)
         try:
-            game_state = self.client.read8(0x0300500C)
-            party_count = self.client.read8(0x02024284)
-            map_group = self.client.read8(0x02036E12)
-            map_num = self.client.read8(0x02036E13)
+            state_data, party_data, map_data = self.client.read_multi(_TITLE_SCREEN_RANGES)
+            game_state = state_data[0]
+            party_count = party_data[0]
+            map_group, map_num = map_data
         except Exception as e:
             logger.warning(f"Failed to read game state: {e}, pressing A")
-            self.input.tap("A")
+            self.input.tap_A()
             return
         
         # Check if new game is complete
@@ -280,28 +334,28 @@ class EmeraldAI:
                 logger.info("🎒 STARTER SELECTION DETECTED (Route 101)")
                 logger.info("   Pressing Left 3x to select Mudkip (leftmost bag)")
                 # Press Left multiple times to ensure we're on Mudkip
-                self.input.tap("Left")
+                self.input.tap_Left()
                 self._new_game_step = 1
             elif self._new_game_step == 1:
-                self.input.tap("Left")
+                self.input.tap_Left()
                 self._new_game_step = 2
             elif self._new_game_step == 2:
-                self.input.tap("Left")
+                self.input.tap_Left()
                 self._new_game_step = 3
             elif self._new_game_step == 3:
                 logger.info("   Confirming Mudkip selection with A")
-                self.input.tap("A")
+                self.input.tap_A()
                 self._new_game_step = 4
             else:
                 # After selecting, spam A to continue through dialogue
-                self.input.tap("A")
+                self.input.tap_A()
         else:
             # Not on Route 101 yet or still in intro - spam A and Start to advance
             # Alternate between A and Start for maximum advancement
             if self._ticks_in_state % 2 == 0:
-                self.input.tap("A")
+                self.input.tap_A()
             else:
-                self.input.tap("Start")
+                self.input.tap_Start()
             
         # Log state periodically
         if self._ticks_in_state % 10 == 0:
@@ -312,11 +366,15 @@ class EmeraldAI:
         """Called when entering a battle."""
         logger.info("Battle started!")
         
-        # Read battle state
-        battle_state = self.battle_handler.read_battle_state()
-        
-        # Read party for switching decisions
-        party = self.state_detector.read_party()
+        # Battle state and the party (for switching decisions) in one batch
+        ranges = list(self.battle_handler.state_ranges)
+        party_range = self.state_detector.party_range()
+        if party_range is not None:
+            ranges.append(party_range)
+        buffers = self.client.read_multi(ranges)
+        battle_state = self.battle_handler.parse_battle_state(*buffers[:3])
+        party = self.state_detector.parse_party(
+            buffers[3] if party_range is not None else None)
         
         self._battle_context = BattleContext(
             state=battle_state,
@@ -338,6 +396,8 @@ class EmeraldAI:
         """Called when leaving a battle."""
         logger.info("Battle ended")
         self._battle_context = None
+        # Leftover menu presses would land in the overworld
+        self._action_queue.clear()
 
     def _get_brain_battle_decision(self, battle_state) -> dict | None:
         """Ask brain for a battle decision. Returns None on failure."""
@@ -407,7 +467,7 @@ class EmeraldAI:
             self._battle_context.turns_in_battle += 1
         except Exception as e:
             logger.warning(f"Failed to read battle state: {e}")
-            self.input.tap("A")
+            self.input.tap_A()
             return
 
         # Try brain for trainer battles, fall back to rule engine
@@ -453,47 +513,27 @@ class EmeraldAI:
                 logger.info(f"  → Using {move.name or f'move#{move.id}'} "
                            f"(power={move.power}, type={move.type.name if move.type else '?'})")
         
+        # The first button goes out now; tick() sends the rest one per tick
+        actions = self._action_queue
         if decision.action == BattleAction.FIGHT:
-            # Navigate to Fight menu
-            self.input.tap("A")  # Select Fight
-            time.sleep(0.2)
-            
-            # Navigate to correct move
-            move_idx = decision.move_index
-            if move_idx == 1:
-                self.input.tap("Right")
-            elif move_idx == 2:
-                self.input.tap("Down")
-            elif move_idx == 3:
-                self.input.press_sequence(["Right", "Down"])
-            
-            time.sleep(0.1)
-            self.input.tap("A")  # Confirm move
-            
+            # Select Fight, move the cursor to the move, confirm
+            actions.append("A")
+            actions.extend(_MOVE_CURSOR_PATHS.get(decision.move_index, ()))
+            actions.append("A")
+
         elif decision.action == BattleAction.RUN:
-            # Navigate to Run (Down twice from Fight, then Right)
-            self.input.tap("Down")  # To Pokemon
-            time.sleep(0.1)
-            self.input.tap("Right")  # To Run
-            time.sleep(0.1)
-            self.input.tap("A")  # Confirm
+            # Down to Pokemon, Right to Run, confirm
+            actions.extend(("Down", "Right", "A"))
             self._battles_fled += 1
-            
+
         elif decision.action == BattleAction.SWITCH:
-            # Navigate to Pokemon menu
-            self.input.tap("Down")  # To Pokemon
-            time.sleep(0.1)
-            self.input.tap("A")  # Open Pokemon
-            time.sleep(0.3)
-            
-            # Navigate to target Pokemon
-            for _ in range(decision.pokemon_index):
-                self.input.tap("Down")
-                time.sleep(0.1)
-            
-            self.input.tap("A")  # Select
-            time.sleep(0.1)
-            self.input.tap("A")  # Confirm switch
+            # Down to Pokemon and open it, down to the target, select + confirm
+            actions.extend(("Down", "A"))
+            actions.extend(("Down",) * decision.pokemon_index)
+            actions.extend(("A", "A"))
+
+        if actions:
+            self.input.tap(actions.popleft())
 
     def _handle_dialogue(self):
         """Handle dialogue/text boxes - press A to advance.
@@ -531,16 +571,17 @@ class EmeraldAI:
         logger.info("=" * 50)
         
         try:
-            # Read Save Block 2 pointer
-            sb2_address = self.client.read32(0x03005D90)
-            if not sb2_address or not (0x02000000 <= sb2_address <= 0x0203FFFF):
-                logger.error(f"Invalid Save Block 2 pointer: {sb2_address}")
+            # Dereference Save Block 2 pointer fresh: the detector's cached
+            # pointers can be up to a second old, and warps move the block
+            if not self.state_detector.refresh_pointers(force=True):
+                logger.error(f"Invalid Save Block 2 pointer: {self.state_detector.save_block_2}")
                 return False
+            sb2_address = self.state_detector.save_block_2
             
             logger.info(f"Save Block 2 address: 0x{sb2_address:08X}")
             
-            # Calculate options address (SB2 + 0x13)
-            options_address = sb2_address + 0x13
+            # Options byte sits at a fixed offset into Save Block 2
+            options_address = options_byte_addr(sb2_address)
             logger.info(f"Options address: 0x{options_address:08X}")
             
             # Read current value
@@ -554,6 +595,8 @@ class EmeraldAI:
             # Total: 0x02 | 0x08 | 0x40 = 0x4A (74 decimal)
             optimal_value = 0x4A
             success = self.client.write8(options_address, optimal_value)
+            # The detector's cached options predate the write
+            self.state_detector.invalidate_options_cache()
             
             if not success:
                 logger.error("WRITE8 command failed")
@@ -597,8 +640,6 @@ class EmeraldAI:
         Uses walk() for movement (hold direction for multiple frames) instead
         of tap() which only registers a single frame of input.
         """
-        import random
-        
         # Check if we need to configure settings (only once per session, early in overworld)
         if not self._settings_configured:
             if not self.state_detector.verify_optimal_settings():
@@ -610,8 +651,7 @@ class EmeraldAI:
             # Reconnect if settings config dropped the connection
             if not self.client.is_connected():
                 logger.info('Reconnecting to mGBA after settings config...')
-                import time as _time
-                _time.sleep(1)
+                time.sleep(1)
                 self.client.connect()
         
         # Get current position
@@ -655,13 +695,7 @@ class EmeraldAI:
             if self._position_stuck_counter >= 5:
                 logger.debug(f"Stuck at {pos} while following directive, trying alternate")
                 # Try perpendicular direction to get around obstacle
-                perpendicular = {
-                    "Up": ["Left", "Right"],
-                    "Down": ["Left", "Right"],
-                    "Left": ["Up", "Down"],
-                    "Right": ["Up", "Down"],
-                }
-                alt_dir = random.choice(perpendicular.get(directive.direction, ["Up", "Down"]))
+                alt_dir = _choice(_PERPENDICULAR.get(directive.direction, ("Up", "Down")))
                 self.input.walk(alt_dir)
                 self._position_stuck_counter = 0
             else:
@@ -681,8 +715,8 @@ class EmeraldAI:
         # Direction persistence logic
         if self._current_direction is None or self._direction_persist_ticks >= self._direction_persist_target:
             # Pick new direction and duration
-            self._current_direction = random.choice(["Up", "Down", "Left", "Right"])
-            self._direction_persist_target = random.randint(5, 15)
+            self._current_direction = _DIRS[_getrandbits(2)]
+            self._direction_persist_target = _randint(5, 15)
             self._direction_persist_ticks = 0
             logger.debug(f"Random walk: {self._current_direction} for {self._direction_persist_target} ticks")
         
@@ -693,9 +727,9 @@ class EmeraldAI:
     def _handle_unknown(self):
         """Handle unknown state - try pressing A/Start."""
         if self._ticks_in_state % 5 == 0:
-            self.input.tap("A")
+            self.input.tap_A()
         elif self._ticks_in_state % 7 == 0:
-            self.input.tap("Start")
+            self.input.tap_Start()
 
     def _handle_stuck(self):
         """Attempt to get unstuck."""
@@ -704,14 +738,13 @@ class EmeraldAI:
         
         if self._stuck_counter < 3:
             # Try pressing B to cancel menus
-            self.input.tap("B")
+            self.input.tap_B()
         elif self._stuck_counter < 6:
             # Try pressing A
-            self.input.tap("A")
+            self.input.tap_A()
         else:
             # Try random movement
-            import random
-            direction = random.choice(["Up", "Down", "Left", "Right"])
+            direction = _DIRS[_getrandbits(2)]
             self.input.tap(direction)
             self._stuck_counter = 0
 
@@ -22,6 +22,15 @@ from ..games.pokemon_gen3.memory_map import PokemonGen3Memory as Mem
 
 logger = logging.getLogger(__name__)
 
+# Story flags read together by _update_story_flags
+_STORY_FLAGS = (
+    Mem.FLAG_SYS_POKEMON_GET,
+    Mem.FLAG_SYS_POKEDEX_GET,
+    Mem.FLAG_SYS_POKENAV_GET,
+    Mem.FLAG_SYS_CLOCK_SET,
+    Mem.FLAG_DEFEATED_ELITE_FOUR,
+)
+
 
 @dataclass
 class BadgeProgress:
@@ -245,33 +254,38 @@ class CompletionTracker:
     def _update_badges(self):
         """Read badge flags from memory."""
         b = self.progress.badges
-        b.stone = self.detector.get_event_flag(Mem.BADGE_1_STONE)
-        b.knuckle = self.detector.get_event_flag(Mem.BADGE_2_KNUCKLE)
-        b.dynamo = self.detector.get_event_flag(Mem.BADGE_3_DYNAMO)
-        b.heat = self.detector.get_event_flag(Mem.BADGE_4_HEAT)
-        b.balance = self.detector.get_event_flag(Mem.BADGE_5_BALANCE)
-        b.feather = self.detector.get_event_flag(Mem.BADGE_6_FEATHER)
-        b.mind = self.detector.get_event_flag(Mem.BADGE_7_MIND)
-        b.rain = self.detector.get_event_flag(Mem.BADGE_8_RAIN)
+        # All eight badge flags share two bytes; one read covers them
+        mask = self.detector.get_badge_mask()
+        b.stone = bool(mask & 0x01)
+        b.knuckle = bool(mask & 0x02)
+        b.dynamo = bool(mask & 0x04)
+        b.heat = bool(mask & 0x08)
+        b.balance = bool(mask & 0x10)
+        b.feather = bool(mask & 0x20)
+        b.mind = bool(mask & 0x40)
+        b.rain = bool(mask & 0x80)
     
     def _update_story_flags(self):
         """Read story progression flags."""
         s = self.progress.story
-        s.has_starter = self.detector.get_event_flag(Mem.FLAG_SYS_POKEMON_GET)
-        s.has_pokedex = self.detector.get_event_flag(Mem.FLAG_SYS_POKEDEX_GET)
-        s.has_pokenav = self.detector.get_event_flag(Mem.FLAG_SYS_POKENAV_GET)
-        s.clock_set = self.detector.get_event_flag(Mem.FLAG_SYS_CLOCK_SET)
-        s.elite_four_cleared = self.detector.get_event_flag(Mem.FLAG_DEFEATED_ELITE_FOUR)
+        # System flags all sit within 0x860-0x895 (one read)
+        flags = self.detector.get_event_flags(_STORY_FLAGS)
+        s.has_starter = flags[Mem.FLAG_SYS_POKEMON_GET]
+        s.has_pokedex = flags[Mem.FLAG_SYS_POKEDEX_GET]
+        s.has_pokenav = flags[Mem.FLAG_SYS_POKENAV_GET]
+        s.clock_set = flags[Mem.FLAG_SYS_CLOCK_SET]
+        s.elite_four_cleared = flags[Mem.FLAG_DEFEATED_ELITE_FOUR]
         
-        # Legendaries
-        s.rayquaza_caught = self.detector.get_event_flag(Mem.FLAG_HIDE_RAYQUAZA)
-        s.groudon_caught = self.detector.get_event_flag(Mem.FLAG_HIDE_GROUDON)
-        s.kyogre_caught = self.detector.get_event_flag(Mem.FLAG_HIDE_KYOGRE)
-        s.regirock_caught = self.detector.get_event_flag(Mem.FLAG_CAUGHT_REGIROCK)
-        s.regice_caught = self.detector.get_event_flag(Mem.FLAG_CAUGHT_REGICE)
-        s.registeel_caught = self.detector.get_event_flag(Mem.FLAG_CAUGHT_REGISTEEL)
-        s.latias_caught = self.detector.get_event_flag(Mem.FLAG_CAUGHT_LATIAS)
-        s.latios_caught = self.detector.get_event_flag(Mem.FLAG_CAUGHT_LATIOS)
+        # Legendaries (one read, bits in LEGENDARY_FLAGS order)
+        mask = self.detector.get_legendary_mask()
+        s.kyogre_caught = bool(mask & 0x01)
+        s.groudon_caught = bool(mask & 0x02)
+        s.rayquaza_caught = bool(mask & 0x04)
+        s.latias_caught = bool(mask & 0x08)
+        s.latios_caught = bool(mask & 0x10)
+        s.regirock_caught = bool(mask & 0x20)
+        s.regice_caught = bool(mask & 0x40)
+        s.registeel_caught = bool(mask & 0x80)
     
     def _update_pokedex(self):
         """Count Pokedex seen/caught from flag arrays."""
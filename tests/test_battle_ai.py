@@ -104,6 +104,14 @@ class TestTypeEffectiveness:
         assert TypeEffectiveness.is_super_effective(PokemonType.FIRE, PokemonType.GRASS)
         assert not TypeEffectiveness.is_super_effective(PokemonType.FIRE, PokemonType.WATER)
 
+    def test_multipliers_against_matches_get_multiplier(self):
+        for type2 in (None, PokemonType.WATER, PokemonType.FLYING):
+            row = TypeEffectiveness.multipliers_against(PokemonType.FLYING, type2)
+            for attack in PokemonType:
+                assert row[attack] == TypeEffectiveness.get_multiplier(
+                    attack, PokemonType.FLYING, type2
+                )
+
 
 # =============================================================================
 # Battle AI Decision Tests
@@ -328,6 +336,37 @@ class TestDamageEstimation:
         assert min_dmg == 0
         assert max_dmg == 0
 
+    def test_batch_matches_scalar(self):
+        mock_client = MagicMock()
+        handler = PokemonGen3BattleHandler(mock_client)
+
+        attacker = make_pokemon(attack=100, sp_attack=90, level=50, type1=PokemonType.WATER)
+        defender = make_pokemon(defense=80, sp_defense=70, type1=PokemonType.FIRE,
+                                type2=PokemonType.ROCK)
+        moves = [
+            Move(id=57, power=95, type=PokemonType.WATER, accuracy=100),
+            Move(id=33, power=35, type=PokemonType.NORMAL, accuracy=95),
+            Move(id=45, power=0, type=PokemonType.NORMAL, accuracy=100),
+        ]
+        no_type = len(PokemonType)
+
+        mins, maxs = handler.estimate_damage_batch(
+            powers=[m.power for m in moves],
+            levels=[attacker.level] * 3,
+            attacks=[attacker.attack if m.is_physical else attacker.sp_attack for m in moves],
+            defenses=[defender.defense if m.is_physical else defender.sp_defense for m in moves],
+            move_types=[m.type for m in moves],
+            def_types1=[defender.type1] * 3,
+            def_types2=[defender.type2 if defender.type2 is not None else no_type] * 3,
+            stab_bits=[attacker._stab_bits] * 3,
+            burned=[False] * 3,
+            weather=Weather.RAIN,
+        )
+        expected = [
+            handler.estimate_damage(m, attacker, defender, Weather.RAIN) for m in moves
+        ]
+        assert list(zip(mins, maxs)) == expected
+
 
 # =============================================================================
 # Completion Tracker Tests (unit tests with mocks)
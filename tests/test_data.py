@@ -3,7 +3,10 @@
 import pytest
 from src.data.move_data import get_move_data, enrich_move, _MOVE_TABLE
 from src.data.species_data import get_species_name, get_species_types, get_species_base_stats
-from src.games.pokemon_gen3.data_types import Move, PokemonType
+from src.games.pokemon_gen3.data_types import (
+    Move, Pokemon, PokemonType, Nature, Ability, NATURE_STAT_BOOST, get_nature_modifier,
+    NATURE_BY_ID,
+)
 
 
 class TestMoveData:
@@ -43,6 +46,13 @@ class TestMoveData:
         assert move.pp == 3  # Preserved from memory
         assert move.max_pp == 15
 
+    def test_enrich_updates_derived_flags(self):
+        move = Move(id=89, pp=10)  # Earthquake, bare as read from memory
+        assert not move.is_damaging
+        enrich_move(move)
+        assert move.is_damaging
+        assert move.is_physical
+
     def test_contact_flag(self):
         tackle = get_move_data(33)
         assert tackle.is_contact
@@ -84,3 +94,45 @@ class TestSpeciesData:
         t1, t2 = get_species_types(384)  # Rayquaza
         assert t1 == PokemonType.DRAGON
         assert t2 == PokemonType.FLYING
+
+
+class TestPokemon:
+    def test_total_evs_follows_assignment(self):
+        mon = Pokemon(species_id=258, ev_attack=100, ev_speed=50)
+        assert mon.total_evs == 150
+        mon.ev_hp = 252
+        assert mon.total_evs == 402
+
+    def test_from_raw_matches_keyword_construction(self):
+        raw = Pokemon.from_raw(
+            257, 36, 99, 110, 0, 95, 60, 65, 88, 58,
+            Ability.BLAZE, Nature.ADAMANT, PokemonType.FIRE, PokemonType.FIGHTING,
+        )
+        assert raw == Pokemon(
+            species_id=257, level=36, hp=99, max_hp=110, status=0,
+            attack=95, defense=60, speed=65, sp_attack=88, sp_defense=58,
+            ability=Ability.BLAZE, nature=Nature.ADAMANT,
+            type1=PokemonType.FIRE, type2=PokemonType.FIGHTING,
+        )
+        assert raw._stab_bits == (1 << PokemonType.FIRE) | (1 << PokemonType.FIGHTING)
+
+
+class TestNatures:
+    def test_neutral_natures_are_multiples_of_six(self):
+        """nature % 6 == 0 is exactly the set of natures with no stat change."""
+        neutral = {n for n in Nature if n not in NATURE_STAT_BOOST}
+        assert neutral == {n for n in Nature if n % 6 == 0}
+        for nature in neutral:
+            assert all(get_nature_modifier(nature, i) == 1.0 for i in range(5))
+
+    def test_nature_by_id_is_value_ordered(self):
+        assert [n.value for n in NATURE_BY_ID] == list(range(25))
+        assert NATURE_BY_ID[0x12345678 % 25] is Nature(0x12345678 % 25)
+
+    def test_boost_and_reduce(self):
+        assert get_nature_modifier(Nature.ADAMANT, 0) == 1.1  # +Atk
+        assert get_nature_modifier(Nature.ADAMANT, 3) == 0.9  # -SpA
+        assert get_nature_modifier(Nature.ADAMANT, 2) == 1.0
+        assert get_nature_modifier(Nature.ADAMANT, 5) == 1.0  # HP / out of range
+        assert get_nature_modifier(25, 0) == 1.0  # raw values out of range
+        assert get_nature_modifier(-1, 2) == 1.0
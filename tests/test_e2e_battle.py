@@ -11,6 +11,9 @@ from src.games.pokemon_gen3.state_detector import PokemonGen3StateDetector, Poke
 from src.games.pokemon_gen3.battle_handler import PokemonGen3BattleHandler, BattleAction
 from src.ai.battle_ai import BattleAI, BattleContext, BattleStrategy
 from src.games.pokemon_gen3.data_types import PokemonType
+from src.games.pokemon_gen3.memory_map import (
+    PokemonGen3Memory as Mem, PokemonFireRedMemory, load_layout,
+)
 
 
 class TestE2EBattlePipeline:
@@ -154,3 +157,195 @@ class TestMockClientIntegrity:
         assert player.level == 36
         assert player.hp == 110
         assert len(player.moves) == 4
+
+    def test_decision_reused_until_next_read(self):
+        """decide_action is cached per battle state snapshot."""
+        client = MockBizHawkClient("swampert_vs_wailord_rain")
+        client.connect()
+        handler = PokemonGen3BattleHandler(client)
+        handler.read_battle_state()
+
+        first = handler.decide_action("aggressive")
+        assert handler.decide_action("aggressive") is first
+
+        # Drain Earthquake's PP; a fresh read must re-decide
+        client._battle_mon_data[0x24 + 1] = 0
+        handler.read_battle_state()
+        second = handler.decide_action("aggressive")
+        assert second is not first
+        assert second.move_index != 1
+
+    def test_detect_reads_frame_values_in_one_batch(self):
+        """detect() takes battle flags, callbacks and text printers from one read_multi."""
+        client = MockBizHawkClient()
+        client.connect()
+        batches = []
+        read_multi = client.read_multi
+        client.read_multi = lambda ranges: batches.append(ranges) or read_multi(ranges)
+        client._special[Mem.BATTLE_TYPE_FLAGS] = 0
+        client._special[Mem.TEXT_PRINTERS] = 2
+
+        assert PokemonGen3StateDetector(client).detect() == PokemonGen3State.DIALOGUE
+        assert len(batches) == 1
+
+    def test_read_party_uses_one_range_read(self):
+        """All party slots come from a single 600-byte read."""
+        client = MockBizHawkClient()
+        client.connect()
+        reads = []
+        read_range = client.read_range
+        client.read_range = lambda addr, length: reads.append(length) or read_range(addr, length)
+        client.read8 = lambda addr: 3  # party count
+
+        detector = PokemonGen3StateDetector(client)
+        detector.read_party()
+        assert reads == [Mem.PARTY_POKEMON_SIZE * 6]
+
+    def test_party_range_parses_like_read_party(self):
+        """One range covers the party count and slots for batched reads."""
+        client = MockBizHawkClient()
+        client.connect()
+        detector = PokemonGen3StateDetector(client)
+
+        address, length = detector.party_range()
+        party = detector.parse_party(client.read_range(address, length))
+        assert party.pokemon == detector.read_party().pokemon
+        assert length == 4 + Mem.PARTY_POKEMON_SIZE * 6
+        assert detector.parse_party(None).pokemon == []
+
+    def test_read_battle_state_uses_one_batch(self):
+        client = MockBizHawkClient("blaziken_vs_flygon")
+        client.connect()
+        batches = []
+        read_multi = client.read_multi
+        client.read_multi = lambda ranges: batches.append(ranges) or read_multi(ranges)
+
+        state = PokemonGen3BattleHandler(client).read_battle_state()
+        assert len(batches) == 1
+        assert state.player_lead.species_id == 257
+        assert state.enemy_lead.species_id == 330
+
+    def test_layout_sets_game_addresses(self):
+        """FireRed's layout moves the detector's and handler's battle reads."""
+        client = MockBizHawkClient()
+        client.connect()
+        batches = []
+        read_multi = client.read_multi
+        client.read_multi = lambda ranges: batches.append(ranges) or read_multi(ranges)
+        layout = load_layout("BPRE")
+
+        PokemonGen3StateDetector(client, layout=layout).detect()
+        PokemonGen3BattleHandler(client, layout).read_battle_state()
+        detect_batch, battle_batch = batches
+        assert (PokemonFireRedMemory.BATTLE_TYPE_FLAGS, 4) in detect_batch
+        assert battle_batch[1][0] == PokemonFireRedMemory.BATTLE_MONS
+
+        detector = PokemonGen3StateDetector(client)
+        detector.set_layout(layout)
+        assert detector.layout.SAVE_BLOCK_1_PTR == PokemonFireRedMemory.SAVE_BLOCK_1_PTR
+
+    def test_dialogue_and_options_reads_are_cached(self):
+        client = MockBizHawkClient()
+        client.connect()
+        reads = []
+        read8 = client.read8
+        client.read8 = lambda addr: reads.append(addr) or read8(addr)
+        detector = PokemonGen3StateDetector(client)
+
+        detector.is_dialogue_active()
+        detector.is_dialogue_active()
+        assert reads.count(Mem.TEXT_PRINTERS) == 1
+
+        detector.read_options()
+        options_reads = len(reads)
+        detector.read_options()["raw"] = 0xFF  # callers get a copy
+        assert len(reads) == options_reads
+        assert detector.read_options()["raw"] != 0xFF
+
+        detector.invalidate_options_cache()
+        detector.read_options()
+        assert len(reads) > options_reads
+
+    def test_event_flags_read_in_one_range(self):
+        client = MockBizHawkClient()
+        client.connect()
+        reads = []
+        # 0x860 lands on bit 0 of the first byte, 0x895 on bit 5 of the last
+        span = bytearray(7)
+        span[0] = 0x01
+        span[6] = 0x20
+        client.read_range = lambda addr, length: reads.append(length) or bytes(span)
+        detector = PokemonGen3StateDetector(client)
+
+        flags = detector.get_event_flags([
+            Mem.FLAG_SYS_POKEMON_GET, Mem.FLAG_SYS_POKEDEX_GET, Mem.FLAG_SYS_CLOCK_SET,
+        ])
+        assert reads == [7]
+        assert flags == {
+            Mem.FLAG_SYS_POKEMON_GET: True,
+            Mem.FLAG_SYS_POKEDEX_GET: False,
+            Mem.FLAG_SYS_CLOCK_SET: True,
+        }
+
+    def test_transition_reuses_pointers_read_this_tick(self):
+        """A state change right after a TTL refresh doesn't re-read the pointers."""
+        client = MockBizHawkClient()
+        client.connect()
+        reads = []
+        read32 = client.read32
+        client.read32 = lambda addr: reads.append(addr) or read32(addr)
+        detector = PokemonGen3StateDetector(client)
+
+        # First tick: cache empty and UNKNOWN -> BATTLE_WILD is a transition
+        assert detector.detect() == PokemonGen3State.BATTLE_WILD
+        assert reads.count(Mem.SAVE_BLOCK_1_PTR) == 1
+
+        # Later transition with the cache still fresh forces a re-read
+        client._special[Mem.BATTLE_TYPE_FLAGS] = 0
+        detector.detect()
+        assert reads.count(Mem.SAVE_BLOCK_1_PTR) == 2
+
+    def test_state_props_match_state_groups(self):
+        detector = PokemonGen3StateDetector(MockBizHawkClient())
+        for state in PokemonGen3State:
+            detector._last_state = state
+            detector._state_flags = detector._STATE_PROPS[state]
+            assert detector.in_battle == (state in detector._BATTLE_STATES)
+            assert detector.in_double_battle == (state in detector._DOUBLE_BATTLE_STATES)
+            assert detector.in_menu == (state in detector._MENU_STATES)
+            assert detector.is_wild_battle() == (state in detector._WILD_BATTLE_STATES)
+            assert detector.is_trainer_battle() == (state in detector._TRAINER_BATTLE_STATES)
+            assert detector.in_overworld == (state == PokemonGen3State.OVERWORLD)
+
+    def test_dialogue_check_reads_both_printers_in_one_batch(self):
+        client = MockBizHawkClient()
+        client.connect()
+        batches = []
+        read_multi = client.read_multi
+        client.read_multi = lambda ranges: batches.append(ranges) or read_multi(ranges)
+        client._special[Mem.TEXT_PRINTERS + 0x24] = 2
+
+        assert PokemonGen3StateDetector(client).is_dialogue_active()
+        assert batches == [[(Mem.TEXT_PRINTERS, 1), (Mem.TEXT_PRINTERS + 0x24, 1)]]
+
+    def test_position_reads_are_shared_within_a_tick(self):
+        client = MockBizHawkClient()
+        client.connect()
+        reads = []
+        read16 = client.read16
+        client.read16 = lambda addr: reads.append(addr) or read16(addr)
+        detector = PokemonGen3StateDetector(client)
+
+        # Without begin_tick every call reads memory
+        detector.get_player_position()
+        detector.get_player_position()
+        assert len(reads) == 4
+
+        reads.clear()
+        detector.begin_tick(1)
+        assert detector.get_player_position() == detector.get_player_position()
+        assert len(reads) == 2
+
+        detector.begin_tick(2)
+        detector.get_player_position()
+        assert len(reads) == 4
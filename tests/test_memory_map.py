@@ -0,0 +1,158 @@
+"""Tests for the Gen 3 memory map helpers."""
+
+import random
+import struct
+
+from src.emulator.mock_client import MockBizHawkClient
+
+from src.games.pokemon_gen3.memory_map import (
+    PokemonGen3Memory as Mem, BATTLE_MON_STRUCT, unpack_battle_mon,
+    options_byte_addr, HOENN_TOWNS, in_ewram,
+    BADGE_FLAGS_BYTE, badge_mask, count_badges, flag_bit, flag_set,
+    LEGENDARY_FLAGS, LEGENDARY_FLAGS_START, LEGENDARY_FLAGS_LENGTH, legendary_mask,
+    GameLayout, load_layout, PokemonEmeraldMemory, PokemonFireRedMemory,
+    PARTY_BLOB_SIZE, read_party_blob, PARTY_MON_STATS,
+    PARTY_MON_STRUCT,
+    is_shiny, get_gender_from_personality,
+)
+
+
+class TestPersonalityHelpers:
+    def test_is_shiny(self):
+        rng = random.Random(0)
+        trainer_id = rng.getrandbits(32)
+        # Personality halves XOR to the trainer value, then differ by < 8
+        tsv = (trainer_id ^ (trainer_id >> 16)) & 0xFFFF
+        assert all(is_shiny((tsv << 16) | low, trainer_id) for low in range(8))
+        assert not is_shiny((tsv << 16) | 8, trainer_id)
+
+    def test_gender_thresholds(self):
+        assert get_gender_from_personality(0x12345600, 0) == 0      # always male
+        assert get_gender_from_personality(0x123456FF, 254) == 1    # always female
+        assert get_gender_from_personality(0x12345600, 255) == 2    # genderless
+        assert get_gender_from_personality(0x1234561E, 31) == 1     # byte below threshold
+        assert get_gender_from_personality(0x1234561F, 31) == 0
+
+
+class TestBattleMonLayout:
+    def test_struct_matches_offsets(self):
+        """BATTLE_MON_STRUCT fields land on the documented BATTLE_MON_*_OFFSETs."""
+        buf = bytearray(Mem.BATTLE_MON_SIZE)
+        struct.pack_into("<H", buf, Mem.BATTLE_MON_SPECIES_OFFSET, 257)
+        struct.pack_into("<H", buf, Mem.BATTLE_MON_SPEED_OFFSET, 80)
+        struct.pack_into("<H", buf, Mem.BATTLE_MON_MOVES_OFFSET + 6, 53)
+        buf[Mem.BATTLE_MON_ABILITY_OFFSET] = 66
+        buf[Mem.BATTLE_MON_TYPE2_OFFSET] = 1
+        buf[Mem.BATTLE_MON_PP_OFFSET + 3] = 15
+        struct.pack_into("<H", buf, Mem.BATTLE_MON_HP_OFFSET, 110)
+        buf[Mem.BATTLE_MON_LEVEL_OFFSET] = 36
+        struct.pack_into("<H", buf, Mem.BATTLE_MON_MAX_HP_OFFSET, 120)
+        struct.pack_into("<I", buf, Mem.BATTLE_MON_STATUS_OFFSET, 0x40)
+
+        assert BATTLE_MON_STRUCT.size == Mem.BATTLE_MON_SIZE
+        mon = unpack_battle_mon(bytes(8) + bytes(buf), offset=8)
+        assert (mon.species, mon.speed, mon.move4, mon.ability, mon.type2) == (257, 80, 53, 66, 1)
+        assert (mon.pp4, mon.hp, mon.level, mon.max_hp, mon.status) == (15, 110, 36, 120, 0x40)
+
+
+class TestPartyBlob:
+    def test_stats_struct_matches_offsets(self):
+        slot = bytearray(Mem.PARTY_POKEMON_SIZE)
+        struct.pack_into("<I", slot, Mem.PKM_STATUS_OFFSET, 0x40)
+        slot[Mem.PKM_LEVEL_OFFSET] = 36
+        struct.pack_into("<H", slot, Mem.PKM_CURRENT_HP_OFFSET, 99)
+        struct.pack_into("<H", slot, Mem.PKM_MAX_HP_OFFSET, 110)
+        struct.pack_into("<H", slot, Mem.PKM_SPEED_OFFSET, 65)
+        struct.pack_into("<H", slot, Mem.PKM_SP_DEFENSE_OFFSET, 58)
+        status, level, hp, max_hp, _atk, _def, speed, _spa, spd = (
+            PARTY_MON_STATS.unpack_from(slot, Mem.PKM_STATUS_OFFSET)
+        )
+        assert (status, level, hp, max_hp, speed, spd) == (0x40, 36, 99, 110, 65, 58)
+
+    def test_slot_struct_covers_whole_slot(self):
+        assert PARTY_MON_STRUCT.size == Mem.PARTY_POKEMON_SIZE
+        slot = bytearray(Mem.PARTY_POKEMON_SIZE)
+        struct.pack_into("<II", slot, 0, 0xDEADBEEF, 12345)
+        slot[Mem.PKM_LEVEL_OFFSET] = 36
+        struct.pack_into("<H", slot, Mem.PKM_SP_DEFENSE_OFFSET, 58)
+        fields = PARTY_MON_STRUCT.unpack(slot)
+        assert fields[:2] == (0xDEADBEEF, 12345)
+        assert fields[2:] == PARTY_MON_STATS.unpack_from(slot, Mem.PKM_STATUS_OFFSET)
+        assert (fields[3], fields[-1]) == (36, 58)
+
+    def test_blob_covers_all_slots(self):
+        client = MockBizHawkClient()
+        blob = read_party_blob(client, client._sb1_ptr)
+        assert len(blob) == PARTY_BLOB_SIZE
+
+
+class TestSaveBlockHelpers:
+    def test_in_ewram_bounds(self):
+        assert in_ewram(0x02000000) and in_ewram(0x0203FFFF)
+        assert not in_ewram(0x01FFFFFF)
+        assert not in_ewram(0x02040000)
+        assert not in_ewram(0)
+
+    def test_options_byte_follows_save_block_2(self):
+        client = MockBizHawkClient()
+        assert options_byte_addr(client._sb2_ptr) == client._sb2_ptr + Mem.OPTIONS_OFFSET
+
+
+class TestMapConstants:
+    def test_hoenn_towns_match_map_data(self):
+        assert Mem.MAP_LITTLEROOT_TOWN == (0, 9)
+        assert Mem.MAP_LITTLEROOT_TOWN in HOENN_TOWNS
+        assert Mem.MAP_EVER_GRANDE_CITY in HOENN_TOWNS
+        assert len(HOENN_TOWNS) == 16
+        # Indoor maps and routes are not towns
+        assert Mem.MAP_PLAYER_HOUSE_1F not in HOENN_TOWNS
+        assert (1, 3) not in HOENN_TOWNS
+        assert Mem.MAP_ROUTE_101 not in HOENN_TOWNS
+
+
+class TestBadgeFlags:
+    def _flags_with(self, *flag_ids: int) -> bytearray:
+        flags = bytearray(0x120)
+        for flag_id in flag_ids:
+            flags[flag_id >> 3] |= 1 << (flag_id & 7)
+        return flags
+
+    def test_mask_matches_individual_flags(self):
+        flags = self._flags_with(Mem.BADGE_1_STONE, Mem.BADGE_4_HEAT, Mem.BADGE_8_RAIN)
+        assert badge_mask(flags) == 0b10001001
+        assert count_badges(flags) == 3
+        # Same result from just the two badge bytes
+        assert badge_mask(flags[BADGE_FLAGS_BYTE:BADGE_FLAGS_BYTE + 2], 0) == 0b10001001
+
+    def test_neighbouring_flags_ignored(self):
+        flags = self._flags_with(Mem.BADGE_FLAG_BASE - 1, Mem.BADGE_8_RAIN + 1)
+        assert badge_mask(flags) == 0
+
+    def test_flag_bit_matches_shift_formula(self):
+        for flag_id in (Mem.FLAG_SYS_CLOCK_SET, Mem.FLAG_CAUGHT_LATIAS, 0x123):
+            assert flag_bit(flag_id) == (flag_id >> 3, 1 << (flag_id & 7))
+        flags = self._flags_with(Mem.FLAG_SYS_CLOCK_SET)
+        assert flag_set(flags, Mem.FLAG_SYS_CLOCK_SET)
+        assert not flag_set(flags, Mem.FLAG_SYS_CLOCK_SET + 1)
+
+    def test_legendary_mask_matches_individual_flags(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            chosen = [f for f in LEGENDARY_FLAGS if rng.random() < 0.5]
+            flags = self._flags_with(*chosen)
+            expected = sum(1 << i for i, f in enumerate(LEGENDARY_FLAGS) if f in chosen)
+            assert legendary_mask(flags) == expected
+            window = flags[LEGENDARY_FLAGS_START:LEGENDARY_FLAGS_START + LEGENDARY_FLAGS_LENGTH]
+            assert legendary_mask(window, -LEGENDARY_FLAGS_START) == expected
+
+
+class TestGameLayout:
+    def test_layout_matches_memory_class(self):
+        for code, memory_class in (("BPEE", PokemonEmeraldMemory), ("BPRE", PokemonFireRedMemory)):
+            layout = load_layout(code)
+            for name in GameLayout._fields:
+                assert getattr(layout, name) == getattr(memory_class, name)
+        assert load_layout("BPRE").BATTLE_MONS != load_layout("BPEE").BATTLE_MONS
+
+    def test_unknown_code_falls_back_to_emerald(self):
+        assert load_layout("????") == load_layout("BPEE")
@@ -0,0 +1,98 @@
+"""
+Tests for mGBAClient memory reads.
+
+Runs the client against a fake Lua bridge that enforces the bridge's
+256-byte range limit and counts round trips.
+"""
+
+from src.emulator.mgba_client import mGBAClient
+from src.emulator.mock_client import MockBizHawkClient
+from src.games.pokemon_gen3.battle_handler import PokemonGen3BattleHandler
+from src.main import EmeraldAI
+
+
+class FakeBridge:
+    """Answers mGBAClient requests the way emerald_brain.lua does."""
+
+    LIMIT = 256
+
+    def __init__(self, readmulti: bool = True):
+        self.memory = MockBizHawkClient()
+        self.readmulti = readmulti
+        self.requests: list[str] = []
+
+    def _read(self, addr: int, length: int) -> str:
+        return self.memory.read_multi([(addr, length)])[0].hex()
+
+    def __call__(self, cmd: dict) -> dict:
+        action = cmd["action"]
+        self.requests.append(action)
+        if action in ("read8", "read16", "read32"):
+            return {"ok": True, "value": getattr(self.memory, action)(cmd["addr"])}
+        if action == "readrange":
+            if cmd["length"] > self.LIMIT:
+                return {"error": "length exceeds 256 byte limit"}
+            return {"ok": True, "data": self._read(cmd["addr"], cmd["length"])}
+        if action == "readmulti" and self.readmulti:
+            if any(length > self.LIMIT for _addr, length in cmd["ranges"]):
+                return {"error": "length exceeds 256 byte limit"}
+            return {"ok": True, "data": [self._read(a, n) for a, n in cmd["ranges"]]}
+        return {"error": f"unknown action: {action}"}
+
+
+def make_client(bridge: FakeBridge) -> mGBAClient:
+    client = mGBAClient()
+    client._send = bridge
+    return client
+
+
+class TestReadMulti:
+
+    def test_oversized_ranges_split_within_one_request(self):
+        bridge = FakeBridge()
+        client = make_client(bridge)
+        ranges = [(0x02024084, 352), (0x02025A00, 604), (0x02025A00, 4)]
+
+        data = client.read_multi(ranges)
+        assert bridge.requests == ["readmulti"]
+        assert data == bridge.memory.read_multi(ranges)
+
+    def test_read_range_over_limit_is_one_request(self):
+        bridge = FakeBridge()
+        client = make_client(bridge)
+
+        data = client.read_range(0x02024084, 352)
+        assert bridge.requests == ["readmulti"]
+        assert data == bridge.memory.read_range(0x02024084, 352)
+
+    def test_missing_readmulti_is_only_tried_once(self):
+        bridge = FakeBridge(readmulti=False)
+        client = make_client(bridge)
+        ranges = [(0x02024084, 300), (0x02025A00, 4)]
+
+        assert client.read_multi(ranges) == bridge.memory.read_multi(ranges)
+        assert bridge.requests == ["readmulti"] + ["readrange"] * 3
+
+        bridge.requests.clear()
+        assert client.read_multi(ranges) == bridge.memory.read_multi(ranges)
+        assert bridge.requests == ["readrange"] * 3
+
+
+class TestBattleStartRoundTrips:
+
+    def test_read_battle_state_is_one_request(self):
+        bridge = FakeBridge()
+        state = PokemonGen3BattleHandler(make_client(bridge)).read_battle_state()
+        assert bridge.requests == ["readmulti"]
+        assert state.player_lead.species_id == 258
+
+    def test_battle_start_is_one_request(self):
+        bridge = FakeBridge()
+        ai = EmeraldAI()
+        ai.client._send = bridge
+        ai.state_detector.refresh_pointers()
+        bridge.requests.clear()
+
+        ai._on_battle_start()
+        assert bridge.requests == ["readmulti"]
+        assert ai._battle_context.state.enemy_lead.species_id == 261